@@ -9,25 +9,46 @@ const API_BASE = "http://localhost:5000/api/admin-panel";
 export default function AdminPanel() {
   const [users, setUsers] = useState([]);
   const [sentences, setSentences] = useState([]);
+  const [usersCursor, setUsersCursor] = useState(null);
+  const [sentencesCursor, setSentencesCursor] = useState(null);
   const [loading, setLoading] = useState(true);
 
   const token = localStorage.getItem("adminToken");
   const navigate = useNavigate();
 
+  // Endpoints are cursor-paginated: pass back pagination.nextCursor for more
+  const fetchPage = async (path, cursor) => {
+    const res = await axios.get(`${API_BASE}/${path}`, {
+      headers: { Authorization: `Bearer ${token}` },
+      params: cursor ? { cursor } : {},
+    });
+    return res.data;
+  };
+
+  const loadMoreUsers = async () => {
+    const data = await fetchPage("users", usersCursor);
+    setUsers((prev) => [...prev, ...data.users]);
+    setUsersCursor(data.pagination.nextCursor);
+  };
+
+  const loadMoreSentences = async () => {
+    const data = await fetchPage("user-sentences", sentencesCursor);
+    setSentences((prev) => [...prev, ...data.sentences]);
+    setSentencesCursor(data.pagination.nextCursor);
+  };
+
   useEffect(() => {
     const fetchData = async () => {
       try {
         // Users
-        const usersRes = await axios.get(`${API_BASE}/users`, {
-          headers: { Authorization: `Bearer ${token}` },
-        });
-        setUsers(usersRes.data);
+        const usersData = await fetchPage("users");
+        setUsers(usersData.users);
+        setUsersCursor(usersData.pagination.nextCursor);
 
         // Sentences
-        const sentencesRes = await axios.get(`${API_BASE}/user-sentences`, {
-          headers: { Authorization: `Bearer ${token}` },
-        });
-        setSentences(sentencesRes.data);
+        const sentencesData = await fetchPage("user-sentences");
+        setSentences(sentencesData.sentences);
+        setSentencesCursor(sentencesData.pagination.nextCursor);
       } catch (err) {
         console.error("Fetch error:", err.response || err);
       } finally {
@@ -68,6 +89,7 @@ export default function AdminPanel() {
               <tr className="bg-gray-800">
                 <th className="border border-gray-700 px-4 py-2">Email</th>
                 <th className="border border-gray-700 px-4 py-2">Username</th>
+                <th className="border border-gray-700 px-4 py-2">Sentences</th>
                 <th className="border border-gray-700 px-4 py-2">Registered At</th>
               </tr>
             </thead>
@@ -76,12 +98,18 @@ export default function AdminPanel() {
                 <tr key={u._id} className="text-center">
                   <td className="border border-gray-700 px-4 py-2">{u.email}</td>
                   <td className="border border-gray-700 px-4 py-2">{u.username}</td>
+                  <td className="border border-gray-700 px-4 py-2">{u.stats?.sentences ?? 0}</td>
                   <td className="border border-gray-700 px-4 py-2">{new Date(u.createdAt).toLocaleString()}</td>
                 </tr>
               ))}
             </tbody>
           </table>
         </div>
+        {usersCursor && (
+          <button onClick={loadMoreUsers} className="mt-4 bg-gray-700 hover:bg-gray-600 px-4 py-2 rounded">
+            Load more users
+          </button>
+        )}
       </section>
 
       {/* Sentences Table */}
@@ -99,7 +127,7 @@ export default function AdminPanel() {
             <tbody>
               {sentences.map(s => (
                 <tr key={s._id} className="text-center">
-                  <td className="border border-gray-700 px-4 py-2">{s.user.email || s.user.username}</td>
+                  <td className="border border-gray-700 px-4 py-2">{s.user?.email || s.user?.username || "anonymous"}</td>
                   <td className="border border-gray-700 px-4 py-2">{s.text}</td>
                   <td className="border border-gray-700 px-4 py-2">{new Date(s.createdAt).toLocaleString()}</td>
                 </tr>
@@ -107,6 +135,11 @@ export default function AdminPanel() {
             </tbody>
           </table>
         </div>
+        {sentencesCursor && (
+          <button onClick={loadMoreSentences} className="mt-4 bg-gray-700 hover:bg-gray-600 px-4 py-2 rounded">
+            Load more sentences
+          </button>
+        )}
       </section>
     </div>
   );
@@ -10,6 +10,8 @@ export default function Dashboard({ setIsAuthenticated }) {
   const [message, setMessage] = useState("")
   const [loadingStep, setLoadingStep] = useState(0)
   const [sentences, setSentences] = useState([])
+  const [nextCursor, setNextCursor] = useState(null)
+  const [loadingMore, setLoadingMore] = useState(false)
   const [stats, setStats] = useState(null)
   const [showHistory, setShowHistory] = useState(false)
   const [historyLoading, setHistoryLoading] = useState(false)
@@ -217,19 +219,13 @@ export default function Dashboard({ setIsAuthenticated }) {
   }, [])
 
   useEffect(() => {
-    if (stats && stats.totalSentences) {
-      const today = new Date().toISOString().split("T")[0]
-      const todaySentences = sentences.filter((s) => {
-        const sentenceDate = new Date(s.createdAt || Date.now()).toISOString().split("T")[0]
-        return sentenceDate === today
-      }).length
-
+    if (stats) {
       setTodayGoal((prev) => ({
         ...prev,
-        completed: todaySentences,
+        completed: stats.todaySentences,
       }))
     }
-  }, [stats, sentences])
+  }, [stats])
 
   const handleOpenWebcam = async () => {
     try {
@@ -255,17 +251,27 @@ export default function Dashboard({ setIsAuthenticated }) {
       const token = localStorage.getItem("token")
       const headers = token ? { Authorization: `Bearer ${token}` } : {}
 
-      const res = await axios.get("http://localhost:5000/api/sentences/stats", { headers })
+      // Start of the local day, so "today" matches the user's clock
+      const since = new Date()
+      since.setHours(0, 0, 0, 0)
+      const res = await axios.get("http://localhost:5000/api/sentences/stats", {
+        headers,
+        params: { since: since.toISOString() },
+      })
       console.log("Stats fetched from /stats:", res.data.stats)
 
-      const allStats = res.data.stats || []
-      setSentences(allStats)
-
-      const totalSentences = allStats.length
-      const totalWords = allStats.reduce((sum, s) => sum + (s.wordCount || 0), 0)
-      const avgWordsPerSentence = totalSentences ? totalWords / totalSentences : 0
-
-      setStats({ totalSentences, totalWords, avgWordsPerSentence })
+      const recent = res.data.stats || []
+      setSentences(recent)
+      setNextCursor(res.data.pagination?.nextCursor || null)
+
+      const {
+        totalSentences = 0,
+        totalWords = 0,
+        totalSessions = 0,
+        todaySentences = 0,
+        avgWordsPerSentence = 0,
+      } = res.data.summary || {}
+      setStats({ totalSentences, totalWords, totalSessions, todaySentences, avgWordsPerSentence })
     } catch (err) {
       console.error("Error fetching stats:", err)
       setMessage("❌ Failed to load stats")
@@ -274,6 +280,27 @@ export default function Dashboard({ setIsAuthenticated }) {
     }
   }
 
+  const loadMoreSentences = async () => {
+    if (!nextCursor) return
+    try {
+      setLoadingMore(true)
+      const token = localStorage.getItem("token")
+      const headers = token ? { Authorization: `Bearer ${token}` } : {}
+
+      const res = await axios.get("http://localhost:5000/api/sentences", {
+        headers,
+        params: { cursor: nextCursor, limit: 50 },
+      })
+      setSentences((prev) => [...prev, ...(res.data.sentences || [])])
+      setNextCursor(res.data.pagination?.nextCursor || null)
+    } catch (err) {
+      console.error("Error loading more sentences:", err)
+      setMessage("❌ Failed to load more sentences")
+    } finally {
+      setLoadingMore(false)
+    }
+  }
+
   const deleteSentence = async (sentenceId) => {
     try {
       const token = localStorage.getItem("token")
@@ -287,7 +314,21 @@ export default function Dashboard({ setIsAuthenticated }) {
         headers: { Authorization: `Bearer ${token}` },
       })
 
+      const removed = sentences.find((s) => s._id === sentenceId)
       setSentences(sentences.filter((s) => s._id !== sentenceId))
+      if (removed && stats) {
+        const startOfDay = new Date()
+        startOfDay.setHours(0, 0, 0, 0)
+        const totalSentences = stats.totalSentences - 1
+        const totalWords = stats.totalWords - (removed.wordCount || 0)
+        setStats({
+          ...stats,
+          totalSentences,
+          totalWords,
+          todaySentences: stats.todaySentences - (new Date(removed.createdAt) >= startOfDay ? 1 : 0),
+          avgWordsPerSentence: totalSentences ? totalWords / totalSentences : 0,
+        })
+      }
       setMessage("✅ Sentence deleted successfully")
     } catch (err) {
       console.error("Error deleting sentence:", err)
@@ -574,7 +615,7 @@ export default function Dashboard({ setIsAuthenticated }) {
                 {
                   icon: "🎯",
                   title: "Sessions",
-                  value: new Set(sentences.map((s) => s.sessionId)).size,
+                  value: stats.totalSessions,
                   color: "text-orange-400",
                   bg: "from-orange-500/20 to-orange-600/20",
                 },
@@ -618,6 +659,15 @@ export default function Dashboard({ setIsAuthenticated }) {
                   </button>
                 </div>
               ))}
+              {nextCursor && (
+                <button
+                  onClick={loadMoreSentences}
+                  disabled={loadingMore}
+                  className="w-full py-3 rounded-2xl bg-gray-800/50 text-gray-300 hover:bg-gray-800/70 transition-all duration-300 border border-gray-700/30 disabled:opacity-50"
+                >
+                  {loadingMore ? "Loading..." : "Load more"}
+                </button>
+              )}
             </div>
           ) : (
             <div className="text-center py-16">
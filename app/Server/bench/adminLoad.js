@@ -0,0 +1,113 @@
+// bench/adminLoad.js
+// Local load test of the admin-panel endpoints against an in-memory MongoDB
+// (mongodb-memory-server). Seeds users and sentences, then compares the old
+// unbounded find().populate() scans with the paginated endpoints and the
+// precomputed aggregates.
+//
+//   npm run bench:admin -- --users 2000 --sentences 200000
+import express from "express";
+import mongoose from "mongoose";
+import jwt from "jsonwebtoken";
+import { MongoMemoryServer } from "mongodb-memory-server";
+
+const arg = (name, fallback) => {
+  const i = process.argv.indexOf(`--${name}`);
+  return i > -1 ? Number(process.argv[i + 1]) : fallback;
+};
+const N_USERS = arg("users", 1000);
+const N_SENTENCES = arg("sentences", 100000);
+const REPEAT = arg("repeat", 20);
+
+process.env.JWT_SECRET = process.env.JWT_SECRET || "bench-secret";
+
+const mongod = await MongoMemoryServer.create();
+await mongoose.connect(mongod.getUri(), { monitorCommands: true });
+
+// Imported after JWT_SECRET is set
+const { default: User } = await import("../model/usermodel.js");
+const { default: Sentence, countWords } = await import("../model/sentence.js");
+const { default: Admin } = await import("../model/Admin.js");
+const { UserStats, DailyStats } = await import("../model/sentenceStats.js");
+const { rollupStats } = await import("../jobs/rollupStats.js");
+const { default: adminPanelRoutes } = await import("../route/adminPanel.js");
+await Promise.all([User, Sentence, UserStats, DailyStats].map((m) => m.init()));
+
+// ---------------- Seed ----------------
+console.log(`Seeding ${N_USERS} users / ${N_SENTENCES} sentences …`);
+const users = await User.insertMany(
+  Array.from({ length: N_USERS }, (_, i) => ({
+    username: `user${i}`,
+    email: `user${i}@example.com`,
+    password: "x".repeat(60), // insertMany skips the hashing hook
+  })),
+);
+const words = ["hello", "my", "name", "is", "thank", "you", "please", "help", "good", "morning"];
+const SOURCES = ["gui", "web", "api"];
+for (let done = 0; done < N_SENTENCES; done += 10000) {
+  const batch = Array.from({ length: Math.min(10000, N_SENTENCES - done) }, (_, i) => {
+    const text = Array.from({ length: 1 + ((done + i) % 7) }, (_, j) => words[(i + j) % words.length]).join(" ");
+    return {
+      user: users[(done + i) % N_USERS]._id,
+      text,
+      wordCount: countWords(text),
+      source: SOURCES[(done + i) % 3],
+      createdAt: new Date(Date.now() - (done + i) * 60000),
+    };
+  });
+  await Sentence.collection.insertMany(batch);
+}
+const rollup = await rollupStats();
+console.log(`Rollup of ${N_SENTENCES} sentences: ${rollup.ms} ms`);
+
+// ---------------- Server ----------------
+const admin = await Admin.create({ email: "bench@example.com", password: "Bench1$x" });
+const token = jwt.sign({ id: admin._id, role: "admin" }, process.env.JWT_SECRET || "secret");
+
+const app = express();
+app.use("/api/admin-panel", adminPanelRoutes);
+// The pre-pagination endpoints, for comparison
+app.get("/legacy/users", async (req, res) => res.json(await User.find().select("-password")));
+app.get("/legacy/user-sentences", async (req, res) =>
+  res.json(await Sentence.find().populate("user", "email username")),
+);
+const server = app.listen(0);
+const base = `http://127.0.0.1:${server.address().port}`;
+
+// Count Mongo commands per request
+let queries = 0;
+mongoose.connection.getClient().on("commandStarted", () => queries++);
+
+const measure = async (path, repeat) => {
+  const times = [];
+  let bytes = 0;
+  queries = 0;
+  for (let i = 0; i < repeat; i++) {
+    const t0 = performance.now();
+    const res = await fetch(base + path, { headers: { Authorization: `Bearer ${token}` } });
+    bytes = (await res.arrayBuffer()).byteLength;
+    times.push(performance.now() - t0);
+  }
+  times.sort((a, b) => a - b);
+  return {
+    endpoint: path,
+    mean_ms: (times.reduce((a, b) => a + b, 0) / times.length).toFixed(1),
+    p95_ms: times[Math.floor(times.length * 0.95)].toFixed(1),
+    kb: (bytes / 1024).toFixed(0),
+    queries_per_req: (queries / repeat).toFixed(1),
+  };
+};
+
+const rows = [
+  await measure("/legacy/users", Math.min(REPEAT, 5)),
+  await measure("/legacy/user-sentences", Math.min(REPEAT, 3)),
+  await measure("/api/admin-panel/users", REPEAT),
+  await measure("/api/admin-panel/user-sentences", REPEAT),
+  await measure(`/api/admin-panel/user-sentences?user=${users[0]._id}`, REPEAT),
+  await measure("/api/admin-panel/stats/daily", REPEAT),
+  await measure("/api/admin-panel/stats/summary", REPEAT),
+];
+console.table(rows);
+
+server.close();
+await mongoose.disconnect();
+await mongod.stop();
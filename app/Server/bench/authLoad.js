@@ -0,0 +1,94 @@
+// bench/authLoad.js
+// Per-request auth latency and Mongo query count for verifyToken, with the
+// user cache disabled and enabled, against an in-memory MongoDB.
+//
+//   npm run bench:auth -- --requests 5000 --users 50 --concurrency 20
+import express from "express";
+import mongoose from "mongoose";
+import jwt from "jsonwebtoken";
+import { MongoMemoryServer } from "mongodb-memory-server";
+
+const arg = (name, fallback) => {
+  const i = process.argv.indexOf(`--${name}`);
+  return i > -1 ? Number(process.argv[i + 1]) : fallback;
+};
+const N_REQUESTS = arg("requests", 5000);
+const N_USERS = arg("users", 50);
+const CONCURRENCY = arg("concurrency", 20);
+
+process.env.JWT_SECRET = process.env.JWT_SECRET || "bench-secret";
+
+const mongod = await MongoMemoryServer.create();
+await mongoose.connect(mongod.getUri(), { monitorCommands: true });
+
+const { default: User } = await import("../model/usermodel.js");
+const { verifyToken } = await import("../middleware/authmiddleware.js");
+const { userCache } = await import("../utils/userCache.js");
+
+const users = await User.insertMany(
+  Array.from({ length: N_USERS }, (_, i) => ({
+    username: `user${i}`,
+    email: `user${i}@example.com`,
+    password: "x".repeat(60),
+  })),
+);
+const tokens = users.map((u) => jwt.sign({ id: u._id }, process.env.JWT_SECRET, { expiresIn: "1d" }));
+
+const app = express();
+app.get("/whoami", verifyToken, (req, res) => res.json({ id: req.user._id }));
+const server = app.listen(0);
+const base = `http://127.0.0.1:${server.address().port}`;
+
+let finds = 0;
+mongoose.connection.getClient().on("commandStarted", (e) => {
+  if (e.commandName === "find") finds++;
+});
+
+const run = async (label) => {
+  userCache.clear();
+  userCache.hits = userCache.misses = 0;
+  finds = 0;
+  const times = [];
+  let next = 0;
+  const worker = async () => {
+    while (next < N_REQUESTS) {
+      const token = tokens[next++ % tokens.length];
+      const t0 = performance.now();
+      const res = await fetch(`${base}/whoami`, { headers: { Authorization: `Bearer ${token}` } });
+      await res.arrayBuffer();
+      times.push(performance.now() - t0);
+    }
+  };
+  const t0 = performance.now();
+  await Promise.all(Array.from({ length: CONCURRENCY }, worker));
+  const elapsed = performance.now() - t0;
+  times.sort((a, b) => a - b);
+  return {
+    mode: label,
+    req_per_s: Math.round((N_REQUESTS / elapsed) * 1000),
+    mean_ms: (times.reduce((a, b) => a + b, 0) / times.length).toFixed(2),
+    p95_ms: times[Math.floor(times.length * 0.95)].toFixed(2),
+    mongo_finds: finds,
+    finds_per_req: (finds / N_REQUESTS).toFixed(3),
+  };
+};
+
+const ttl = userCache.ttlMs;
+const max = userCache.max;
+userCache.max = 0; // disabled
+const rows = [await run("no cache")];
+userCache.max = max;
+userCache.ttlMs = ttl;
+rows.push(await run("cache"));
+
+// Invalidation: an update must be visible on the very next request
+await User.updateOne({ _id: users[0]._id }, { username: "renamed" });
+console.log(`Entries after updating user0: ${userCache.size} (user0 evicted: ${
+  ![...userCache.map.values()].some((e) => e.value.userId === String(users[0]._id))
+})`);
+
+console.table(rows);
+
+server.close();
+await mongoose.disconnect();
+await mongod.stop();
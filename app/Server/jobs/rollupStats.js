@@ -0,0 +1,84 @@
+// jobs/rollupStats.js
+// Rebuilds the admin-panel aggregates (UserStats, DailyStats) from the
+// sentences collection, correcting any drift in the incremental counters.
+//
+//   node jobs/rollupStats.js            # one-off
+//   STATS_ROLLUP_INTERVAL_MS=3600000    # periodic, started by main.js
+import mongoose from "mongoose"
+import dotenv from "dotenv"
+import { pathToFileURL } from "url"
+import Sentence from "../model/sentence.js"
+import { UserStats, DailyStats } from "../model/sentenceStats.js"
+
+const countsBySource = {
+  sentences: { $sum: 1 },
+  words: { $sum: "$wordCount" },
+  gui: { $sum: { $cond: [{ $eq: ["$source", "gui"] }, 1, 0] } },
+  web: { $sum: { $cond: [{ $eq: ["$source", "web"] }, 1, 0] } },
+  api: { $sum: { $cond: [{ $eq: ["$source", "api"] }, 1, 0] } },
+}
+
+const shape = (key, now) => ({
+  $project: {
+    _id: 0,
+    [key]: "$_id",
+    sentences: 1,
+    words: 1,
+    sources: { gui: "$gui", web: "$web", api: "$api" },
+    ...(key === "user" ? { lastAt: 1 } : {}),
+    rolledUpAt: now,
+  },
+})
+
+export const rollupStats = async () => {
+  const now = new Date()
+  const started = Date.now()
+
+  await Sentence.aggregate([
+    { $match: { user: { $ne: null } } },
+    { $group: { _id: "$user", ...countsBySource, lastAt: { $max: "$createdAt" } } },
+    shape("user", now),
+    { $merge: { into: UserStats.collection.name, on: "user", whenMatched: "replace", whenNotMatched: "insert" } },
+  ])
+  await Sentence.aggregate([
+    { $group: { _id: { $dateToString: { format: "%Y-%m-%d", date: "$createdAt" } }, ...countsBySource } },
+    shape("day", now),
+    { $merge: { into: DailyStats.collection.name, on: "day", whenMatched: "replace", whenNotMatched: "insert" } },
+  ])
+
+  // Rows from an earlier rollup that this one did not rewrite no longer
+  // have sentences (rows created incrementally since have no rolledUpAt)
+  await Promise.all([
+    UserStats.deleteMany({ rolledUpAt: { $lt: now } }),
+    DailyStats.deleteMany({ rolledUpAt: { $lt: now } }),
+  ])
+
+  return { ms: Date.now() - started }
+}
+
+export const startRollupJob = (intervalMs) => {
+  if (!intervalMs) return null
+  const run = () =>
+    rollupStats()
+      .then(({ ms }) => console.log(`📊 Stats rollup finished in ${ms} ms`))
+      .catch((err) => console.error("Stats rollup failed:", err))
+  run()
+  const timer = setInterval(run, intervalMs)
+  timer.unref()
+  return timer
+}
+
+if (import.meta.url === pathToFileURL(process.argv[1]).href) {
+  dotenv.config()
+  mongoose
+    .connect(process.env.MONGO_URI || "mongodb://localhost:27017/sign2voice")
+    .then(async () => {
+      const { ms } = await Promise.all([UserStats.init(), DailyStats.init()]).then(rollupStats)
+      console.log(`✅ Stats rolled up in ${ms} ms`)
+      process.exit(0)
+    })
+    .catch((err) => {
+      console.error(err)
+      process.exit(1)
+    })
+}
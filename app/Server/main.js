@@ -6,6 +6,8 @@ import authRoutes from "./route/authroute.js";
 import sentenceRoutes from "./route/sentenceRoute.js";
 import adminAuthRoutes from "./route/adminAuth.js";
 import adminPanelRoutes from "./route/adminPanel.js";
+import { startRollupJob } from "./jobs/rollupStats.js";
+import { recognizerHealth, fetchRecognizerMetrics } from "./utils/recognizerMetrics.js";
 import { spawn } from "child_process";
 import path from "path";
 
@@ -30,15 +32,35 @@ app.use("/api/sentences", sentenceRoutes);
 app.use("/api/admin", adminAuthRoutes);       // Admin login/register
 app.use("/api/admin-panel", adminPanelRoutes); // Admin panel actions
 
-// Health check
-app.get("/api/health", (req, res) => {
+// Health check, with the recognition process's metrics when it is running
+app.get("/api/health", async (req, res) => {
+  const recognizer = await recognizerHealth();
   res.json({
-    status: "OK",
+    status: recognizer.problems?.length ? "DEGRADED" : "OK",
     timestamp: new Date().toISOString(),
     uptime: process.uptime(),
+    rssBytes: process.memoryUsage().rss,
+    recognizer,
   });
 });
 
+// Prometheus scrape target: the recogniser's metrics plus this server's own
+app.get("/api/metrics", async (req, res) => {
+  const recognizer = await fetchRecognizerMetrics();
+  const own = [
+    "# HELP sign2voice_server_uptime_seconds Node server uptime",
+    "# TYPE sign2voice_server_uptime_seconds gauge",
+    `sign2voice_server_uptime_seconds ${process.uptime()}`,
+    "# HELP sign2voice_server_resident_memory_bytes Node server resident memory",
+    "# TYPE sign2voice_server_resident_memory_bytes gauge",
+    `sign2voice_server_resident_memory_bytes ${process.memoryUsage().rss}`,
+    "# HELP sign2voice_recognizer_up Whether the recognition process answered the scrape",
+    "# TYPE sign2voice_recognizer_up gauge",
+    `sign2voice_recognizer_up ${recognizer == null ? 0 : 1}`,
+  ].join("\n");
+  res.type("text/plain; version=0.0.4").send(`${recognizer ?? ""}${own}\n`);
+});
+
 // Open Sign2Voice GUI
 app.post("/api/open-webcam", (req, res) => {
   const guiPath = path.resolve("../gui_main.py");
@@ -88,7 +110,11 @@ app.post("/api/open-webcam", (req, res) => {
 // MongoDB connection
 mongoose
   .connect(process.env.MONGO_URI || "mongodb://localhost:27017/sign2voice")
-  .then(() => console.log("✅ MongoDB connected successfully"))
+  .then(() => {
+    console.log("✅ MongoDB connected successfully");
+    // Periodically rebuild admin aggregates (default hourly, 0 disables)
+    startRollupJob(Number(process.env.STATS_ROLLUP_INTERVAL_MS ?? 3600000));
+  })
   .catch((err) => {
     console.error("❌ MongoDB connection error:", err);
     process.exit(1);
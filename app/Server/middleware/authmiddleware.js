@@ -1,5 +1,21 @@
 import jwt from "jsonwebtoken"
 import User from "../model/usermodel.js"
+import { userCache } from "../utils/userCache.js"
+
+// Verify the token and load its user, served from userCache when possible.
+// Entries never outlive the token's own expiry.
+const resolveUser = async (token) => {
+  const cached = userCache.get(token)
+  if (cached) return cached.user
+
+  const decoded = jwt.verify(token, process.env.JWT_SECRET)
+  const user = await User.findById(decoded.id).select("-password").lean()
+  if (!user) return null
+
+  const ttl = decoded.exp ? Math.min(userCache.ttlMs, decoded.exp * 1000 - Date.now()) : userCache.ttlMs
+  userCache.set(token, { userId: String(user._id), user: Object.freeze(user) }, ttl)
+  return user
+}
 
 // Required authentication
 export const verifyToken = async (req, res, next) => {
@@ -7,8 +23,7 @@ export const verifyToken = async (req, res, next) => {
     const token = req.header("Authorization")?.replace("Bearer ", "")
     if (!token) return res.status(401).json({ error: "Access denied. No token provided." })
 
-    const decoded = jwt.verify(token, process.env.JWT_SECRET)
-    const user = await User.findById(decoded.id).select("-password")
+    const user = await resolveUser(token)
     if (!user) return res.status(401).json({ error: "Invalid token. User not found." })
 
     req.user = user
@@ -24,8 +39,7 @@ export const optionalAuth = async (req, res, next) => {
   try {
     const token = req.header("Authorization")?.replace("Bearer ", "")
     if (token) {
-      const decoded = jwt.verify(token, process.env.JWT_SECRET)
-      const user = await User.findById(decoded.id).select("-password")
+      const user = await resolveUser(token)
       if (user) req.user = user
     }
     next()
@@ -30,21 +30,32 @@ const sentenceSchema = new mongoose.Schema(
       enum: ["gui", "web", "api"],
       default: "gui",
     },
+    // Client-generated id so retried bulk saves are idempotent
+    clientId: {
+      type: String,
+      required: false,
+    },
   },
   { timestamps: true },
 )
 
-// Calculate word count before saving
-sentenceSchema.pre("save", function (next) {
-  this.wordCount = this.text
+export const countWords = (text) =>
+  text
     .trim()
     .split(/\s+/)
     .filter((word) => word.length > 0).length
+
+// Calculate word count before saving
+sentenceSchema.pre("save", function (next) {
+  this.wordCount = countWords(this.text)
   next()
 })
 
 // Index for better query performance
-sentenceSchema.index({ user: 1, createdAt: -1 })
+// (createdAt, _id) is the keyset for cursor pagination
+sentenceSchema.index({ user: 1, createdAt: -1, _id: -1 })
+sentenceSchema.index({ createdAt: -1, _id: -1 }) // admin-wide history
 sentenceSchema.index({ sessionId: 1 })
+sentenceSchema.index({ user: 1, clientId: 1 }, { unique: true, partialFilterExpression: { clientId: { $type: "string" } } })
 
 export default mongoose.model("Sentence", sentenceSchema)
\ No newline at end of file
@@ -0,0 +1,91 @@
+import mongoose from "mongoose"
+
+// Precomputed sentence aggregates for the admin panel.
+// Kept up to date incrementally by the sentence routes (recordSentences /
+// forgetSentences) and rebuilt from scratch by jobs/rollupStats.js.
+
+const sourceCounts = {
+  gui: { type: Number, default: 0 },
+  web: { type: Number, default: 0 },
+  api: { type: Number, default: 0 },
+}
+
+const userStatsSchema = new mongoose.Schema({
+  user: { type: mongoose.Schema.Types.ObjectId, ref: "User", required: true, unique: true },
+  sentences: { type: Number, default: 0 },
+  words: { type: Number, default: 0 },
+  sources: sourceCounts,
+  lastAt: { type: Date },
+  rolledUpAt: { type: Date },
+})
+
+const dailyStatsSchema = new mongoose.Schema({
+  day: { type: String, required: true, unique: true }, // YYYY-MM-DD (UTC)
+  sentences: { type: Number, default: 0 },
+  words: { type: Number, default: 0 },
+  sources: sourceCounts,
+  rolledUpAt: { type: Date },
+})
+
+userStatsSchema.index({ sentences: -1 })
+
+export const UserStats = mongoose.model("UserStats", userStatsSchema)
+export const DailyStats = mongoose.model("DailyStats", dailyStatsSchema)
+
+export const dayKey = (date) => new Date(date).toISOString().slice(0, 10)
+
+// Apply +1 (insert) or -1 (delete) per sentence to both aggregates,
+// collapsing a batch into one $inc per user and per day.
+const applyDelta = async (sentences, sign) => {
+  const perUser = new Map()
+  const perDay = new Map()
+  const bump = (map, key, s) => {
+    const entry = map.get(key) || { sentences: 0, words: 0, gui: 0, web: 0, api: 0, lastAt: null }
+    entry.sentences += sign
+    entry.words += sign * (s.wordCount || 0)
+    entry[s.source || "gui"] += sign
+    const at = new Date(s.createdAt || Date.now())
+    if (!entry.lastAt || at > entry.lastAt) entry.lastAt = at
+    map.set(key, entry)
+  }
+  for (const s of sentences) {
+    if (s.user) bump(perUser, String(s.user._id || s.user), s)
+    bump(perDay, dayKey(s.createdAt || Date.now()), s)
+  }
+
+  const inc = (e) => ({
+    sentences: e.sentences,
+    words: e.words,
+    "sources.gui": e.gui,
+    "sources.web": e.web,
+    "sources.api": e.api,
+  })
+  const userOps = [...perUser].map(([user, e]) => ({
+    updateOne: {
+      filter: { user },
+      update: sign > 0 ? { $inc: inc(e), $max: { lastAt: e.lastAt } } : { $inc: inc(e) },
+      upsert: true,
+    },
+  }))
+  const dayOps = [...perDay].map(([day, e]) => ({
+    updateOne: { filter: { day }, update: { $inc: inc(e) }, upsert: true },
+  }))
+
+  await Promise.all([
+    userOps.length && UserStats.bulkWrite(userOps, { ordered: false }),
+    dayOps.length && DailyStats.bulkWrite(dayOps, { ordered: false }),
+  ])
+}
+
+// Failures here must never fail the user's save; the rollup job repairs drift.
+const safely = (fn) => async (sentences) => {
+  if (!sentences.length) return
+  try {
+    await fn(sentences)
+  } catch (err) {
+    console.error("Error updating sentence stats:", err)
+  }
+}
+
+export const recordSentences = safely((sentences) => applyDelta(sentences, 1))
+export const forgetSentences = safely((sentences) => applyDelta(sentences, -1))
@@ -1,5 +1,6 @@
 import mongoose from "mongoose"
 import bcrypt from "bcrypt"
+import { invalidateUser } from "../utils/userCache.js"
 
 const userSchema = new mongoose.Schema(
   {
@@ -35,6 +36,9 @@ const userSchema = new mongoose.Schema(
   { timestamps: true },
 )
 
+// Keyset for the paginated admin user list
+userSchema.index({ createdAt: -1, _id: -1 })
+
 // Hash password before saving
 userSchema.pre("save", async function (next) {
   if (!this.isModified("password")) return next()
@@ -43,6 +47,31 @@ userSchema.pre("save", async function (next) {
   next()
 })
 
+// Evict cached auth entries whenever a user changes or is removed
+userSchema.post("save", (doc) => invalidateUser(doc._id))
+userSchema.post(["findOneAndUpdate", "findOneAndDelete", "findOneAndReplace"], (doc) => {
+  if (doc) invalidateUser(doc._id)
+})
+userSchema.post("deleteOne", { document: true, query: false }, (doc) => invalidateUser(doc._id))
+
+// Query writes: note the ids before the write (from the filter when it names
+// them, else one lookup) and evict once it has committed; evicting first would
+// let a concurrent request re-cache the old user
+const QUERY_WRITES = ["updateOne", "updateMany", "deleteOne", "deleteMany"]
+const filterIds = (filter) => {
+  const id = filter._id
+  if (id === undefined) return null
+  if (Array.isArray(id?.$in)) return id.$in
+  return mongoose.isValidObjectId(id) ? [id] : null
+}
+userSchema.pre(QUERY_WRITES, { document: false, query: true }, async function () {
+  const filter = this.getFilter()
+  this._userIds = filterIds(filter) || (await this.model.find(filter).distinct("_id"))
+})
+userSchema.post(QUERY_WRITES, { document: false, query: true }, function () {
+  for (const id of this._userIds || []) invalidateUser(id)
+})
+
 // Compare password method
 userSchema.methods.comparePassword = async function (password) {
   return await bcrypt.compare(password, this.password)
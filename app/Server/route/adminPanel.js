@@ -1,30 +1,124 @@
 import express from "express";
+import mongoose from "mongoose";
 import User from "../model/usermodel.js";
 import Sentence from "../model/sentence.js";
+import { UserStats, DailyStats } from "../model/sentenceStats.js";
 import { verifyAdminToken } from "../middleware/adminAuthMiddleware.js";
+import { decodeCursor, paginate, parseLimit } from "../utils/pagination.js";
 
 const router = express.Router();
 
-// Get all users
+const USER_FIELDS = "username email isActive lastLogin createdAt";
+const SENTENCE_FIELDS = "text user wordCount source sessionId createdAt";
+
+// Get users (cursor-paginated, newest first) with their precomputed stats
 router.get("/users", verifyAdminToken, async (req, res) => {
   try {
-    const users = await User.find().select("-password"); // exclude passwords
-    res.json(users);
+    const cursor = decodeCursor(req.query.cursor);
+    if (req.query.cursor && !cursor) return res.status(400).json({ error: "Invalid cursor" });
+
+    const { rows, pagination } = await paginate(User, {}, {
+      cursor,
+      limit: parseLimit(req.query.limit, 50, 200),
+      projection: USER_FIELDS,
+    });
+
+    const stats = await UserStats.find({ user: { $in: rows.map((u) => u._id) } })
+      .select("-_id user sentences words sources lastAt")
+      .lean();
+    const byUser = new Map(stats.map((s) => [String(s.user), s]));
+    const users = rows.map((u) => ({ ...u, stats: byUser.get(String(u._id)) || null }));
+
+    res.json({ users, pagination });
   } catch (err) {
     console.error(err);
     res.status(500).json({ error: "Failed to fetch users" });
   }
 });
 
-// Get all user sentence history
+// Get sentence history across users (cursor-paginated, optional ?user=<id>)
 router.get("/user-sentences", verifyAdminToken, async (req, res) => {
   try {
-    const sentences = await Sentence.find().populate("user", "email username");
-    res.json(sentences);
+    const cursor = decodeCursor(req.query.cursor);
+    if (req.query.cursor && !cursor) return res.status(400).json({ error: "Invalid cursor" });
+
+    const query = {};
+    if (req.query.user) {
+      if (!mongoose.Types.ObjectId.isValid(req.query.user)) {
+        return res.status(400).json({ error: "Invalid user id" });
+      }
+      query.user = req.query.user;
+    }
+
+    const { rows, pagination } = await paginate(Sentence, query, {
+      cursor,
+      limit: parseLimit(req.query.limit, 50, 200),
+      projection: SENTENCE_FIELDS,
+      populate: { path: "user", select: "email username" },
+    });
+
+    res.json({ sentences: rows, pagination });
   } catch (err) {
     console.error(err);
     res.status(500).json({ error: "Failed to fetch sentence history" });
   }
 });
 
+// Per-day aggregates, ?from=YYYY-MM-DD&to=YYYY-MM-DD (default: last 30 days)
+router.get("/stats/daily", verifyAdminToken, async (req, res) => {
+  try {
+    const to = req.query.to || new Date().toISOString().slice(0, 10);
+    const from =
+      req.query.from || new Date(Date.now() - 29 * 86400000).toISOString().slice(0, 10);
+
+    const days = await DailyStats.find({ day: { $gte: from, $lte: to } })
+      .select("-_id day sentences words sources")
+      .sort({ day: 1 })
+      .lean();
+
+    res.json({ from, to, days });
+  } catch (err) {
+    console.error(err);
+    res.status(500).json({ error: "Failed to fetch daily stats" });
+  }
+});
+
+// Totals plus the most active users, all from the precomputed aggregates
+router.get("/stats/summary", verifyAdminToken, async (req, res) => {
+  try {
+    const [[totals], topUsers, users] = await Promise.all([
+      DailyStats.aggregate([
+        {
+          $group: {
+            _id: null,
+            sentences: { $sum: "$sentences" },
+            words: { $sum: "$words" },
+            gui: { $sum: "$sources.gui" },
+            web: { $sum: "$sources.web" },
+            api: { $sum: "$sources.api" },
+          },
+        },
+      ]),
+      UserStats.find()
+        .sort({ sentences: -1 })
+        .limit(parseLimit(req.query.top, 10, 100))
+        .select("-_id user sentences words lastAt")
+        .populate("user", "email username")
+        .lean(),
+      User.estimatedDocumentCount(),
+    ]);
+
+    res.json({
+      users,
+      sentences: totals?.sentences || 0,
+      words: totals?.words || 0,
+      sources: { gui: totals?.gui || 0, web: totals?.web || 0, api: totals?.api || 0 },
+      topUsers,
+    });
+  } catch (err) {
+    console.error(err);
+    res.status(500).json({ error: "Failed to fetch stats summary" });
+  }
+});
+
 export default router;
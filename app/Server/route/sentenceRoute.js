@@ -1,7 +1,9 @@
 import express from "express";
 import mongoose from "mongoose";
-import Sentence from "../model/sentence.js";
+import Sentence, { countWords } from "../model/sentence.js";
+import { recordSentences, forgetSentences } from "../model/sentenceStats.js";
 import { verifyToken } from "../middleware/authmiddleware.js";
+import { decodeCursor, paginate, parseLimit } from "../utils/pagination.js";
 
 const router = express.Router();
 
@@ -22,6 +24,7 @@ router.post("/save", verifyToken, async (req, res) => {
     });
 
     await sentence.save();
+    await recordSentences([sentence]);
 
     res.status(201).json({
       message: "Sentence saved successfully",
@@ -33,6 +36,80 @@ router.post("/save", verifyToken, async (req, res) => {
   }
 });
 
+// ---------------- Save a batch of sentences (authenticated) ----------------
+// Used by the GUI outbox. Items carrying a clientId are upserted on
+// (user, clientId), so re-sending a batch after a lost response is harmless.
+const MAX_BULK = 500;
+const SOURCES = ["gui", "web", "api"];
+
+router.post("/bulk", verifyToken, async (req, res) => {
+  try {
+    const { sentences } = req.body;
+
+    if (!Array.isArray(sentences) || sentences.length === 0) {
+      return res.status(400).json({ error: "sentences must be a non-empty array" });
+    }
+    if (sentences.length > MAX_BULK) {
+      return res.status(413).json({ error: `At most ${MAX_BULK} sentences per request` });
+    }
+
+    const ops = [];
+    const docs = []; // aligned with ops
+    const rejected = [];
+    sentences.forEach((item, index) => {
+      const text = typeof item?.text === "string" ? item.text.trim() : "";
+      if (!text) {
+        rejected.push({ index, clientId: item?.clientId, error: "Sentence cannot be empty" });
+        return;
+      }
+      const timestamp = item.timestamp ? new Date(item.timestamp) : new Date();
+      const doc = {
+        user: req.user._id,
+        text,
+        wordCount: countWords(text), // bulkWrite skips the pre("save") hook
+        sessionId: item.sessionId || new mongoose.Types.ObjectId().toString(),
+        source: SOURCES.includes(item.source) ? item.source : "gui",
+        timestamp: isNaN(timestamp) ? new Date() : timestamp,
+      };
+      if (typeof item.clientId === "string" && item.clientId) {
+        doc.clientId = item.clientId;
+        ops.push({
+          updateOne: {
+            filter: { user: req.user._id, clientId: item.clientId },
+            update: { $setOnInsert: doc },
+            upsert: true,
+          },
+        });
+      } else {
+        ops.push({ insertOne: { document: doc } });
+      }
+      docs.push(doc);
+    });
+
+    let inserted = 0;
+    let duplicates = 0;
+    if (ops.length > 0) {
+      const result = await Sentence.bulkWrite(ops, { ordered: false });
+      inserted = result.insertedCount + result.upsertedCount;
+      duplicates = result.matchedCount;
+
+      const createdAt = new Date();
+      const newIndexes = Object.keys({ ...result.insertedIds, ...result.upsertedIds });
+      await recordSentences(newIndexes.map((i) => ({ ...docs[i], createdAt })));
+    }
+
+    res.status(201).json({
+      message: "Sentences saved successfully",
+      inserted,
+      duplicates,
+      rejected,
+    });
+  } catch (err) {
+    console.error("Error saving sentences in bulk:", err);
+    res.status(500).json({ error: "Server error while saving sentences" });
+  }
+});
+
 // ---------------- Save sentence via web (authenticated) ----------------
 router.post("/", verifyToken, async (req, res) => {
   try {
@@ -50,6 +127,7 @@ router.post("/", verifyToken, async (req, res) => {
     });
 
     await sentence.save();
+    await recordSentences([sentence]);
 
     res.status(201).json({
       message: "Sentence saved successfully",
@@ -61,32 +139,28 @@ router.post("/", verifyToken, async (req, res) => {
   }
 });
 
-// ---------------- Get all sentences of logged-in user ----------------
+// ---------------- Get sentences of logged-in user (cursor-paginated) ----------------
+// Pass pagination.nextCursor back as ?cursor= to get the next (older) page.
 router.get("/", verifyToken, async (req, res) => {
   try {
-    const { page = 1, limit = 20, sessionId } = req.query;
+    const { cursor, sessionId } = req.query;
     const query = { user: req.user._id };
 
     if (sessionId) {
       query.sessionId = sessionId;
     }
 
-    const sentences = await Sentence.find(query)
-      .sort({ createdAt: -1 })
-      .limit(limit * 1)
-      .skip((page - 1) * limit)
-      .exec();
-
-    const total = await Sentence.countDocuments(query);
+    const decoded = decodeCursor(cursor);
+    if (cursor && !decoded) {
+      return res.status(400).json({ error: "Invalid cursor" });
+    }
 
-    res.json({
-      sentences,
-      pagination: {
-        current: page,
-        pages: Math.ceil(total / limit),
-        total,
-      },
+    const { rows, pagination } = await paginate(Sentence, query, {
+      cursor: decoded,
+      limit: parseLimit(req.query.limit),
     });
+
+    res.json({ sentences: rows, pagination });
   } catch (err) {
     console.error("Error fetching sentences:", err);
     res.status(500).json({ error: "Server error while fetching sentences" });
@@ -106,6 +180,7 @@ router.delete("/:id", verifyToken, async (req, res) => {
     }
 
     await sentence.deleteOne();
+    await forgetSentences([sentence]);
     res.json({ message: "Sentence deleted successfully" });
   } catch (err) {
     console.error("Error deleting sentence:", err);
@@ -114,23 +189,65 @@ router.delete("/:id", verifyToken, async (req, res) => {
 });
 
 // ---------------- Get sentence statistics (user-specific) ----------------
+// Totals are computed in Mongo; `stats` only carries the most recent page
+// of sentences (follow pagination.nextCursor via GET / for older ones).
+// ?since=<ISO> is the start of the caller's day for `todaySentences`
+// (default: midnight UTC).
 router.get("/stats", verifyToken, async (req, res) => {
   try {
-    const sentences = await Sentence.find({ user: req.user._id }).sort({ createdAt: -1 });
-
-    const stats = sentences.map((s) => ({
-      _id: s._id,
-      text: s.text,
-      wordCount: s.wordCount,
-      sessionId: s.sessionId,
-      source: s.source,
-      timestamp: s.timestamp,
-      createdAt: s.createdAt,
-      updatedAt: s.updatedAt,
-      user: s.user,
-    }));
-
-    res.status(200).json({ stats });
+    const since = req.query.since ? new Date(req.query.since) : new Date();
+    if (isNaN(since)) {
+      return res.status(400).json({ error: "Invalid since" });
+    }
+    if (!req.query.since) since.setUTCHours(0, 0, 0, 0);
+
+    const [[summary], [sessions], page] = await Promise.all([
+      Sentence.aggregate([
+        { $match: { user: req.user._id } },
+        {
+          $group: {
+            _id: null,
+            totalSentences: { $sum: 1 },
+            totalWords: { $sum: "$wordCount" },
+            firstAt: { $min: "$createdAt" },
+            lastAt: { $max: "$createdAt" },
+            todaySentences: { $sum: { $cond: [{ $gte: ["$createdAt", since] }, 1, 0] } },
+          },
+        },
+        {
+          $project: {
+            _id: 0,
+            totalSentences: 1,
+            totalWords: 1,
+            firstAt: 1,
+            lastAt: 1,
+            todaySentences: 1,
+            avgWordsPerSentence: { $divide: ["$totalWords", "$totalSentences"] },
+          },
+        },
+      ]),
+      // One group per session, counted: no per-user set of session ids in memory
+      Sentence.aggregate([
+        { $match: { user: req.user._id } },
+        { $group: { _id: "$sessionId" } },
+        { $count: "totalSessions" },
+      ]),
+      paginate(Sentence, { user: req.user._id }, { limit: parseLimit(req.query.limit, 50, 200) }),
+    ]);
+
+    res.status(200).json({
+      summary: {
+        ...(summary || {
+          totalSentences: 0,
+          totalWords: 0,
+          todaySentences: 0,
+          avgWordsPerSentence: 0,
+        }),
+        totalSessions: sessions ? sessions.totalSessions : 0,
+      },
+      stats: page.rows,
+      pagination: page.pagination,
+    });
   } catch (err) {
     console.error("Error fetching sentence stats:", err);
     res.status(500).json({ error: "Server error while fetching stats" });
@@ -0,0 +1,56 @@
+import mongoose from "mongoose";
+
+// Keyset pagination over (createdAt, _id), newest first.
+// A cursor is the base64url of "<createdAt ISO>_<ObjectId>" of the last row
+// returned, so every page is an index range scan instead of skip(n).
+
+export const encodeCursor = (doc) =>
+  Buffer.from(`${doc.createdAt.toISOString()}_${doc._id}`).toString("base64url");
+
+export const decodeCursor = (cursor) => {
+  if (!cursor) return null;
+  const [iso, id] = Buffer.from(String(cursor), "base64url").toString().split("_");
+  const createdAt = new Date(iso);
+  if (isNaN(createdAt) || !mongoose.Types.ObjectId.isValid(id)) return null;
+  return { createdAt, _id: new mongoose.Types.ObjectId(id) };
+};
+
+// Adds the "strictly after cursor" condition to a query object
+export const afterCursor = (query, cursor) => {
+  if (!cursor) return query;
+  return {
+    ...query,
+    $or: [
+      { createdAt: { $lt: cursor.createdAt } },
+      { createdAt: cursor.createdAt, _id: { $lt: cursor._id } },
+    ],
+  };
+};
+
+export const parseLimit = (limit, fallback = 20, max = 100) => {
+  const n = parseInt(limit, 10);
+  if (isNaN(n) || n < 1) return fallback;
+  return Math.min(n, max);
+};
+
+// Runs a keyset page query: fetches one extra row to know if there is more
+export const paginate = async (model, query, { cursor, limit, projection, populate }) => {
+  let q = model
+    .find(afterCursor(query, cursor), projection)
+    .sort({ createdAt: -1, _id: -1 })
+    .limit(limit + 1)
+    .lean();
+  if (populate) q = q.populate(populate);
+  const rows = await q.exec();
+
+  const hasMore = rows.length > limit;
+  if (hasMore) rows.pop();
+  return {
+    rows,
+    pagination: {
+      limit,
+      hasMore,
+      nextCursor: hasMore ? encodeCursor(rows[rows.length - 1]) : null,
+    },
+  };
+};
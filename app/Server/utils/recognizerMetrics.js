@@ -0,0 +1,124 @@
+// Scrapes the Python recognition process's Prometheus-style /metrics
+// (app/metrics.py) and condenses it for /api/health.
+//
+//   RECOGNIZER_METRICS_URL    default http://127.0.0.1:9470/metrics
+//   HEALTH_MIN_FPS            status DEGRADED below this fps (0 = no check)
+//   HEALTH_MAX_FRAME_P95_MS   ... or above this p95 frame latency (0 = no check)
+
+export const RECOGNIZER_METRICS_URL =
+  process.env.RECOGNIZER_METRICS_URL || "http://127.0.0.1:9470/metrics";
+
+const limits = {
+  minFps: Number(process.env.HEALTH_MIN_FPS ?? 0),
+  maxFrameP95Ms: Number(process.env.HEALTH_MAX_FRAME_P95_MS ?? 0),
+};
+
+// "name{a="x",b="y"} 1.5" lines → [{ name, labels, value }]
+export const parsePrometheus = (text) => {
+  const samples = [];
+  for (const line of text.split("\n")) {
+    if (!line || line.startsWith("#")) continue;
+    const match = line.match(/^([a-zA-Z_:][\w:]*)(?:\{(.*)\})?\s+(\S+)$/);
+    if (!match) continue;
+    const labels = {};
+    for (const [, key, value] of (match[2] || "").matchAll(/(\w+)="([^"]*)"/g)) {
+      labels[key] = value;
+    }
+    samples.push({ name: match[1], labels, value: Number(match[3]) });
+  }
+  return samples;
+};
+
+// Same interpolation as PromQL histogram_quantile over cumulative buckets
+const quantile = (q, buckets) => {
+  const total = buckets.at(-1)?.count ?? 0;
+  if (!total) return null;
+  const rank = q * total;
+  let prevLe = 0;
+  let prevCount = 0;
+  for (const { le, count } of buckets) {
+    if (count >= rank) {
+      if (le === Infinity) return prevLe;
+      return prevLe + ((le - prevLe) * (rank - prevCount)) / Math.max(count - prevCount, 1);
+    }
+    prevLe = le;
+    prevCount = count;
+  }
+  return prevLe;
+};
+
+// { [seriesLabel]: { p50, p95, mean, count } } for one histogram
+const histogram = (samples, name, by) => {
+  const series = {};
+  for (const s of samples) {
+    const key = by ? s.labels[by] : "all";
+    series[key] ??= { buckets: [], sum: 0, count: 0 };
+    if (s.name === `${name}_bucket`) {
+      const le = s.labels.le === "+Inf" ? Infinity : Number(s.labels.le);
+      series[key].buckets.push({ le, count: s.value });
+    } else if (s.name === `${name}_sum`) {
+      series[key].sum = s.value;
+    } else if (s.name === `${name}_count`) {
+      series[key].count = s.value;
+    }
+  }
+  const round = (v) => (v == null ? null : Math.round(v * 100) / 100);
+  return Object.fromEntries(
+    Object.entries(series).map(([key, h]) => {
+      h.buckets.sort((a, b) => a.le - b.le);
+      return [key, {
+        p50: round(quantile(0.5, h.buckets)),
+        p95: round(quantile(0.95, h.buckets)),
+        mean: h.count ? round(h.sum / h.count) : null,
+        count: h.count,
+      }];
+    })
+  );
+};
+
+export const summarize = (samples) => {
+  const value = (name) => samples.find((s) => s.name === name)?.value ?? null;
+  const sum = (name) =>
+    samples.filter((s) => s.name === name).reduce((total, s) => total + s.value, 0);
+  const only = (prefix) => samples.filter((s) => s.name.startsWith(prefix));
+  return {
+    frames: value("sign2voice_frames_total"),
+    fps: value("sign2voice_fps"),
+    droppedFrames: sum("sign2voice_dropped_frames_total"),
+    latencyMs: histogram(only("sign2voice_stage_latency_ms_"), "sign2voice_stage_latency_ms", "stage"),
+    batchSize: histogram(only("sign2voice_inference_batch_size_"), "sign2voice_inference_batch_size").all ?? null,
+    suggestionCacheHitRatio: value("sign2voice_suggestion_cache_hit_ratio"),
+    ttsSpeaking: value("sign2voice_tts_speaking"),
+    rssBytes: value("process_resident_memory_bytes"),
+  };
+};
+
+// Reasons the recogniser is below the configured limits ([] = healthy)
+export const problems = (summary) => {
+  const found = [];
+  if (limits.minFps && summary.fps != null && summary.fps < limits.minFps) {
+    found.push(`fps ${summary.fps} < ${limits.minFps}`);
+  }
+  const p95 = summary.latencyMs.frame?.p95;
+  if (limits.maxFrameP95Ms && p95 != null && p95 > limits.maxFrameP95Ms) {
+    found.push(`frame p95 ${p95} ms > ${limits.maxFrameP95Ms} ms`);
+  }
+  return found;
+};
+
+// Raw exposition text, or null when the recogniser isn't running
+export const fetchRecognizerMetrics = async (timeoutMs = 500) => {
+  try {
+    const res = await fetch(RECOGNIZER_METRICS_URL, { signal: AbortSignal.timeout(timeoutMs) });
+    return res.ok ? await res.text() : null;
+  } catch {
+    return null;
+  }
+};
+
+export const recognizerHealth = async () => {
+  const text = await fetchRecognizerMetrics();
+  if (text == null) return { up: false, url: RECOGNIZER_METRICS_URL };
+  const summary = summarize(parsePrometheus(text));
+  return { up: true, url: RECOGNIZER_METRICS_URL, ...summary, problems: problems(summary) };
+};
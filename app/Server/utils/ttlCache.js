@@ -0,0 +1,52 @@
+// Bounded LRU cache with a per-entry TTL. Map iteration order is insertion
+// order, so re-inserting on read keeps the least recently used entry first.
+export class TTLCache {
+  constructor({ max = 1000, ttlMs = 60000 } = {}) {
+    this.max = max;
+    this.ttlMs = ttlMs;
+    this.map = new Map();
+    this.hits = 0;
+    this.misses = 0;
+  }
+
+  get(key) {
+    const entry = this.map.get(key);
+    if (!entry || entry.expires <= Date.now()) {
+      if (entry) this.map.delete(key);
+      this.misses++;
+      return undefined;
+    }
+    this.map.delete(key);
+    this.map.set(key, entry);
+    this.hits++;
+    return entry.value;
+  }
+
+  set(key, value, ttlMs = this.ttlMs) {
+    if (this.max <= 0 || ttlMs <= 0) return;
+    this.map.delete(key);
+    this.map.set(key, { value, expires: Date.now() + ttlMs });
+    while (this.map.size > this.max) {
+      this.map.delete(this.map.keys().next().value);
+    }
+  }
+
+  delete(key) {
+    return this.map.delete(key);
+  }
+
+  // Drop every entry whose value matches the predicate
+  deleteWhere(predicate) {
+    for (const [key, entry] of this.map) {
+      if (predicate(entry.value)) this.map.delete(key);
+    }
+  }
+
+  clear() {
+    this.map.clear();
+  }
+
+  get size() {
+    return this.map.size;
+  }
+}
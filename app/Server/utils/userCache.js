@@ -0,0 +1,17 @@
+import { TTLCache } from "./ttlCache.js";
+
+// token → { userId, user } for verifyToken / optionalAuth, so an
+// authenticated request doesn't cost a User.findById round-trip.
+// The user model evicts a user's entries whenever it is updated or deleted.
+// The cache is per process; with several server processes an update is
+// only seen by the others after AUTH_CACHE_TTL_MS.
+export const userCache = new TTLCache({
+  max: Number(process.env.AUTH_CACHE_MAX ?? 5000),
+  ttlMs: Number(process.env.AUTH_CACHE_TTL_MS ?? 60000),
+});
+
+export const invalidateUser = (userId) => {
+  if (!userId) return;
+  const id = String(userId);
+  userCache.deleteWhere((entry) => entry.userId === id);
+};
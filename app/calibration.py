@@ -0,0 +1,53 @@
+# app/calibration.py
+"""
+Confidence calibration for the live loops (fitted by models/calibrate.py).
+
+* temperature  - softmax temperature fitted on the held-out split, so a
+                 confidence of 0.9 means the letter is right ~90% of the time.
+* per_class    - {letter: {"threshold", "vote"}}: letters the model rarely
+                 confuses commit on fewer, less confident frames; confusable
+                 ones keep the conservative defaults.
+
+A missing file means "uncalibrated": temperature 1 and the fixed threshold /
+vote length for every letter. The temperature itself is applied by the
+classifier (LandmarkClassifier.temperature).
+"""
+import json, os
+
+
+class Calibration:
+    def __init__(self, temperature=1.0, per_class=None, threshold=0.8, vote=6, classes=None):
+        self.temperature = float(temperature)
+        self.per_class = per_class or {}
+        self.threshold = threshold     # defaults for letters without an entry
+        self.vote = vote
+        self.classes = classes
+
+    @classmethod
+    def load(cls, path):
+        """Calibration from JSON, or the uncalibrated defaults if the file is missing."""
+        if not path or not os.path.exists(path):
+            return cls()
+        with open(path) as f:
+            data = json.load(f)
+        return cls(data.get("temperature", 1.0), data.get("per_class"),
+                   data.get("threshold", 0.8), data.get("vote", 6), data.get("classes"))
+
+    def save(self, path, **extra):
+        with open(path, "w") as f:
+            json.dump({"temperature": self.temperature, "threshold": self.threshold,
+                       "vote": self.vote, "classes": self.classes,
+                       "per_class": self.per_class, **extra}, f, indent=4)
+
+    @property
+    def fitted(self):
+        return self.temperature != 1.0 or bool(self.per_class)
+
+    def decoder_kwargs(self):
+        """Keyword arguments for LetterDecoder (per-letter gates plus defaults)."""
+        return {
+            "conf_threshold": self.threshold,
+            "buffer_vote": self.vote,
+            "thresholds": {c: v["threshold"] for c, v in self.per_class.items()},
+            "votes": {c: v["vote"] for c, v in self.per_class.items()},
+        }
@@ -1,31 +1,94 @@
 import cv2
-import mediapipe as mp
+import numpy as np
+
+
+class DetectedHands:
+    """
+    Landmarks of the hands found in one frame.
+
+    landmarks   (n, 21, 3) float32  normalised x, y, z
+    pixels      (n, 21, 2) int32    x, y in image pixels
+    handedness  list of "Left" / "Right"
+    raw         MediaPipe landmark lists (for drawing)
+
+    The arrays are views into the detector's preallocated buffers and are
+    overwritten by the next `detect_hands` call - copy them to keep them.
+    """
+    __slots__ = ("landmarks", "pixels", "handedness", "raw")
+
+    def __init__(self, landmarks, pixels, handedness, raw):
+        self.landmarks = landmarks
+        self.pixels = pixels
+        self.handedness = handedness
+        self.raw = raw
+
+    def __len__(self):
+        return len(self.landmarks)
+
+    def vectors(self):
+        """(n, 63) flat vectors in the classifier's x,y,z order."""
+        return self.landmarks.reshape(-1, 63)
+
+    def centroids(self):
+        """(n, 2) mean normalised x, y per hand."""
+        return self.landmarks[:, :, :2].mean(axis=1)
+
 
 class HandDetector:
-    def __init__(self, max_hands=2, detection_confidence=0.7, tracking_confidence=0.7):
+    def __init__(self, max_hands=2, detection_confidence=0.7, tracking_confidence=0.7,
+                 static_image_mode=False):
+        import mediapipe as mp      # DetectedHands alone (trace replay) needs no MediaPipe
         self.mpHands = mp.solutions.hands
         self.hands = self.mpHands.Hands(
+            static_image_mode=static_image_mode,
             max_num_hands=max_hands,
             min_detection_confidence=detection_confidence,
             min_tracking_confidence=tracking_confidence
         )
         self.mpDraw = mp.solutions.drawing_utils
 
-    def detect_hands(self, img, draw=True):
-        imgRGB = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
+        # Reused every frame
+        self._landmarks = np.zeros((max_hands, 21, 3), dtype=np.float32)
+        self._scaled = np.zeros((max_hands, 21, 2), dtype=np.float32)
+        self._pixels = np.zeros((max_hands, 21, 2), dtype=np.int32)
+        self._wh = np.zeros(2, dtype=np.float32)
+
+    def detect_hands(self, img, draw=True, rgb=None):
+        """
+        Run MediaPipe on a BGR frame; returns (img, DetectedHands).
+        Pass `rgb` when an RGB copy already exists (app/frame_bus.py).
+        """
+        imgRGB = cv2.cvtColor(img, cv2.COLOR_BGR2RGB) if rgb is None else rgb
         self.results = self.hands.process(imgRGB)
-        all_landmarks = []
+        found = self.convert(self.results.multi_hand_landmarks,
+                             self.results.multi_handedness, img.shape)
+
+        if draw:
+            self.draw(img, found)
+
+        return img, found
+
+    def warm(self, shape=(480, 640, 3)):
+        """One pass on a blank frame so the first real frame doesn't pay for graph setup."""
+        self.detect_hands(np.zeros(shape, np.uint8), draw=False)
+
+    def draw(self, img, found):
+        """Draw the hands of a `detect_hands(..., draw=False)` call onto img."""
+        for handLms in found.raw:
+            self.mpDraw.draw_landmarks(img, handLms, self.mpHands.HAND_CONNECTIONS)
 
-        if self.results.multi_hand_landmarks:
-            for handLms in self.results.multi_hand_landmarks:
-                landmarks = []
-                for id, lm in enumerate(handLms.landmark):
-                    h, w, _ = img.shape
-                    cx, cy = int(lm.x * w), int(lm.y * h)
-                    landmarks.append((id, cx, cy))
-                all_landmarks.append(landmarks)
+    def convert(self, multi_hand_landmarks, multi_handedness, shape):
+        """MediaPipe landmark protos → DetectedHands written into the buffers."""
+        raw = list(multi_hand_landmarks or [])[:len(self._landmarks)]
+        n = len(raw)
+        for i, handLms in enumerate(raw):
+            self._landmarks[i] = [(p.x, p.y, p.z) for p in handLms.landmark]
 
-                if draw:
-                    self.mpDraw.draw_landmarks(img, handLms, self.mpHands.HAND_CONNECTIONS)
+        lm = self._landmarks[:n]
+        if n:
+            self._wh[0], self._wh[1] = shape[1], shape[0]
+            np.multiply(lm[:, :, :2], self._wh, out=self._scaled[:n])
+            self._pixels[:n] = self._scaled[:n]      # truncates like int()
 
-        return img, all_landmarks
+        handedness = [h.classification[0].label for h in (multi_handedness or [])[:n]]
+        return DetectedHands(lm, self._pixels[:n], handedness, raw)
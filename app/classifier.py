@@ -0,0 +1,144 @@
+# app/classifier.py
+"""
+Landmark classifiers for the live loops. Both take (N, 63) landmark vectors
+and classify every detected hand in one call.
+
+* LandmarkClassifier - the Keras CNN. `model.predict` sets up a tf.data
+  pipeline on every call, which dominates the cost for a handful of 63-d
+  vectors, so the model is called directly instead.
+* StudentClassifier  - the distilled MLP from models/landmark_distill.py,
+  run as plain NumPy matmuls (no TensorFlow import at all) over
+  wrist-centred, scale-normalised landmarks.
+* TFLiteClassifier   - the CNN converted (optionally int8-quantised) by
+  `python -m models.evaluate --export_tflite`.
+
+`normalization` names the input each one expects, so the model registry
+(app/model_registry.py) can refuse a manifest entry that disagrees.
+`proba_and_features` also returns the penultimate activations from the same
+forward pass, for the per-user head in app/personalize.py (backends with
+`has_features`; a .tflite export only has the softmax).
+
+Both apply the fitted softmax temperature (app/calibration.py) when set.
+"""
+import json
+import numpy as np
+
+
+def normalize_landmarks(vecs):
+    """
+    (N, 63) raw MediaPipe vectors → wrist-centred, scale-free (N, 63).
+
+    Subtracts the wrist (landmark 0) and divides by the largest x/y extent
+    of the hand, so the input no longer depends on where the hand is in the
+    frame or how close it is to the camera.
+    """
+    lm = np.asarray(vecs, dtype=np.float32).reshape(-1, 21, 3)
+    lm = lm - lm[:, :1, :]
+    scale = np.abs(lm[:, :, :2]).max(axis=(1, 2), keepdims=True)
+    lm = lm / np.maximum(scale, 1e-6)
+    return lm.reshape(-1, 63)
+
+
+def apply_temperature(probs, temperature):
+    """softmax(log p / T) - same as dividing the logits by T."""
+    if temperature == 1.0:
+        return probs
+    logits = np.log(np.clip(probs, 1e-12, 1.0)) / temperature
+    logits -= logits.max(axis=1, keepdims=True)
+    np.exp(logits, out=logits)
+    logits /= logits.sum(axis=1, keepdims=True)
+    return logits
+
+
+class LandmarkClassifier:
+    temperature = 1.0   # set from the calibration file
+    normalization = "raw"
+    has_features = True # proba_and_features available
+    _heads = None       # softmax + penultimate outputs, built on first use
+
+    def __init__(self, model_path, classes_path):
+        import tensorflow as tf
+        self.model = tf.keras.models.load_model(model_path)
+        with open(classes_path) as f:
+            self.class_names = json.load(f)
+
+    def predict_proba(self, vecs):
+        """(N, 63) landmark vectors → (N, num_classes) softmax."""
+        x = np.asarray(vecs, dtype=np.float32).reshape(-1, 63)
+        if len(x) == 0:
+            return np.empty((0, len(self.class_names)), dtype=np.float32)
+        return self.model(x, training=False).numpy()
+
+    def proba_and_features(self, vecs):
+        """(N, num_classes) softmax and (N, F) penultimate activations, one pass."""
+        x = np.asarray(vecs, dtype=np.float32).reshape(-1, 63)
+        if self._heads is None:
+            import tensorflow as tf
+            self._heads = tf.keras.Model(self.model.inputs,
+                                         [self.model.layers[-1].output, self.model.layers[-2].output])
+        probs, feats = self._heads(x, training=False)
+        return probs.numpy(), feats.numpy().reshape(len(x), -1)
+
+    def predict_batch(self, vecs):
+        """Return (letters, confidences, probs) for a batch of hands."""
+        probs = apply_temperature(self.predict_proba(vecs), self.temperature)
+        idx = probs.argmax(axis=1)
+        confs = probs[np.arange(len(idx)), idx]
+        return [self.class_names[i] for i in idx], confs, probs
+
+
+class StudentClassifier(LandmarkClassifier):
+    """Dense-ReLU stack exported by models/landmark_distill.py as .npz."""
+    normalization = "wrist_scale"
+
+    def __init__(self, weights_path):
+        data = np.load(weights_path, allow_pickle=False)
+        n_layers = int(data["n_layers"])
+        self.weights = [(data[f"W{i}"].astype(np.float32), data[f"b{i}"].astype(np.float32))
+                        for i in range(n_layers)]
+        self.class_names = [str(c) for c in data["classes"]]
+
+    def predict_proba(self, vecs):
+        return self.proba_and_features(vecs)[0]
+
+    def proba_and_features(self, vecs):
+        x = normalize_landmarks(vecs)
+        for W, b in self.weights[:-1]:
+            x = x @ W
+            x += b
+            np.maximum(x, 0, out=x)
+        W, b = self.weights[-1]
+        logits = x @ W + b
+        logits -= logits.max(axis=1, keepdims=True, initial=-np.inf)
+        np.exp(logits, out=logits)
+        logits /= logits.sum(axis=1, keepdims=True)
+        return logits, x
+
+
+class TFLiteClassifier(LandmarkClassifier):
+    """.tflite export of the CNN; tflite_runtime if installed, else TensorFlow's interpreter."""
+    has_features = False
+
+    def __init__(self, model_path, classes_path, threads=None):
+        try:
+            from tflite_runtime.interpreter import Interpreter
+        except ImportError:
+            from tensorflow.lite import Interpreter
+        self.interpreter = Interpreter(model_path=model_path, num_threads=threads)
+        self.input = self.interpreter.get_input_details()[0]
+        self.output = self.interpreter.get_output_details()[0]
+        self.batch = None
+        with open(classes_path) as f:
+            self.class_names = json.load(f)
+
+    def predict_proba(self, vecs):
+        x = np.asarray(vecs, dtype=np.float32).reshape(-1, 63)
+        if len(x) == 0:
+            return np.empty((0, len(self.class_names)), dtype=np.float32)
+        if self.batch != len(x):
+            self.interpreter.resize_tensor_input(self.input["index"], [len(x), 63])
+            self.interpreter.allocate_tensors()
+            self.batch = len(x)
+        self.interpreter.set_tensor(self.input["index"], x.astype(self.input["dtype"]))
+        self.interpreter.invoke()
+        return self.interpreter.get_tensor(self.output["index"]).copy()
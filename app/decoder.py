@@ -0,0 +1,67 @@
+# app/decoder.py
+"""
+Turns the classifier's per-frame (letter, confidence) stream into sentence
+edits with a majority vote over the last few confident predictions.
+
+The confidence gate and vote length can be set per letter (see
+app/calibration.py); letters without an entry use the defaults.
+"""
+from collections import deque
+
+
+class LetterDecoder:
+    def __init__(self, conf_threshold=0.8, buffer_size=10, buffer_vote=6,
+                 thresholds=None, votes=None):
+        self.conf_threshold = conf_threshold
+        self.buffer_vote = buffer_vote               # how many times a letter must appear
+        self.thresholds = thresholds or {}           # letter → confidence gate
+        self.votes = votes or {}                     # letter → votes needed
+        self.pred_buffer = deque(maxlen=buffer_size) # last confident letters
+        self.last_added = ""                         # last letter actually added
+
+    def gate(self, letter):
+        """Confidence `letter` needs to count toward a commit (also the display gate)."""
+        return self.thresholds.get(letter, self.conf_threshold)
+
+    def update(self, letter, conf):
+        """Feed one prediction; return the committed token or None."""
+        if conf < self.gate(letter):
+            return None
+        self.pred_buffer.append(letter)
+        # Only the letter just appended can have crossed its vote count
+        if (letter != self.last_added and
+                self.pred_buffer.count(letter) >= self.votes.get(letter, self.buffer_vote)):
+            self.last_added = letter
+            self.pred_buffer.clear()                 # reset buffer after accepting
+            return letter
+        return None
+
+    def reset(self):
+        """Hand lost: forget the vote buffer so the same letter can repeat."""
+        self.pred_buffer.clear()
+        self.last_added = ""
+
+
+def follow_tracks(sentences, tracks, live):
+    """
+    Keep per-track sentences ({track id: text}) in step with the tracker. A
+    hand that is away longer than max_missed comes back with a new id: the
+    first new track takes over the oldest sentence of a lost one. Lost
+    tracks with nothing written are dropped.
+    """
+    for key in [k for k in sentences if k not in live]:
+        if not sentences[key]:
+            del sentences[key]
+    lost = [k for k in sentences if k not in live]
+    for track in tracks:
+        if lost and track.id not in sentences:
+            sentences[track.id] = sentences.pop(lost.pop(0))
+
+
+def apply_token(sentence, token):
+    """Apply a committed token (letter, 'space' or 'del') to the sentence."""
+    if token == "space":
+        return sentence + " "
+    if token == "del":
+        return sentence[:-1]
+    return sentence + token
@@ -0,0 +1,27 @@
+# app/engine/__init__.py
+"""
+The recognition engine shared by every entry point: the Tk GUI
+(gui_main.py), the OpenCV window (app/main.py), the headless runner
+(app/headless.py), batch jobs and benchmarks.
+
+    engine = Engine(classifier="student", max_hands=2, target_ms=50).load().warm()
+    while True:
+        ok, frame = engine.read(cap)
+        result = engine.process(frame)        # or engine.process_batch(frames)
+        ...                                   # result.hands(), engine.sentences
+        delay_ms = engine.pace(result.frame_ms, len(result.found))
+    engine.close()
+
+`with Engine(...) as engine:` does load() + warm() and close().
+engine.personalize(user_id) puts that user's adapter (app/personalize.py)
+on top of the landmark classifier; engine.personalize(None) takes it off.
+
+Detector, decoder and suggestion backends are picked by name from
+app/engine/backends.py (or passed in as objects); classifiers come from the
+model registry (app/model_registry.py), so a model switch there swaps them
+while running.
+"""
+from .backends import (DECODERS, DETECTORS, SUGGESTERS, TraceDetector, register_decoder,
+                       register_detector, register_suggester)
+from .core import Engine
+from .pipeline import FrameResult, RecognitionPipeline
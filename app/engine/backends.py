@@ -0,0 +1,146 @@
+# app/engine/backends.py
+"""
+Swappable parts of the engine, looked up by name like the model backends in
+app/model_registry.py:
+
+    DETECTORS    name → fn(max_hands, **options) → object with detect_hands / draw
+    DECODERS     name → fn(LoadedModel) → decoder factory for the HandTracker
+                 (decoders have update(letter, conf), reset() and gate(letter))
+    SUGGESTERS   name → fn() → object with warm() and __call__(context, k)
+
+Classifiers are not listed here: they are registry entries
+(`python -m app.model_registry`), built by model_registry.BACKENDS.
+
+    @register_detector("my_detector")
+    def _mine(max_hands=1, **options):
+        return MyDetector(max_hands)
+"""
+import numpy as np
+
+try:                                    # python -m app.… (app/main.py, app/headless.py)
+    from app import suggestions
+    from app.camera import DetectedHands
+    from app.session_recorder import SessionTrace
+except ImportError:                     # gui_main.py runs from inside app/
+    import suggestions
+    from camera import DetectedHands
+    from session_recorder import SessionTrace
+
+from .pipeline import letter_decoders
+
+DETECTORS, DECODERS, SUGGESTERS = {}, {}, {}
+
+
+def _registrar(table):
+    def register(name):
+        def wrap(fn):
+            table[name] = fn
+            return fn
+        return wrap
+    return register
+
+
+register_detector = _registrar(DETECTORS)
+register_decoder = _registrar(DECODERS)
+register_suggester = _registrar(SUGGESTERS)
+
+
+def _lookup(table, kind, name):
+    try:
+        return table[name]
+    except KeyError:
+        raise ValueError(f"Unknown {kind} {name!r} (expected one of {sorted(table)})") from None
+
+
+def make_detector(spec, max_hands=1, **options):
+    """A registered detector by name, or `spec` itself if it already is one."""
+    if not isinstance(spec, str):
+        return spec
+    return _lookup(DETECTORS, "detector", spec)(max_hands, **options)
+
+
+def make_decoders(spec):
+    return spec if callable(spec) else _lookup(DECODERS, "decoder", spec)
+
+
+def make_suggester(spec):
+    if spec is None or not isinstance(spec, str):
+        return spec
+    return _lookup(SUGGESTERS, "suggester", spec)()
+
+
+# ── Detectors ──────────────────────────────────────────────────────────────
+@register_detector("mediapipe")
+def _mediapipe(max_hands=1, detection_confidence=0.3, tracking_confidence=0.3, **options):
+    try:
+        from app.camera import HandDetector
+    except ImportError:
+        from camera import HandDetector
+    return HandDetector(max_hands=max_hands, detection_confidence=detection_confidence,
+                        tracking_confidence=tracking_confidence, **options)
+
+
+class TraceDetector:
+    """
+    HandDetector stand-in that replays the landmarks of a session trace,
+    one recorded frame per call (no hands once the trace runs out).
+    """
+    def __init__(self, path):
+        self.trace = SessionTrace(path)
+        self.index = 0
+
+    def __len__(self):
+        return len(self.trace)
+
+    def detect_hands(self, img, draw=True, rgb=None):
+        n = 0
+        landmarks = np.zeros((0, 21, 3), np.float32)
+        if self.index < len(self.trace):
+            record = self.trace.records[self.index]
+            n = int(record["n_hands"])
+            landmarks = np.array(record["landmarks"][:n], np.float32)
+        self.index += 1
+        h, w = img.shape[:2]
+        pixels = (landmarks[:, :, :2] * np.array([w, h], np.float32)).astype(np.int32)
+        found = DetectedHands(landmarks, pixels, [""] * n, [])
+        if draw:
+            self.draw(img, found)
+        return img, found
+
+    def draw(self, img, found):
+        for hand in found.pixels:
+            for x, y in hand:
+                img[max(y - 1, 0):y + 2, max(x - 1, 0):x + 2] = (0, 255, 0)
+
+
+@register_detector("trace")
+def _trace(max_hands=1, path=None):
+    if not path:
+        raise ValueError("The trace detector needs path=<session trace>")
+    return TraceDetector(path)
+
+
+# ── Decoders ───────────────────────────────────────────────────────────────
+register_decoder("letter")(letter_decoders)
+
+
+# ── Suggestions ────────────────────────────────────────────────────────────
+class LanguageModelSuggester:
+    """Next-word suggestions from app/suggestions.py on one of its backends."""
+    def __init__(self, backend=suggestions.DEFAULT_BACKEND):
+        self.backend_name = backend
+        self.backend = None
+
+    def warm(self):
+        suggestions.get_tokenizer()
+        backend = suggestions.get_backend(self.backend_name)
+        # the default backend goes through get_suggestions' cache
+        self.backend = None if self.backend_name == suggestions.DEFAULT_BACKEND else backend
+        return self
+
+    def __call__(self, context, k=3):
+        return suggestions.get_suggestions(context, k, self.backend)
+
+
+for _name in suggestions.BACKENDS:
+    register_suggester(_name)(lambda name=_name: LanguageModelSuggester(name))
@@ -0,0 +1,198 @@
+# app/engine/core.py
+"""Engine: the one recognition stack every entry point builds (see app/engine/__init__.py)."""
+import time
+import numpy as np
+
+try:                                    # python -m app.… (app/main.py, app/headless.py)
+    from app.decoder import apply_token, follow_tracks
+    from app.governor import FrameGovernor
+    from app.metrics import METRICS, FrameMetrics, start_server
+    from app.model_registry import LiveModel, ModelRegistry, legacy_entries
+    from app.personalize import USER_DIR, load_user
+    from app.session_recorder import SessionRecorder
+except ImportError:                     # gui_main.py runs from inside app/
+    from decoder import apply_token, follow_tracks
+    from governor import FrameGovernor
+    from metrics import METRICS, FrameMetrics, start_server
+    from model_registry import LiveModel, ModelRegistry, legacy_entries
+    from personalize import USER_DIR, load_user
+    from session_recorder import SessionRecorder
+
+from .backends import make_decoders, make_detector, make_suggester
+from .pipeline import RecognitionPipeline
+
+
+class Engine:
+    def __init__(self, registry="models/registry.json", classifier="cnn", hybrid=False,
+                 image_budget_ms=100.0, max_hands=1, detector="mediapipe",
+                 detector_options=None, decoder="letter", suggester=None, record=None,
+                 record_meta=None, metrics=METRICS, metrics_port=0, target_ms=0.0,
+                 camera_fps=None, camera_buffer=None, draw=True, user_dir=USER_DIR):
+        self.registry_path = registry
+        self.classifier_name = classifier     # legacy default until the registry names one
+        self.hybrid = hybrid
+        self.image_budget_ms = image_budget_ms
+        self.max_hands = max_hands
+        self.detector_spec = detector         # DETECTORS name or a detector object
+        self.detector_options = detector_options or {}
+        self.decoder_spec = decoder           # DECODERS name or fn(LoadedModel) → factory
+        self.suggester_spec = suggester       # SUGGESTERS name, suggester object or None
+        self.record = record
+        self.record_meta = record_meta or {}
+        self.metrics_registry = metrics       # MetricsRegistry, or None for no metrics
+        self.metrics_port = metrics_port
+        self.target_ms = target_ms            # 0 = no frame-rate governor
+        self.camera_fps = camera_fps          # None: read off the capture (FrameGovernor)
+        self.camera_buffer = camera_buffer
+        self.draw = draw
+        self.user_dir = user_dir              # per-user adapters (app/personalize.py)
+        self.pipeline = None
+        self.governor = None
+        self.suggester = None
+        self.sentences = {}                   # track id (0 in single-hand mode) → sentence
+        self.load_s = self.warm_s = 0.0
+
+    # ── Lifecycle ─────────────────────────────────────────────────────────
+    def load(self):
+        """Models, detector, trace recorder, metrics and governor; returns self."""
+        t0 = time.perf_counter()
+        self.registry = ModelRegistry(self.registry_path, defaults=legacy_entries(
+            self.classifier_name == "student", self.hybrid))
+        self.landmark_model = LiveModel(self.registry, "landmark", max_hands=self.max_hands)
+        self.image_model = LiveModel(self.registry, "image") if self.hybrid else None
+        calibration = self.landmark_model.current.calibration
+        if calibration.fitted:
+            print(f"📐 Calibration: T={calibration.temperature:.2f}, "
+                  f"{len(calibration.per_class)} letters with faster gates")
+
+        self.detector = make_detector(self.detector_spec, self.max_hands,
+                                      **self.detector_options)
+        frame_metrics = None
+        if self.metrics_registry is not None:
+            frame_metrics = FrameMetrics(self.metrics_registry)
+            if self.metrics_port:
+                start_server(self.metrics_port, registry=self.metrics_registry)
+        recorder = None
+        if self.record:
+            recorder = SessionRecorder(self.record, self.landmark_model.model.class_names,
+                                       self.max_hands, model=self.landmark_model.current.key,
+                                       **self.record_meta)
+            print(f"🎞️ Recording session trace to {self.record}")
+        self.pipeline = RecognitionPipeline(self.detector, self.landmark_model, self.image_model,
+                                            self.image_budget_ms, recorder, frame_metrics,
+                                            self.draw, make_decoders(self.decoder_spec))
+        if self.target_ms:
+            self.governor = FrameGovernor(self.target_ms, camera_fps=self.camera_fps,
+                                          camera_buffer=self.camera_buffer,
+                                          registry=self.metrics_registry)
+        self._camera_checked = False
+        self.suggester = make_suggester(self.suggester_spec)
+        self.load_s = time.perf_counter() - t0
+        return self
+
+    def warm(self, shape=(480, 640, 3)):
+        """
+        Pay the first-call costs before the first frame: detector graph, one
+        classifier batch of max_hands, the suggestion model. Frames, tracks
+        and traces are untouched.
+        """
+        t0 = time.perf_counter()
+        warm = getattr(self.detector, "warm", None)    # a trace replay has nothing to warm
+        if warm:
+            warm(shape)
+        self.classifier.predict_batch(np.zeros((self.max_hands, 63), np.float32))
+        if self.suggester is not None:
+            self.suggester.warm()
+        self.warm_s = time.perf_counter() - t0
+        return self
+
+    def close(self):
+        if self.pipeline:
+            self.pipeline.close()
+        if self.governor:
+            stats = self.governor.stats
+            print(f"⏱️ Governor: {stats['idle_frames']}/{stats['frames']} frames in low power, "
+                  f"{stats['over_target']} over {self.target_ms:.0f} ms "
+                  f"(rate stepped down {stats['rate_down']}x, up {stats['rate_up']}x), "
+                  f"{stats['stale_dropped']} stale frames skipped")
+
+    def __enter__(self):
+        return self.load().warm()
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ── Frames ────────────────────────────────────────────────────────────
+    def read(self, cap):
+        """cap.read() after dropping frames the governor expects to be stale."""
+        if self.governor and hasattr(cap, "grab"):     # the frame bus always hands out the newest
+            if not self._camera_checked:
+                self.governor.configure_camera(cap)
+                self._camera_checked = True
+            for _ in range(self.governor.stale_frames()):
+                cap.grab()
+        ok, frame = cap.read()
+        if self.pipeline.metrics:
+            self.pipeline.metrics.read(ok, cap)
+        return ok, frame
+
+    def process(self, frame, rgb=None):
+        """One BGR frame → FrameResult; committed tokens also update `sentences`."""
+        result = self.pipeline.process(frame, rgb)
+        self._apply(result)
+        return result
+
+    def process_batch(self, frames, rgbs=None):
+        """Consecutive frames with one classifier call → [FrameResult]."""
+        results = self.pipeline.process_batch(frames, rgbs)
+        for result in results:
+            self._apply(result)
+        return results
+
+    def _apply(self, result):
+        if self.max_hands > 1:
+            follow_tracks(self.sentences, result.tracks, result.live)
+        for track, _, _, token in result.hands():
+            if token is not None:
+                key = track.id if self.max_hands > 1 else 0
+                self.sentences[key] = apply_token(self.sentences.get(key, ""), token)
+
+    def pace(self, frame_ms, hands, default_ms=10):
+        """Milliseconds to wait before the next frame."""
+        if not self.governor:
+            return default_ms
+        return self.governor.update(frame_ms, hands)
+
+    def personalize(self, user_id):
+        """Load `user_id`'s adapter (None: back to the shared model); returns it or None."""
+        adapter = load_user(user_id, self.user_dir) if user_id is not None else None
+        if adapter is not None and not adapter.compatible(self.landmark_model.model,
+                                                          self.model_key):
+            print(f"⚠️ Personalisation for {user_id} was fitted on another model; not used")
+            adapter = None
+        self.pipeline.set_adapter(adapter)
+        if self.pipeline.adapter is not None:
+            print(f"👤 Personalised for {user_id}: {len(adapter.idx)} letters, "
+                  f"α={adapter.alpha} ({adapter.features})")
+        elif adapter is not None:
+            print(f"👤 {user_id}: the shared model already reads these hands (α=0)")
+        return adapter
+
+    def suggest(self, context, k=3):
+        return self.suggester(context, k) if self.suggester is not None else []
+
+    # ── Parts ─────────────────────────────────────────────────────────────
+    @property
+    def classifier(self):
+        return self.landmark_model.model
+
+    @property
+    def recorder(self):
+        return self.pipeline.recorder
+
+    @property
+    def model_key(self):
+        return self.landmark_model.current.key
+
+    def pixels(self, result, i):
+        return self.pipeline.pixels(result, i)
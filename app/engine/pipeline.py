@@ -0,0 +1,219 @@
+# app/engine/pipeline.py
+"""
+The per-frame recognition core behind app/engine.Engine:
+
+    detect hands → classify (landmarks, or the hybrid cascade) → track
+    → per-track letter decoder → session trace + metrics
+
+`RecognitionPipeline.process(frame)` does one frame and returns a
+FrameResult; `process_batch(frames)` does a run of consecutive frames with
+one classifier call for all of their hands. What to do with the committed
+tokens and how to show the frame stay with the caller. Models come from
+app/model_registry.LiveModel and are hot-swapped between frames.
+"""
+import time
+from functools import partial
+import numpy as np
+
+try:                                    # python -m app.… (app/main.py, app/headless.py)
+    from app.camera import DetectedHands
+    from app.decoder import LetterDecoder
+    from app.hand_tracker import HandTracker
+    from app.hybrid import HybridRecognizer
+    from app.personalize import PersonalizedClassifier
+except ImportError:                     # gui_main.py runs from inside app/
+    from camera import DetectedHands
+    from decoder import LetterDecoder
+    from hand_tracker import HandTracker
+    from hybrid import HybridRecognizer
+    from personalize import PersonalizedClassifier
+
+
+def letter_decoders(loaded):
+    """Decoder factory for a LoadedModel: the vote decoder with its calibrated gates."""
+    # Temperature is already on the classifier; the gates come with the model
+    return partial(LetterDecoder, **loaded.calibration.decoder_kwargs())
+
+
+class FrameResult:
+    """Everything one frame produced; lists are aligned per recognised hand."""
+    __slots__ = ("seq", "frame", "found", "letters", "confs", "probs", "sources", "recovered",
+                 "tracks", "tokens", "live", "detect_ms", "classify_ms", "frame_ms")
+
+    def __init__(self, seq, frame, found):
+        self.seq, self.frame, self.found = seq, frame, found
+        self.letters, self.confs, self.probs, self.sources = [], [], None, []
+        self.recovered = []                           # hybrid.LastSeen per image-only answer
+        self.tracks, self.tokens = [], []
+        self.live = ()                                # ids of tracks alive after this frame
+        self.detect_ms = self.classify_ms = self.frame_ms = 0.0
+
+    def hands(self):
+        """(track, letter, conf, token) per recognised hand."""
+        return zip(self.tracks, self.letters, self.confs, self.tokens)
+
+
+class RecognitionPipeline:
+    def __init__(self, detector, landmark_model, image_model=None, image_budget_ms=100.0,
+                 recorder=None, metrics=None, draw=True, decoders=letter_decoders):
+        self.detector = detector
+        self.landmark_model = landmark_model          # LiveModel
+        self.image_model = image_model                # LiveModel or None (no image fallback)
+        self.recorder = recorder
+        self.metrics = metrics                        # app.metrics.FrameMetrics or None
+        self.draw = draw
+        self.decoders = decoders                      # LoadedModel → decoder factory
+        self.seq = 0
+        self.adapter = None                           # per-user head (app/personalize.py)
+        self._personal = None
+        self.tracker = HandTracker(decoders(landmark_model.current))
+        self.hybrid = None
+        if image_model is not None:
+            self.hybrid = HybridRecognizer(landmark_model.model, image_model.model,
+                                           budget_ms=image_budget_ms)
+            image_model.on_swap = self._on_image_swap
+        landmark_model.on_swap = self._on_landmark_swap
+
+    @property
+    def classifier(self):
+        return self._personal or self.landmark_model.model
+
+    def set_adapter(self, adapter):
+        """Apply a UserAdapter on top of the landmark model from the next frame (None = off)."""
+        self.adapter = adapter if adapter is not None and adapter.alpha > 0 else None
+        base = self.landmark_model.model
+        self._personal = PersonalizedClassifier(base, self.adapter) if self.adapter else None
+        if self.hybrid:
+            self.hybrid.landmarks = self.classifier
+
+    def _on_landmark_swap(self, old, new):
+        """Runs between frames (LiveModel.poll), so no frame mixes two models."""
+        if self.adapter and not self.adapter.compatible(new.model, new.key):
+            print("⚠️ The user's personalisation was fitted on another model; switched off")
+            self.adapter = None
+        self.set_adapter(self.adapter)
+        self.tracker.set_decoder_factory(self.decoders(new))
+        if self.recorder and list(new.model.class_names) != list(old.model.class_names):
+            self.recorder.close()
+            self.recorder = None
+            print("⚠️ Class list changed with the new model; session trace stopped")
+
+    def _on_image_swap(self, old, new):
+        self.hybrid.image = new.model
+
+    def _poll(self):
+        self.landmark_model.poll()     # installs a new model once it has warmed up elsewhere
+        if self.image_model:
+            self.image_model.poll()
+
+    def _detect(self, frame, rgb):
+        # landmarks are drawn after classification so image-CNN crops see the clean frame
+        return self.detector.detect_hands(frame, draw=False, rgb=rgb)
+
+    def _finish(self, result, centroids, t_frame, batch=None, earlier_ms=0.0):
+        """Draw, track, decode, then trace + metrics for a classified frame."""
+        if self.draw:
+            self.detector.draw(result.frame, result.found)
+        result.tracks = self.tracker.update(centroids if len(result.letters) else [])
+        result.live = tuple(self.tracker.tracks)
+        if self.hybrid:
+            self.hybrid.remember(result.tracks, result.found, result.live)
+        result.tokens = [track.decoder.update(letter, conf)
+                         for track, letter, conf in zip(result.tracks, result.letters, result.confs)]
+        result.frame_ms = (time.perf_counter() - t_frame) * 1e3 + earlier_ms
+        if self.recorder:
+            landmarks = result.found.landmarks
+            if result.recovered:                      # image-only answers: their last landmarks
+                landmarks = np.concatenate([landmarks, [h.landmarks for h in result.recovered]])
+            self.recorder.record(result.seq, landmarks,
+                                 [t.id for t in result.tracks], result.probs, result.tokens,
+                                 result.detect_ms, result.classify_ms, result.frame_ms)
+        if self.metrics:
+            self.metrics.frame(len(result.found) if batch is None else 0,
+                               result.detect_ms, result.classify_ms, result.frame_ms)
+        return result
+
+    def process(self, frame, rgb=None):
+        """Recognise one BGR frame (drawn on in place when draw=True)."""
+        self.seq += 1
+        self._poll()
+        t_frame = time.perf_counter()
+
+        frame, found = self._detect(frame, rgb)
+        t_detect = t_classify = time.perf_counter()
+        result = FrameResult(self.seq, frame, found)
+
+        centroids = ()
+        if self.hybrid:
+            (result.letters, result.confs, result.probs,
+             centroids, result.sources) = self.hybrid.classify(frame, found)
+            result.recovered = self.hybrid.recovered
+            t_classify = time.perf_counter()
+        elif len(found):
+            result.letters, result.confs, result.probs = self.classifier.predict_batch(found.vectors())
+            result.sources = ["landmarks"] * len(result.letters)
+            centroids = found.centroids()
+            t_classify = time.perf_counter()
+
+        result.detect_ms = (t_detect - t_frame) * 1e3
+        result.classify_ms = (t_classify - t_detect) * 1e3
+        return self._finish(result, centroids, t_frame)
+
+    def process_batch(self, frames, rgbs=None):
+        """
+        Recognise consecutive frames with one classifier call for every hand
+        in them; tracking and decoding still run frame by frame, in order.
+        The hybrid cascade budgets per frame, so it falls back to process().
+        """
+        rgbs = rgbs if rgbs is not None else [None] * len(frames)
+        if self.hybrid:
+            return [self.process(frame, rgb) for frame, rgb in zip(frames, rgbs)]
+        self._poll()
+
+        results = []
+        for frame, rgb in zip(frames, rgbs):
+            self.seq += 1
+            t_frame = time.perf_counter()
+            frame, found = self._detect(frame, rgb)
+            # the detector reuses its buffers, so keep this frame's hands
+            found = DetectedHands(found.landmarks.copy(), found.pixels.copy(),
+                                  list(found.handedness), list(found.raw))
+            result = FrameResult(self.seq, frame, found)
+            result.detect_ms = (time.perf_counter() - t_frame) * 1e3
+            results.append(result)
+
+        counts = [len(r.found) for r in results]
+        total = sum(counts)
+        t_classify = time.perf_counter()
+        if total:
+            vectors = np.concatenate([r.found.vectors() for r in results])
+            letters, confs, probs = self.classifier.predict_batch(vectors)
+            # the one call's cost is shared out over the frames that had hands
+            share_ms = (time.perf_counter() - t_classify) * 1e3 / sum(1 for c in counts if c)
+            offsets = np.cumsum([0, *counts])
+            for r, a, b in zip(results, offsets[:-1], offsets[1:]):
+                if a == b:
+                    continue
+                r.letters, r.confs, r.probs = list(letters[a:b]), confs[a:b], probs[a:b]
+                r.sources = ["landmarks"] * (b - a)
+                r.classify_ms = share_ms
+            if self.metrics:
+                self.metrics.batch.observe(total)
+
+        for r in results:
+            # frame_ms: detect + this frame's share of classification + its own tracking / decoding
+            self._finish(r, r.found.centroids() if len(r.letters) else (), time.perf_counter(),
+                         batch=total, earlier_ms=r.detect_ms + r.classify_ms)
+        return results
+
+    def pixels(self, result, i):
+        """Landmark pixels of hand i, or the last seen box for an image-only answer."""
+        n = len(result.found)
+        return result.found.pixels[i] if i < n else result.recovered[i - n].pixels
+
+    def close(self):
+        if self.hybrid:
+            print(f"🖼️ Image CNN fallback: {self.hybrid.stats['image_calls']} calls, "
+                  f"{self.hybrid.cost_per_frame_ms():.2f} ms/frame on average")
+        if self.recorder:
+            self.recorder.close()
@@ -0,0 +1,398 @@
+# app/frame_bus.py
+"""
+Shared-memory frame bus: one process owns the camera, any number read it.
+
+A capture service publishes every frame into a ring of slots in one
+`multiprocessing.shared_memory` block. Each slot holds the BGR frame, its
+RGB conversion (done once here instead of in every consumer), a capture
+timestamp and a sequence number. The producer never waits for readers;
+readers look frames up by sequence number and get read-only views straight
+into shared memory.
+
+Layout of the block:
+
+    header   8 x int64    magic, width, height, slots, latest seq, writer pid, closed, -
+    seqs     slots int64  seq held by each slot (-1 while it is being written)
+    stamps   slots f64    capture time (time.time())
+    bgr      slots x H x W x 3 uint8
+    rgb      slots x H x W x 3 uint8
+
+Seqlock rule: a frame view is only good while `reader.valid(frame)` holds -
+the ring wraps after `slots` frames, so check it after using a view (or pass
+`copy=True`, which only returns copies that were not overwritten mid-copy).
+
+    python -m app.frame_bus --source 0                # webcam 0
+    python -m app.frame_bus --source synthetic --fps 30
+    python -m app.main --bus sign2voice_frames        # recogniser reads the bus
+"""
+import argparse, multiprocessing as mp, os, sys, time
+from multiprocessing import shared_memory
+import numpy as np
+import cv2
+
+DEFAULT_NAME = "sign2voice_frames"
+MAGIC = 0x53325646   # "S2VF"
+_H_MAGIC, _H_WIDTH, _H_HEIGHT, _H_SLOTS, _H_LATEST, _H_PID, _H_CLOSED = range(7)
+_HEADER = 8
+
+
+def _layout(buf, width, height, slots):
+    header = np.ndarray((_HEADER,), np.int64, buf, 0)
+    off = header.nbytes
+    seqs = np.ndarray((slots,), np.int64, buf, off)
+    off += seqs.nbytes
+    stamps = np.ndarray((slots,), np.float64, buf, off)
+    off += stamps.nbytes
+    bgr = np.ndarray((slots, height, width, 3), np.uint8, buf, off)
+    off += bgr.nbytes
+    rgb = np.ndarray((slots, height, width, 3), np.uint8, buf, off)
+    return header, seqs, stamps, bgr, rgb
+
+
+def _block_size(width, height, slots):
+    return 8 * _HEADER + 16 * slots + 2 * slots * height * width * 3
+
+
+def _attach(name):
+    """Attach without letting this process's resource tracker unlink the block on exit."""
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        from multiprocessing import resource_tracker
+        resource_tracker.unregister(shm._name, "shared_memory")
+    except Exception:
+        pass
+    return shm
+
+
+def _alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except (PermissionError, OSError):
+        pass
+    return True
+
+
+class Frame:
+    __slots__ = ("seq", "timestamp", "bgr", "rgb")
+
+    def __init__(self, seq, timestamp, bgr, rgb):
+        self.seq = seq
+        self.timestamp = timestamp
+        self.bgr = bgr
+        self.rgb = rgb
+
+
+class FrameBusWriter:
+    def __init__(self, width, height, slots=8, name=DEFAULT_NAME):
+        try:
+            # A crashed producer leaves its block behind; take the name over
+            stale = _attach(name)
+            header = np.ndarray((_HEADER,), np.int64, stale.buf, 0)
+            pid, closed = int(header[_H_PID]), int(header[_H_CLOSED])
+            del header
+            if pid and not closed and _alive(pid):
+                stale.close()
+                raise RuntimeError(f"Frame bus {name!r} is already published by pid {pid}")
+            stale.close()
+            stale.unlink()
+        except FileNotFoundError:
+            pass
+        self.shm = shared_memory.SharedMemory(name=name, create=True,
+                                              size=_block_size(width, height, slots))
+        self.name = name
+        self.size = (width, height)
+        self.header, self.seqs, self.stamps, self.bgr, self.rgb = _layout(
+            self.shm.buf, width, height, slots)
+        self.seqs[:] = 0
+        self.header[:] = 0
+        self.header[[_H_WIDTH, _H_HEIGHT, _H_SLOTS, _H_PID]] = width, height, slots, os.getpid()
+        self.header[_H_MAGIC] = MAGIC          # last: readers wait for it
+        self.slots = slots
+        self.seq = 0
+
+    def publish(self, frame, timestamp=None):
+        """Copy one BGR frame into the next slot; returns its sequence number."""
+        if frame.shape[1::-1] != self.size:
+            frame = cv2.resize(frame, self.size)
+        seq = self.seq + 1
+        i = seq % self.slots
+        self.seqs[i] = -1                       # readers treat the slot as torn
+        np.copyto(self.bgr[i], frame)
+        cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self.rgb[i])
+        self.stamps[i] = time.time() if timestamp is None else timestamp
+        self.seqs[i] = seq
+        self.header[_H_LATEST] = seq
+        self.seq = seq
+        return seq
+
+    def close(self):
+        self.header[_H_CLOSED] = 1
+        del self.header, self.seqs, self.stamps, self.bgr, self.rgb
+        self.shm.close()
+        # Readers spawned from this process share its resource tracker and
+        # _attach() took the name out of it; put it back so unlink() balances
+        from multiprocessing import resource_tracker
+        resource_tracker.register(self.shm._name, "shared_memory")
+        self.shm.unlink()
+
+
+class FrameBusReader:
+    def __init__(self, name=DEFAULT_NAME, timeout=5.0):
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                self.shm = _attach(name)
+                header = np.ndarray((_HEADER,), np.int64, self.shm.buf, 0)
+                if header[_H_MAGIC] == MAGIC:
+                    break
+                del header
+                self.shm.close()
+            except FileNotFoundError:
+                pass
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"No frame bus named {name!r}")
+            time.sleep(0.05)
+        width, height, slots = (int(v) for v in header[[_H_WIDTH, _H_HEIGHT, _H_SLOTS]])
+        del header
+        self.header, self.seqs, self.stamps, self.bgr, self.rgb = _layout(
+            self.shm.buf, width, height, slots)
+        for a in (self.bgr, self.rgb):
+            a.flags.writeable = False
+        self.size = (width, height)
+        self.slots = slots
+
+    @property
+    def latest_seq(self):
+        return int(self.header[_H_LATEST])
+
+    @property
+    def closed(self):
+        return bool(self.header[_H_CLOSED])
+
+    def get(self, seq, copy=False):
+        """Frame `seq` if it is still in the ring, else None."""
+        i = seq % self.slots
+        if seq <= 0 or self.seqs[i] != seq:
+            return None
+        stamp = float(self.stamps[i])
+        bgr, rgb = self.bgr[i], self.rgb[i]
+        if copy:
+            bgr, rgb = bgr.copy(), rgb.copy()
+            if self.seqs[i] != seq:             # overwritten while copying
+                return None
+        return Frame(seq, stamp, bgr, rgb)
+
+    def valid(self, frame):
+        """True while the slot behind `frame`'s views still holds that frame."""
+        return self.seqs[frame.seq % self.slots] == frame.seq
+
+    def latest(self, copy=False):
+        for _ in range(3):
+            frame = self.get(self.latest_seq, copy)
+            if frame is not None:
+                return frame
+        return None
+
+    def wait(self, after_seq, timeout=1.0, copy=False):
+        """Newest frame with seq > after_seq; None on timeout or when the bus closes."""
+        deadline = time.monotonic() + timeout
+        while self.latest_seq <= after_seq:
+            if self.closed or time.monotonic() > deadline:
+                return None
+            time.sleep(0.001)
+        return self.latest(copy)
+
+    def close(self):
+        del self.header, self.seqs, self.stamps, self.bgr, self.rgb
+        self.shm.close()
+
+
+class BusCapture:
+    """
+    cv2.VideoCapture stand-in for the live loops. `read()` returns a private
+    BGR copy (the loops draw on it); `last_rgb` is a private copy of the same
+    frame's RGB conversion, so MediaPipe needs no colour conversion. Both
+    copies are checked against the seqlock together: a frame the writer
+    lapped mid-copy is dropped for the next one, at most `retries` times.
+    """
+    def __init__(self, name=DEFAULT_NAME, timeout=1.0, retries=3):
+        self.reader = FrameBusReader(name)
+        self.timeout = timeout
+        self.retries = retries
+        self.seq = 0
+        self.skipped = 0                        # frames published but never read (loop too slow)
+        self.last_rgb = None
+        w, h = self.reader.size
+        self._frame = np.empty((h, w, 3), np.uint8)
+        self._rgb = np.empty((h, w, 3), np.uint8)
+
+    def isOpened(self):
+        return not self.reader.closed
+
+    def read(self):
+        for _ in range(self.retries):
+            frame = self.reader.wait(self.seq, self.timeout)
+            if frame is None:
+                return False, None
+            np.copyto(self._frame, frame.bgr)
+            np.copyto(self._rgb, frame.rgb)
+            if self.reader.valid(frame):        # else lapped while copying - take the next one
+                break
+        else:
+            return False, None
+        if self.seq and frame.seq > self.seq + 1:
+            self.skipped += frame.seq - self.seq - 1
+        self.seq, self.last_rgb = frame.seq, self._rgb
+        return True, self._frame
+
+    def release(self):
+        self.last_rgb = None
+        self.reader.close()
+
+
+class SyntheticSource:
+    """
+    Camera stand-in: a moving gradient with the frame index stamped into the
+    first 8 bytes of row 0 (channel 0), so readers can check what they got.
+    """
+    def __init__(self, width=640, height=480, fps=30, frames=None):
+        self.size = (width, height)
+        self.fps = fps
+        self.frames = frames
+        self.index = 0
+        self._base = (np.add.outer(np.arange(height), np.arange(width)) % 256).astype(np.uint8)
+        self._next = time.monotonic()
+
+    @staticmethod
+    def stamp_of(frame):
+        return int(np.frombuffer(frame[0, :8, 0].tobytes(), np.int64)[0])
+
+    def isOpened(self):
+        return self.frames is None or self.index < self.frames
+
+    def read(self):
+        if not self.isOpened():
+            return False, None
+        if self.fps:
+            self._next += 1.0 / self.fps
+            time.sleep(max(0.0, self._next - time.monotonic()))
+        w, h = self.size
+        frame = np.empty((h, w, 3), np.uint8)
+        shift = np.uint8(self.index % 256)
+        frame[..., 0] = self._base + shift
+        frame[..., 1] = 255 - self._base
+        frame[..., 2] = shift
+        frame[0, :8, 0] = np.frombuffer(np.int64(self.index).tobytes(), np.uint8)
+        self.index += 1
+        return True, frame
+
+    def release(self):
+        pass
+
+
+class ImageFolderSource:
+    """The images in a folder (sorted by name) as a cv2.VideoCapture-like source."""
+    EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp", ".webp")
+
+    def __init__(self, folder, fps=0, frames=None, loop=False):
+        self.paths = sorted(os.path.join(folder, f) for f in os.listdir(folder)
+                            if f.lower().endswith(self.EXTENSIONS))
+        if frames is not None:
+            self.paths = self.paths[:frames]
+        self.fps = fps
+        self.loop = loop
+        self.index = 0
+        self._next = time.monotonic()
+
+    def isOpened(self):
+        return bool(self.paths) and (self.loop or self.index < len(self.paths))
+
+    def read(self):
+        while self.isOpened():
+            path = self.paths[self.index % len(self.paths)]
+            self.index += 1
+            frame = cv2.imread(path)
+            if frame is None:               # unreadable file: skip it
+                continue
+            if self.fps:
+                self._next += 1.0 / self.fps
+                time.sleep(max(0.0, self._next - time.monotonic()))
+            return True, frame
+        return False, None
+
+    def release(self):
+        pass
+
+
+def open_source(spec, width=640, height=480, fps=30, frames=None):
+    """'synthetic', an image folder, a camera index or a video path / URL."""
+    if spec == "synthetic":
+        return SyntheticSource(width, height, fps, frames)
+    if os.path.isdir(str(spec)):
+        return ImageFolderSource(spec, fps, frames)
+    return cv2.VideoCapture(int(spec) if str(spec).isdigit() else spec)
+
+
+def run_capture(source, name=DEFAULT_NAME, slots=8, width=640, height=480, fps=30,
+                frames=None, stop=None, ready=None):
+    """Capture loop: read the source and publish until it ends or `stop` is set."""
+    cap = open_source(source, width, height, fps, frames)
+    ok, frame = cap.read()
+    if not ok:
+        raise RuntimeError(f"Could not read from source {source!r}")
+    h, w = frame.shape[:2]
+    writer = FrameBusWriter(w, h, slots, name)
+    if ready is not None:
+        ready.set()
+    try:
+        while ok and not (stop is not None and stop.is_set()):
+            writer.publish(frame)
+            ok, frame = cap.read()
+    finally:
+        cap.release()
+        writer.close()
+    return writer.seq
+
+
+class CaptureService:
+    """run_capture in a child process; start() returns once the bus exists."""
+    def __init__(self, source="0", name=DEFAULT_NAME, slots=8, **kw):
+        ctx = mp.get_context("spawn")
+        self.stop_event, self.ready = ctx.Event(), ctx.Event()
+        self.name = name
+        self.process = ctx.Process(target=run_capture, args=(source, name, slots),
+                                   kwargs=dict(kw, stop=self.stop_event, ready=self.ready),
+                                   daemon=True)
+
+    def start(self, timeout=10.0):
+        self.process.start()
+        if not self.ready.wait(timeout):
+            self.stop()
+            raise RuntimeError("Capture service did not start")
+        return self
+
+    def stop(self, timeout=5.0):
+        self.stop_event.set()
+        self.process.join(timeout)
+        if self.process.is_alive():
+            self.process.terminate()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Publish a camera / video / synthetic source")
+    parser.add_argument("--source", default="0", help="Camera index, video path, image folder or 'synthetic'")
+    parser.add_argument("--name", default=DEFAULT_NAME)
+    parser.add_argument("--slots", type=int, default=8)
+    parser.add_argument("--width", type=int, default=640, help="Synthetic source only")
+    parser.add_argument("--height", type=int, default=480, help="Synthetic source only")
+    parser.add_argument("--fps", type=float, default=30, help="Synthetic source / image folder (0 = unpaced)")
+    args = parser.parse_args()
+    print(f"📡 Publishing {args.source} on shared memory '{args.name}' (Ctrl+C to stop)")
+    try:
+        run_capture(args.source, args.name, args.slots, args.width, args.height, args.fps)
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,138 @@
+# app/governor.py
+"""
+Adaptive frame-rate governor for the live loops.
+
+Instead of rescheduling every frame after a fixed 10 ms, the loop asks the
+governor how long to wait. It keeps a smoothed frame latency (reported
+against `target_ms`) and paces the loop:
+
+* rate        - frames are paced to the active rate `fps`; the wait is what
+                is left of the frame period after the frame's own work.
+* adaptive    - while the smoothed latency is over `target_ms` the active
+                rate steps down (x`step`, not below `min_fps`), so a slow
+                CPU processes fewer frames instead of queueing behind them;
+                once latency is under `headroom` x target it steps back up
+                to `max_fps`. At most one step per `hold_s`.
+                `min_fps=max_fps` pins the rate.
+* low power   - no hand for `idle_after_s` seconds drops to `idle_fps`; the
+                first frame with a hand ramps straight back up.
+* freshness   - a webcam keeps a few frames in its driver buffer, so a loop
+                slower than the camera (or waking from low power) would read
+                stale frames and latency would grow by the whole buffer.
+                `stale_frames()` estimates that backlog; grab() them away
+                before read(). The estimate needs the camera's rate and
+                buffer depth: given, or read off the capture by
+                `configure_camera` (CAP_PROP_FPS / CAP_PROP_BUFFERSIZE).
+                Unknown means no grabs - a grab() on an empty buffer blocks
+                for a whole camera frame.
+
+The detector input is not downscaled: MediaPipe Hands resizes to its own
+fixed model inputs, so a smaller frame saves little of its cost.
+
+    governor = FrameGovernor(target_ms=50)
+    governor.configure_camera(cap)
+    ...
+    for _ in range(governor.stale_frames()):
+        cap.grab()
+    ok, frame = cap.read()
+    ...
+    delay_ms = governor.update(frame_ms, hands)
+    root.after(delay_ms, update_frame)
+"""
+import time
+
+ACTIVE, IDLE = "active", "idle"
+
+
+class FrameGovernor:
+    def __init__(self, target_ms=50.0, max_fps=30.0, idle_fps=5.0, idle_after_s=2.0,
+                 smoothing=0.2, camera_fps=None, camera_buffer=None, registry=None,
+                 min_fps=10.0, step=0.75, headroom=0.7, hold_s=0.5):
+        self.target_ms = target_ms
+        self.max_fps, self.idle_fps = max_fps, idle_fps
+        self.min_fps = min(min_fps, max_fps)
+        self.step, self.headroom, self.hold_s = step, headroom, hold_s
+        self.fps = max_fps                # active rate, adapted to latency
+        self._last_step = None
+        self.idle_after_s = idle_after_s
+        self.alpha = smoothing
+        self.mode = ACTIVE
+        self.latency_ms = None            # smoothed frame latency
+        self._last_hand = None
+        self.camera_fps, self.camera_buffer = camera_fps, camera_buffer   # None = unknown
+        self._backlog = 0.0               # frames estimated to be waiting in the driver buffer
+        self._last_read = None
+        self.stats = {"frames": 0, "idle_frames": 0, "over_target": 0, "wakeups": 0,
+                      "stale_dropped": 0, "rate_down": 0, "rate_up": 0}
+        if registry is not None:
+            registry.gauge("sign2voice_governor_idle", "1 while in the low-power no-hand rate",
+                           fn=lambda: int(self.mode == IDLE))
+            registry.gauge("sign2voice_governor_latency_ms", "Smoothed frame latency in ms",
+                           fn=lambda: self.latency_ms)
+            registry.gauge("sign2voice_governor_fps", "Active frame rate the loop is paced to",
+                           fn=lambda: self.fps)
+
+    def configure_camera(self, cap):
+        """Fill in the camera rate / buffer depth not given explicitly from a cv2 capture."""
+        import cv2
+        if self.camera_fps is None:
+            fps = cap.get(cv2.CAP_PROP_FPS)
+            self.camera_fps = fps if fps > 0 else None
+        if self.camera_buffer is None:
+            depth = cap.get(cv2.CAP_PROP_BUFFERSIZE)
+            self.camera_buffer = int(depth) if depth > 0 else None
+
+    def stale_frames(self, now=None):
+        """Call right before read(): buffered frames older than the newest, to grab() away."""
+        if not self.camera_fps or not self.camera_buffer:
+            return 0
+        now = time.monotonic() if now is None else now
+        if self._last_read is not None:
+            arrived = (now - self._last_read) * self.camera_fps
+            self._backlog = min(float(self.camera_buffer), self._backlog + arrived)
+        self._last_read = now
+        stale = max(0, int(self._backlog) - 1)
+        self._backlog = max(0.0, self._backlog - stale - 1)     # minus the frame read() takes
+        self.stats["stale_dropped"] += stale
+        return stale
+
+    def update(self, frame_ms, hands, now=None):
+        """Record one frame; returns the delay in ms before the next one (>= 1)."""
+        now = time.monotonic() if now is None else now
+        self.stats["frames"] += 1
+        if self.latency_ms is None:
+            self.latency_ms = frame_ms
+        else:
+            self.latency_ms += self.alpha * (frame_ms - self.latency_ms)
+        if self.latency_ms > self.target_ms:
+            self.stats["over_target"] += 1
+        self._adapt(now)
+
+        if hands:
+            self._last_hand = now
+            if self.mode == IDLE:
+                self.mode = ACTIVE
+                self.stats["wakeups"] += 1
+        elif self._last_hand is None:
+            self._last_hand = now
+        elif self.mode == ACTIVE and now - self._last_hand >= self.idle_after_s:
+            self.mode = IDLE
+        if self.mode == IDLE:
+            self.stats["idle_frames"] += 1
+
+        fps = min(self.idle_fps, self.fps) if self.mode == IDLE else self.fps
+        return max(1, int(1e3 / fps - frame_ms))
+
+    def _adapt(self, now):
+        """One step of the active rate toward what the latency allows."""
+        if self._last_step is not None and now - self._last_step < self.hold_s:
+            return
+        if self.latency_ms > self.target_ms and self.fps > self.min_fps:
+            self.fps = max(self.min_fps, self.fps * self.step)
+            self.stats["rate_down"] += 1
+        elif self.latency_ms < self.headroom * self.target_ms and self.fps < self.max_fps:
+            self.fps = min(self.max_fps, self.fps / self.step)
+            self.stats["rate_up"] += 1
+        else:
+            return
+        self._last_step = now
@@ -1,44 +1,92 @@
 import os
 import cv2
-import json
 import time
-import numpy as np
-import tensorflow as tf
-import mediapipe as mp
-from collections import deque, Counter
 import tkinter as tk
 from tkinter import ttk
 from PIL import Image, ImageTk
 import requests
 import uuid
+import queue
 import sys
 import io
 
 # Fix Unicode print issues for Windows
 sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 
-from tts import speak
-from suggestions import get_suggestions
+from tts import speak, speaking as tts_speaking
+from suggestions import DEFAULT_BACKEND as SUGG_BACKEND, cache_hit_rate
+from engine import Engine
+from frame_bus import BusCapture
+from outbox import SentenceOutbox
+from history import HistoryView, HistoryCache
+from metrics import METRICS
 
 # ---------------- Paths ----------------
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-MODEL_PATH = os.path.join(BASE_DIR, "models", "landmark_cnn.h5")
-CLASSES_PATH = os.path.join(BASE_DIR, "models", "landmark_classes.json")
-
-# ---------------- Load Model ----------------
-print("Loading TensorFlow model...")
-model = tf.keras.models.load_model(MODEL_PATH)
-print("Loading class names...")
-class_names = json.load(open(CLASSES_PATH))
-
-# ---------------- MediaPipe Hands ----------------
-print("Initializing MediaPipe...")
-mp_hands = mp.solutions.hands
-hands = mp_hands.Hands(static_image_mode=False,
-                       max_num_hands=1,
-                       min_detection_confidence=0.3,
-                       min_tracking_confidence=0.3)
-mp_draw = mp.solutions.drawing_utils
+# The repo's models/ folder, shared with app/main.py and the training scripts
+MODELS_DIR = os.path.join(os.path.dirname(BASE_DIR), "models")
+# Models and which one is live (python -m app.model_registry); editing it
+# switches the running GUI over without a restart
+REGISTRY_PATH = os.path.join(MODELS_DIR, "registry.json")
+
+# Used until the registry names a landmark model: "cnn" (Keras teacher) or
+# "student" (distilled NumPy MLP)
+CLASSIFIER = os.environ.get("SIGN2VOICE_CLASSIFIER", "cnn")
+
+# Shared-memory frame bus to read instead of the webcam (python -m app.frame_bus)
+FRAME_BUS = os.environ.get("SIGN2VOICE_FRAME_BUS")
+
+# Session trace file, or a directory for one trace per session (off when unset)
+RECORD_PATH = os.environ.get("SIGN2VOICE_RECORD")
+
+# "1" = fall back to the image CNN on hand crops when landmarks fail or are unsure,
+# within SIGN2VOICE_IMAGE_BUDGET_MS milliseconds of compute per second
+HYBRID = os.environ.get("SIGN2VOICE_HYBRID") == "1"
+IMAGE_BUDGET_MS = float(os.environ.get("SIGN2VOICE_IMAGE_BUDGET_MS", "100"))
+
+# Hands classified per frame (all in one batched forward pass)
+MAX_HANDS = int(os.environ.get("SIGN2VOICE_MAX_HANDS", "1"))
+
+# Prometheus-style /metrics on 127.0.0.1 (read by the Node /api/health); "0" = off
+METRICS_PORT = int(os.environ.get("SIGN2VOICE_METRICS_PORT", "9470"))
+
+# Frame-rate governor (paced to 30 fps, stepped down toward 10 fps while latency
+# is over this and back up once under, low-power rate while no hand is in view,
+# stale camera frames skipped); "0" = fixed 10 ms reschedule
+TARGET_MS = float(os.environ.get("SIGN2VOICE_TARGET_MS", "50"))
+
+# Webcam rate and driver buffer for the stale-frame estimate; unset = read from
+# the camera (no frames are skipped if it doesn't say)
+CAMERA_FPS = (float(os.environ["SIGN2VOICE_CAMERA_FPS"])
+              if "SIGN2VOICE_CAMERA_FPS" in os.environ else None)
+CAMERA_BUFFER = (int(os.environ["SIGN2VOICE_CAMERA_BUFFER"])
+                 if "SIGN2VOICE_CAMERA_BUFFER" in os.environ else None)
+
+# Per-user classifier adapters (python -m app.personalize), loaded at login
+USER_DIR = os.environ.get("SIGN2VOICE_USER_DIR", os.path.join(MODELS_DIR, "users"))
+
+# ---------------- Recognition Engine ----------------
+# Models (temperature + per-letter gates from `python -m models.calibrate` come
+# with them), MediaPipe, session trace, metrics and the frame-rate governor
+print("Loading models...")
+session_id = str(uuid.uuid4())
+trace_path = None
+if RECORD_PATH:
+    trace_path = (os.path.join(RECORD_PATH, f"session-{session_id}.s2v")
+                  if os.path.isdir(RECORD_PATH) else RECORD_PATH)
+engine = Engine(REGISTRY_PATH, CLASSIFIER, HYBRID, IMAGE_BUDGET_MS, MAX_HANDS,
+                suggester=SUGG_BACKEND, record=trace_path,
+                record_meta=dict(session_id=session_id), metrics_port=METRICS_PORT,
+                target_ms=TARGET_MS, camera_fps=CAMERA_FPS, camera_buffer=CAMERA_BUFFER,
+                user_dir=USER_DIR).load()
+METRICS.gauge("sign2voice_tts_speaking", "1 while the speech engine is speaking",
+              fn=tts_speaking)
+METRICS.gauge("sign2voice_suggestion_cache_hit_ratio",
+              "Share of suggestion requests answered from the cache", fn=cache_hit_rate)
+
+# ---------------- Warm-up ----------------
+print("Loading suggestion model...")
+engine.warm()                     # MediaPipe graph, classifier batch, suggestion model
 print("SIGN2VOICE_READY")
 
 # ---------------- Tkinter GUI ----------------
@@ -62,16 +110,21 @@ COLORS = {
     'btn_exit': '#4d4d4d', 'btn_exit_hover': '#686868',    
 }
 
+# ---------------- Sentence Outbox ----------------
+# Status lines come from the outbox's worker thread; update_frame shows them
+outbox_notes = queue.SimpleQueue()
+outbox = SentenceOutbox("http://localhost:5000", on_status=outbox_notes.put)
+
 # ---------------- Global Variables ----------------
 jwt_token = None
 user_info = None
-sentence = ""
-session_id = str(uuid.uuid4())
-pred_buffer = deque(maxlen=10)
-buffer_vote = 6
-last_added = ""
+# engine.sentences entry the buttons act on: 0 with one hand, else the track
+# that committed last (each hand has its own sentence, as in app/main.py)
+sentence_key = 0
+shown_keys = ()
 last_sugg_time = 0
 SUGG_INTERVAL = 5
+HISTORY_PAGE_SIZE = 50
 last_ctx_used = ""
 
 # ---------------- Helper: Hover Button ----------------
@@ -106,7 +159,7 @@ tk.Label(login_frame, textvariable=login_feedback, fg="red", bg=COLORS['bg_prima
 
 # ---------------- GUI after login ----------------
 def initialize_gui_after_login():
-    global video_panel, current_var, sentence_var, sugg_btns, sugg_text, sentence, cap
+    global video_panel, current_var, sentence_var, outbox_var, sugg_btns, sugg_text, cap
     
     login_frame.pack_forget()
     
@@ -134,6 +187,10 @@ def initialize_gui_after_login():
                              wraplength=900, justify='left')
     sentence_label.pack(anchor='w')
 
+    outbox_var = tk.StringVar(value="")
+    tk.Label(status_frame, textvariable=outbox_var, font=("Segoe UI", 10),
+             fg=COLORS['text_secondary'], bg=COLORS['bg_primary']).pack(anchor='w')
+
     # ---------------- Smart Suggestions ----------------
     sugg_btns = []
     sugg_text = [tk.StringVar(value="") for _ in range(3)]
@@ -189,26 +246,40 @@ def initialize_gui_after_login():
         root.grid_columnconfigure(i, weight=1)
 
     # ---------------- Webcam ----------------
-    cap = cv2.VideoCapture(0)
+    cap = BusCapture(FRAME_BUS) if FRAME_BUS else cv2.VideoCapture(0)
     update_frame()
 
 # ---------------- Functions ----------------
+# The engine builds the sentences from committed letters; the buttons edit them there
+def current_sentence():
+    return engine.sentences.get(sentence_key, "")
+
+def set_sentence(text):
+    engine.sentences[sentence_key] = text
+    show_sentences()
+
+def show_sentences():
+    global shown_keys
+    shown_keys = tuple(engine.sentences)
+    if len(engine.sentences) <= 1:
+        sentence_var.set(f"Sentence: {current_sentence()}")
+    else:
+        sentence_var.set("\n".join(f"{'▶' if key == sentence_key else '   '} #{key}: {text}"
+                                   for key, text in engine.sentences.items()))
+
 def clear_sentence():
-    global sentence
-    sentence = ""
-    sentence_var.set("Sentence:")
+    set_sentence("")
     update_suggestion_buttons([])
 
 def speak_sentence():
-    speak(sentence)
+    speak(current_sentence())
 
 def add_suggestion(word):
-    global sentence
     if word:
+        sentence = current_sentence()
         if sentence and not sentence.endswith(" "):
             sentence += " "
-        sentence += word + " "
-        sentence_var.set(f"Sentence: {sentence}")
+        set_sentence(sentence + word + " ")
         update_suggestion_buttons([])
         reset_suggestion_timer()
 
@@ -239,7 +310,7 @@ def reset_suggestion_timer():
 
 def maybe_fetch_suggestions():
     global last_sugg_time, last_ctx_used
-    ctx_words = sentence.strip().split()[-5:]
+    ctx_words = current_sentence().strip().split()[-5:]
     if not ctx_words:
         update_suggestion_buttons([])
         return
@@ -249,7 +320,7 @@ def maybe_fetch_suggestions():
         last_sugg_time = now
         last_ctx_used = ctx
         try:
-            raw = get_suggestions(ctx)
+            raw = engine.suggest(ctx)
             filtered = [w for w in raw if is_valid_suggestion(w)]
             update_suggestion_buttons(filtered[:3])
         except Exception as e:
@@ -257,115 +328,79 @@ def maybe_fetch_suggestions():
             update_suggestion_buttons([])
 
 def save_sentence_to_db():
-    global sentence
-    if not sentence.strip():
+    # Journaled locally and delivered in the background by the outbox
+    sentence = current_sentence().strip()
+    if not sentence:
         return
-    try:
-        headers = {"Authorization": f"Bearer {jwt_token}"} if jwt_token else {}
-        response = requests.post(
-            "http://localhost:5000/api/sentences/",
-            json={"text": sentence.strip(), "sessionId": session_id, "source": "gui"},
-            headers=headers,
-            timeout=10
-        )
-        if response.status_code in [200, 201]:
-            print(f"✅ Saved sentence: {sentence.strip()}")
-        else:
-            print(f"❌ Failed to save: {response.status_code}, {response.text}")
-    except Exception as e:
-        print("❌ Error saving sentence:", e)
+    outbox.enqueue(sentence, session_id, token=jwt_token, source="gui")
+    print(f"📝 Queued sentence: {sentence}")
+
+def fetch_history_page(cursor=None):
+    """One page of the user's history, newest first → (sentences, next_cursor)."""
+    headers = {"Authorization": f"Bearer {jwt_token}"} if jwt_token else {}
+    params = {"limit": HISTORY_PAGE_SIZE}
+    if cursor:
+        params["cursor"] = cursor
+    response = requests.get("http://localhost:5000/api/sentences/", headers=headers,
+                            params=params, timeout=10)
+    if response.status_code != 200:
+        raise RuntimeError(f"Failed to fetch history ({response.status_code})")
+    data = response.json()
+    return data.get("sentences", []), data.get("pagination", {}).get("nextCursor")
 
 def view_history():
-    history_window = tk.Toplevel(root)
-    history_window.title("Your Sentence History")
-    history_window.geometry("600x400")
-    history_window.configure(bg=COLORS['bg_primary'])
-
-    tk.Label(history_window, text="📜 Your Saved Sentences", font=("Segoe UI", 14, "bold"),
-             fg=COLORS['text_primary'], bg=COLORS['bg_primary']).pack(pady=10)
-
-    canvas = tk.Canvas(history_window, bg=COLORS['bg_primary'])
-    scrollbar = tk.Scrollbar(history_window, orient="vertical", command=canvas.yview)
-    scrollable_frame = tk.Frame(canvas, bg=COLORS['bg_primary'])
-
-    scrollable_frame.bind(
-        "<Configure>",
-        lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-    )
-
-    canvas.create_window((0,0), window=scrollable_frame, anchor="nw")
-    canvas.configure(yscrollcommand=scrollbar.set)
-
-    canvas.pack(side="left", fill="both", expand=True)
-    scrollbar.pack(side="right", fill="y")
-
-    try:
-        headers = {"Authorization": f"Bearer {jwt_token}"} if jwt_token else {}
-        response = requests.get("http://localhost:5000/api/sentences/", headers=headers, timeout=10)
-        if response.status_code == 200:
-            data = response.json()
-            sentences_list = data.get("sentences", [])
-            if not sentences_list:
-                tk.Label(scrollable_frame, text="No history found.", fg="white", bg=COLORS['bg_primary']).pack(pady=5)
-            else:
-                for s in sentences_list:
-                    ts = s.get("createdAt", "").split("T")[0]
-                    text_val = s.get("text", "")
-                    tk.Label(scrollable_frame, text=f"[{ts}] {text_val}",
-                             fg="white", bg=COLORS['bg_secondary'],
-                             wraplength=550, justify='left', anchor='w', padx=5, pady=2).pack(fill='x', pady=2)
-        else:
-            tk.Label(scrollable_frame, text="Failed to fetch history.", fg="red", bg=COLORS['bg_primary']).pack(pady=5)
-    except Exception as e:
-        tk.Label(scrollable_frame, text=f"Error: {e}", fg="red", bg=COLORS['bg_primary']).pack(pady=5)
+    user_key = (user_info or {}).get("id") or (user_info or {}).get("email")
+    HistoryView(root, fetch_history_page, HistoryCache(user_key), COLORS)
 
 # ---------------- Webcam Frame Update ----------------
 def update_frame():
-    global sentence, last_added
-    ok, frame = cap.read()
+    global sentence_key
+    ok, frame = engine.read(cap)
+    t_start = time.perf_counter()       # read() waits on the camera; not our latency
     if not ok:
         root.after(10, update_frame)
         return
 
-    results = hands.process(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
-
-    if results.multi_hand_landmarks:
-        hand = results.multi_hand_landmarks[0]
-        lm_vec = [c for p in hand.landmark for c in (p.x, p.y, p.z)]
-        preds = model.predict(np.expand_dims(lm_vec, 0), verbose=0)[0]
-        conf = preds.max()
-        letter = class_names[int(preds.argmax())]
-
-        if conf >= 0.8:
-            pred_buffer.append(letter)
-            vote, count = Counter(pred_buffer).most_common(1)[0]
-            if count >= buffer_vote and vote != last_added:
-                if vote == "space":
-                    sentence += " "
-                elif vote == "del":
-                    sentence = sentence[:-1]
-                else:
-                    sentence += vote
-                last_added = vote
-                pred_buffer.clear()
-                sentence_var.set(f"Sentence: {sentence}")
+    # the bus already holds the RGB conversion
+    result = engine.process(frame, rgb=getattr(cap, "last_rgb", None))
+    frame = result.frame
+
+    if MAX_HANDS > 1 and tuple(engine.sentences) != shown_keys:
+        # tracks came or went (decoder.follow_tracks); a hand back under a new id
+        # took its text along and is the newest entry
+        if sentence_key not in engine.sentences and engine.sentences:
+            sentence_key = list(engine.sentences)[-1]
+        show_sentences()
+
+    if len(result.letters):
+        current = []
+        for track, letter, conf, token in result.hands():
+            if token is not None:           # engine.process already applied it
+                if MAX_HANDS > 1:
+                    sentence_key = track.id
+                show_sentences()
                 reset_suggestion_timer()
-            current_var.set(f"Current: 💡 {letter} ({conf:.2f})")  
+            if conf >= track.decoder.gate(letter):
+                current.append(f"{letter} ({conf:.2f})" if len(result.letters) == 1
+                               else f"#{track.id} {letter} ({conf:.2f})")
+        if current:
+            current_var.set("Current: 💡 " + "  ".join(current))
 
-        mp_draw.draw_landmarks(frame, hand, mp_hands.HAND_CONNECTIONS)
-        cv2.putText(frame, f"{letter} ({conf:.2f})", (10, 40),
+        cv2.putText(frame, f"{result.letters[0]} ({result.confs[0]:.2f})", (10, 40),
                     cv2.FONT_HERSHEY_SIMPLEX, 1.5, (0, 255, 127), 2)
     else:
-        pred_buffer.clear()
-        last_added = ""
         current_var.set("Current: _")
 
+    while not outbox_notes.empty():
+        outbox_var.set(outbox_notes.get())
+
     maybe_fetch_suggestions()
     img = Image.fromarray(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
     imgtk = ImageTk.PhotoImage(image=img)
     video_panel.imgtk = imgtk
     video_panel.configure(image=imgtk)
-    root.after(10, update_frame)
+    root.after(engine.pace((time.perf_counter() - t_start) * 1e3, len(result.found)),
+               update_frame)
 
 # ---------------- Login Function ----------------
 def perform_login():
@@ -382,7 +417,9 @@ def perform_login():
         if response.status_code == 200:
             data = response.json()
             jwt_token = data.get("token")
+            outbox.set_token(jwt_token)       # sends what an expired login left behind
             user_info = data.get("user")
+            engine.personalize((user_info or {}).get("id") or email)
             initialize_gui_after_login()
         else:
             login_feedback.set("Login failed: Invalid credentials")
@@ -396,3 +433,7 @@ login_btn = tk.Button(login_frame, text="Login", font=("Segoe UI", 12, "bold"),
 login_btn.pack(pady=20)
 
 root.mainloop()
+
+# Give queued saves a moment to reach the server; the rest stay journaled
+outbox.close()
+engine.close()
@@ -0,0 +1,74 @@
+# app/hand_tracker.py
+"""
+Stable IDs for hands across frames.
+
+MediaPipe returns hands in arbitrary order, so each detection is matched to
+the nearest existing track by its landmark centroid (normalised image
+coordinates). Every track owns its own decoder so two hands - or two people -
+never share a vote buffer.
+"""
+import itertools
+import numpy as np
+
+
+class HandTrack:
+    def __init__(self, track_id, centroid, decoder):
+        self.id = track_id
+        self.centroid = centroid
+        self.decoder = decoder
+        self.missed = 0
+
+
+class HandTracker:
+    def __init__(self, decoder_factory, max_dist=0.2, max_missed=5):
+        self.decoder_factory = decoder_factory
+        self.max_dist = max_dist      # max centroid jump between frames
+        self.max_missed = max_missed  # frames a track survives without a hand
+        self.tracks = {}
+        self._ids = itertools.count(1)
+
+    def update(self, centroids):
+        """
+        Match this frame's hand centroids (N, 2) to tracks.
+        Returns the list of HandTrack objects aligned with `centroids`.
+        """
+        centroids = np.asarray(centroids, dtype=np.float32).reshape(-1, 2)
+        assigned = [None] * len(centroids)
+        free = dict(self.tracks)
+
+        if free and len(centroids):
+            ids = list(free)
+            prev = np.stack([free[i].centroid for i in ids])
+            dist = np.linalg.norm(centroids[:, None, :] - prev[None, :, :], axis=-1)
+            # Greedy: closest pairs first
+            for flat in np.argsort(dist, axis=None):
+                det, trk = divmod(int(flat), len(ids))
+                if dist[det, trk] > self.max_dist:
+                    break
+                if assigned[det] is None and ids[trk] in free:
+                    assigned[det] = free.pop(ids[trk])
+
+        for det, track in enumerate(assigned):
+            if track is None:
+                track = HandTrack(next(self._ids), centroids[det], self.decoder_factory())
+                self.tracks[track.id] = track
+                assigned[det] = track
+            track.centroid = centroids[det]
+            track.missed = 0
+
+        for track in free.values():
+            track.missed += 1
+            track.decoder.reset()
+            if track.missed > self.max_missed:
+                del self.tracks[track.id]
+
+        return assigned
+
+    def set_decoder_factory(self, decoder_factory):
+        """New decoder settings (e.g. after a model swap); tracks keep their ids."""
+        self.decoder_factory = decoder_factory
+        for track in self.tracks.values():
+            track.decoder = decoder_factory()
+
+    def reset(self):
+        self.tracks.clear()
@@ -0,0 +1,205 @@
+# app/headless.py
+"""
+Headless runner: the same recognition core as the Tk GUI and the OpenCV
+window (app/engine), without a display, a camera or a speaker.
+
+Frame sources (--source):
+    synthetic            moving gradient (app/frame_bus.SyntheticSource)
+    path/to/video.mp4    anything cv2.VideoCapture opens
+    path/to/folder/      the images in a folder, sorted by name
+    bus:NAME             a shared-memory frame bus (python -m app.frame_bus)
+    0                    webcam index
+
+Hands come from MediaPipe, or with --replay from a recorded session trace
+(app/session_recorder.py), which needs neither MediaPipe nor a camera:
+
+    python -m app.headless --source synthetic --replay app/recordings/session.s2v \\
+        --classifier student --transcript out/transcript.jsonl --summary out/metrics.json
+
+Sinks:
+    --transcript PATH    JSONL: one line per frame with hands or commits, then a summary line
+    --summary PATH       JSON: throughput and per-stage latency at the end
+    --metrics_port PORT  Prometheus-style /metrics while running (app/metrics.py)
+
+--batch N classifies N frames' hands in one call (Engine.process_batch);
+tracking and decoding still go frame by frame, so the transcript matches.
+"""
+import argparse, json, os, time
+import numpy as np
+
+from app.decoder import apply_token, follow_tracks
+from app.engine import Engine
+from app.frame_bus import BusCapture, open_source
+from app.metrics import MetricsRegistry
+
+
+class JsonlSink:
+    """Per-frame transcript; frames without hands or commits are left out."""
+    def __init__(self, path, max_hands=1):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.f = open(path, "w")
+        self.max_hands = max_hands
+        # rebuilt here rather than read off the engine, which is a whole batch ahead
+        self.sentences = {}
+
+    def write(self, result):
+        if self.max_hands > 1:
+            follow_tracks(self.sentences, result.tracks, result.live)
+        for track, _, _, token in result.hands():
+            if token is not None:
+                key = track.id if self.max_hands > 1 else 0
+                self.sentences[key] = apply_token(self.sentences.get(key, ""), token)
+        if not len(result.letters) and not any(t is not None for t in result.tokens):
+            return
+        hands = [{"track": track.id, "letter": letter, "conf": round(float(conf), 4),
+                  "source": source, "token": token}
+                 for (track, letter, conf, token), source in zip(result.hands(), result.sources)]
+        sentences = {str(k): v for k, v in self.sentences.items()}
+        self.f.write(json.dumps({"seq": result.seq, "hands": hands,
+                                 "frame_ms": round(result.frame_ms, 3),
+                                 "sentences": sentences}) + "\n")
+
+    def close(self, summary):
+        self.f.write(json.dumps({"summary": summary}) + "\n")
+        self.f.close()
+
+
+def open_frames(spec, width, height, fps, frames):
+    if spec.startswith("bus:"):
+        return BusCapture(spec[4:])
+    return open_source(spec, width, height, fps, frames)
+
+
+def stage_summary(times_ms):
+    times_ms = np.asarray(times_ms, np.float64)
+    if not len(times_ms):
+        return {}
+    return {"mean": round(float(times_ms.mean()), 3),
+            "p50": round(float(np.percentile(times_ms, 50)), 3),
+            "p95": round(float(np.percentile(times_ms, 95)), 3)}
+
+
+def frames_of(cap, frame_metrics=None, limit=None):
+    n = 0
+    while limit is None or n < limit:
+        ok, frame = cap.read()
+        if frame_metrics:
+            frame_metrics.read(ok, cap)
+        if not ok:
+            return
+        n += 1
+        yield frame, getattr(cap, "last_rgb", None)
+
+
+def run(cap, engine, sinks=(), limit=None, batch=1):
+    """Feed every frame of `cap` through the engine; returns the summary dict."""
+    stages = {"detect": [], "classify": [], "frame": []}
+    frames = hands = 0
+    pending = []
+    t0 = time.perf_counter()
+
+    def flush():
+        nonlocal frames, hands
+        if batch > 1:
+            results = engine.process_batch([f for f, _ in pending], [r for _, r in pending])
+        else:
+            results = [engine.process(f, rgb) for f, rgb in pending]
+        pending.clear()
+        for result in results:
+            frames += 1
+            hands += len(result.letters)
+            stages["detect"].append(result.detect_ms)
+            stages["classify"].append(result.classify_ms)
+            stages["frame"].append(result.frame_ms)
+            for sink in sinks:
+                sink.write(result)
+
+    for frame, rgb in frames_of(cap, engine.pipeline.metrics, limit):
+        # a bus reader reuses its frame buffers on every read; copy if it has to wait for the batch
+        pending.append((frame.copy(), None) if batch > 1 and rgb is not None else (frame, rgb))
+        if len(pending) >= batch:
+            flush()
+    if pending:
+        flush()
+    elapsed = time.perf_counter() - t0
+
+    return {"frames": frames, "hands": hands, "seconds": round(elapsed, 3),
+            "fps": round(frames / elapsed, 2) if elapsed else None,
+            "latency_ms": {stage: stage_summary(v) for stage, v in stages.items()},
+            "sentences": {str(k): v for k, v in engine.sentences.items()}}
+
+
+def main(args):
+    if args.replay:
+        detector, options = "trace", {"path": args.replay}
+    else:
+        detector, options = "mediapipe", {}
+    # Own metrics registry: several headless runs in one process don't share counters
+    engine = Engine(args.registry, args.classifier, args.hybrid, args.image_budget_ms,
+                    args.hands, detector, options, record=args.record,
+                    record_meta=dict(source=args.source), metrics=MetricsRegistry(),
+                    metrics_port=args.metrics_port, draw=False,
+                    user_dir=args.user_dir).load().warm()
+    if args.user:
+        engine.personalize(args.user)
+    frames = args.frames or (len(engine.detector) if args.replay else None)
+    cap = open_frames(args.source, args.width, args.height, args.fps, frames)
+    sinks = [JsonlSink(args.transcript, args.hands)] if args.transcript else []
+
+    print(f"🎬 Headless run: {args.source} "
+          f"({'replaying ' + args.replay if args.replay else 'MediaPipe'}, "
+          f"model {engine.model_key}, batch {args.batch})")
+    try:
+        summary = run(cap, engine, sinks, frames, args.batch)
+    finally:
+        cap.release()
+        engine.close()
+    summary["model"] = engine.model_key
+    summary["user"] = args.user if engine.pipeline.adapter else None
+    summary["source"] = args.source
+
+    for sink in sinks:
+        sink.close(summary)
+    if args.summary:
+        os.makedirs(os.path.dirname(os.path.abspath(args.summary)), exist_ok=True)
+        with open(args.summary, "w") as f:
+            json.dump(summary, f, indent=2)
+
+    frame = summary["latency_ms"].get("frame") or {}
+    print(f"✅ {summary['frames']} frames in {summary['seconds']} s "
+          f"({summary['fps']} fps), {summary['hands']} hands, "
+          f"frame p50 {frame.get('p50', 0):.2f} ms / p95 {frame.get('p95', 0):.2f} ms")
+    for key, text in summary["sentences"].items():
+        print(f"   #{key}: {text}")
+    return summary
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Sign2Voice recognition without a UI")
+    parser.add_argument("--source", default="synthetic",
+                        help="'synthetic', video path, image folder, bus:NAME or camera index")
+    parser.add_argument("--replay", metavar="TRACE",
+                        help="Replay the hands of a session trace instead of running MediaPipe")
+    parser.add_argument("--frames", type=int,
+                        help="Stop after N frames (default: the whole source / trace)")
+    parser.add_argument("--fps", type=float, default=0,
+                        help="Pace synthetic / image-folder sources (0 = as fast as possible)")
+    parser.add_argument("--width", type=int, default=640, help="Synthetic source only")
+    parser.add_argument("--height", type=int, default=480, help="Synthetic source only")
+    parser.add_argument("--hands", type=int, default=1)
+    parser.add_argument("--batch", type=int, default=1,
+                        help="Frames per classifier call (Engine.process_batch)")
+    parser.add_argument("--classifier", choices=["cnn", "student"], default="cnn",
+                        help="Used unless the registry names a landmark model")
+    parser.add_argument("--registry", default="models/registry.json")
+    parser.add_argument("--hybrid", action="store_true",
+                        help="Image CNN fallback on hand crops (see app/hybrid.py)")
+    parser.add_argument("--image_budget_ms", type=float, default=100.0)
+    parser.add_argument("--user", help="Apply this user's adapter (python -m app.personalize)")
+    parser.add_argument("--user_dir", default="models/users")
+    parser.add_argument("--transcript", metavar="PATH", help="Write a JSONL transcript")
+    parser.add_argument("--summary", metavar="PATH", help="Write the run summary as JSON")
+    parser.add_argument("--record", metavar="PATH", help="Record a session trace to PATH")
+    parser.add_argument("--metrics_port", type=int, default=0,
+                        help="Serve Prometheus-style /metrics on 127.0.0.1:PORT (0 = off)")
+    main(parser.parse_args())
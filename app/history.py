@@ -0,0 +1,345 @@
+# app/history.py
+"""
+Sentence history window for the GUI.
+
+* HistoryCache  - pages already fetched are kept in a local SQLite file per
+                  user, so reopening the window is instant and only newer
+                  sentences (and older pages not yet seen) hit the server.
+                  Every refreshed page is reconciled by id: cached rows in
+                  its range that the server no longer returns (deleted from
+                  the web Dashboard) are dropped. Rows a refresh brings in
+                  are only cached once it has reached the old ones, so a
+                  failed refresh leaves no gap. ⟳ Reload starts over.
+* SearchIndex   - inverted word index over the cached history; the search
+                  box matches whole words, and the last word as a prefix.
+* HistoryView   - a virtualised list: a fixed pool of canvas items is
+                  re-used for whichever rows are visible, so a history of
+                  thousands of sentences costs the same as a screenful.
+                  Further pages are fetched on a worker thread as the user
+                  scrolls towards the end.
+"""
+import bisect, os, queue, re, sqlite3, threading
+from collections import defaultdict
+import tkinter as tk
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_DB = os.path.join(BASE_DIR, "history_cache.db")
+
+ROW_H = 28           # px per row
+PREFETCH_ROWS = 40   # start fetching the next page this close to the end
+
+
+class HistoryCache:
+    def __init__(self, user_key, db_path=DEFAULT_DB):
+        self.user = str(user_key or "anonymous")
+        self._db = sqlite3.connect(db_path)
+        self._db.executescript("""
+            CREATE TABLE IF NOT EXISTS sentences (
+                user TEXT, id TEXT, created_at TEXT, text TEXT,
+                PRIMARY KEY (user, id));
+            CREATE INDEX IF NOT EXISTS sentences_by_time
+                ON sentences (user, created_at DESC, id DESC);
+            CREATE TABLE IF NOT EXISTS state (
+                user TEXT PRIMARY KEY, next_cursor TEXT, complete INTEGER);
+        """)
+
+    def load(self):
+        """Cached rows (newest first), the cursor of the oldest page, complete flag."""
+        rows = [{"_id": i, "createdAt": c, "text": t} for i, c, t in self._db.execute(
+            "SELECT id, created_at, text FROM sentences WHERE user = ? "
+            "ORDER BY created_at DESC, id DESC", (self.user,))]
+        state = self._db.execute("SELECT next_cursor, complete FROM state WHERE user = ?",
+                                 (self.user,)).fetchone()
+        next_cursor, complete = state if state else (None, 0)
+        return rows, next_cursor, bool(complete)
+
+    def add(self, rows):
+        with self._db:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO sentences (user, id, created_at, text) VALUES (?, ?, ?, ?)",
+                [(self.user, r["_id"], r.get("createdAt", ""), r.get("text", "")) for r in rows])
+
+    def remove(self, ids):
+        with self._db:
+            self._db.executemany("DELETE FROM sentences WHERE user = ? AND id = ?",
+                                 [(self.user, i) for i in ids])
+
+    def clear(self):
+        with self._db:
+            self._db.execute("DELETE FROM sentences WHERE user = ?", (self.user,))
+            self._db.execute("DELETE FROM state WHERE user = ?", (self.user,))
+
+    def set_tail(self, next_cursor, complete):
+        with self._db:
+            self._db.execute("INSERT OR REPLACE INTO state (user, next_cursor, complete) "
+                             "VALUES (?, ?, ?)", (self.user, next_cursor, int(complete)))
+
+    def close(self):
+        self._db.close()
+
+
+class SearchIndex:
+    _word = re.compile(r"[a-z0-9']+")
+
+    def __init__(self):
+        self._postings = defaultdict(set)   # word → row ids
+        self._words = []                    # sorted, for prefix lookups
+        self._dirty = False
+
+    def add(self, row_id, text):
+        for w in set(self._word.findall(text.lower())):
+            if w not in self._postings:
+                self._dirty = True
+            self._postings[w].add(row_id)
+
+    def remove(self, row_id, text):
+        for w in set(self._word.findall(text.lower())):
+            ids = self._postings.get(w)
+            if ids is not None:
+                ids.discard(row_id)
+                if not ids:
+                    del self._postings[w]
+                    self._dirty = True
+
+    def search(self, query):
+        """Row ids matching every word of query (last word as a prefix), or None for no query."""
+        words = self._word.findall(query.lower())
+        if not words:
+            return None
+        if self._dirty:
+            self._words = sorted(self._postings)
+            self._dirty = False
+
+        *exact, prefix = words
+        lo = bisect.bisect_left(self._words, prefix)
+        hi = bisect.bisect_left(self._words, prefix + "\uffff")
+        ids = set().union(*(self._postings[w] for w in self._words[lo:hi]))
+        for w in exact:
+            ids &= self._postings.get(w, set())
+        return ids
+
+
+class HistoryView:
+    def __init__(self, root, fetch_page, cache, colors):
+        """fetch_page(cursor) → (sentences newest first, next_cursor) - called off the Tk thread."""
+        self.fetch_page = fetch_page
+        self.cache = cache
+        self.colors = colors
+
+        self.results = queue.Queue()
+        self.generation = 0                 # bumped by reload(); older fetches are ignored
+        self.loading = False
+        self.start(*cache.load())
+        self.pool = []                      # recycled (rect, text) canvas items
+
+        self.window = tk.Toplevel(root)
+        self.window.title("Your Sentence History")
+        self.window.geometry("600x400")
+        self.window.configure(bg=colors['bg_primary'])
+        self.window.protocol("WM_DELETE_WINDOW", self.close)
+
+        tk.Label(self.window, text="📜 Your Saved Sentences", font=("Segoe UI", 14, "bold"),
+                 fg=colors['text_primary'], bg=colors['bg_primary']).pack(pady=(10, 5))
+
+        self.query = tk.StringVar()
+        self.query.trace_add("write", lambda *_: self.apply_filter())
+        tk.Entry(self.window, textvariable=self.query, font=("Segoe UI", 11)).pack(
+            fill='x', padx=10, pady=(0, 5))
+
+        bar = tk.Frame(self.window, bg=colors['bg_primary'])
+        bar.pack(fill='x', padx=10)
+        self.status = tk.StringVar()
+        tk.Label(bar, textvariable=self.status, fg=colors['text_secondary'],
+                 bg=colors['bg_primary'], anchor='w').pack(side='left', fill='x', expand=True)
+        tk.Button(bar, text="⟳ Reload", command=self.reload, relief='flat', bd=0,
+                  bg=colors['bg_secondary'], fg=colors['text_primary'],
+                  cursor='hand2').pack(side='right')
+
+        body = tk.Frame(self.window, bg=colors['bg_primary'])
+        body.pack(fill='both', expand=True)
+        self.canvas = tk.Canvas(body, bg=colors['bg_primary'], highlightthickness=0)
+        self.scrollbar = tk.Scrollbar(body, orient="vertical", command=self.canvas.yview)
+        self.canvas.configure(yscrollcommand=self.on_scroll)
+        self.canvas.pack(side="left", fill="both", expand=True)
+        self.scrollbar.pack(side="right", fill="y")
+
+        self.canvas.bind("<Configure>", lambda e: self.render())
+        self.canvas.bind("<MouseWheel>",
+                         lambda e: self.canvas.yview_scroll(-1 if e.delta > 0 else 1, "units"))
+        self.canvas.bind("<Button-4>", lambda e: self.canvas.yview_scroll(-1, "units"))
+        self.canvas.bind("<Button-5>", lambda e: self.canvas.yview_scroll(1, "units"))
+        self.canvas.configure(yscrollincrement=ROW_H)
+
+        self.update_scrollregion()
+        self.load_next_page()
+        self.poll_results()
+
+    # ---------------- Data ----------------
+    def start(self, rows, cursor, complete):
+        self.rows, self.cursor, self.complete = rows, cursor, complete
+        self.known = {r["_id"] for r in self.rows}
+        self.index = SearchIndex()
+        for r in self.rows:
+            self.index.add(r["_id"], r["text"])
+        self.visible = self.rows            # rows after the search filter
+        self.refreshing = bool(self.rows)   # first fetch(es) pick up newer sentences
+        self.refresh_cursor = None
+        self.refresh_upper = None           # key of the last row refreshed so far
+        self.refresh_count = 0              # newer rows inserted so far
+        self.refresh_new = []               # cached once the refresh reaches the old rows
+
+    def reload(self):
+        """Drop the cache and fetch the history from the top."""
+        self.generation += 1
+        self.loading = False
+        self.cache.clear()
+        self.start([], None, False)
+        self.apply_filter()
+        self.load_next_page()
+
+    def load_next_page(self):
+        if self.loading or (self.complete and not self.refreshing):
+            return
+        self.loading = True
+        cursor = self.refresh_cursor if self.refreshing else self.cursor
+        self.update_status()
+
+        generation = self.generation
+
+        def work():
+            try:
+                self.results.put((generation,) + self.fetch_page(cursor) + (None,))
+            except Exception as e:
+                self.results.put((generation, [], None, e))
+        threading.Thread(target=work, daemon=True).start()
+
+    def poll_results(self):
+        if not self.window.winfo_exists():
+            return
+        try:
+            generation, page, next_cursor, error = self.results.get_nowait()
+        except queue.Empty:
+            self.window.after(50, self.poll_results)
+            return
+        if generation != self.generation:   # started before a reload
+            self.window.after(50, self.poll_results)
+            return
+
+        self.loading = False
+        if error is not None:
+            self.status.set(f"Error: {error}")
+            if self.refreshing:
+                self.refreshing = False      # offline: keep showing the cache
+            self.window.after(50, self.poll_results)
+            return
+
+        new = [r for r in page if r["_id"] not in self.known]
+        if self.refreshing:
+            self.reconcile(page, next_cursor)
+            # Newer sentences go on top; stop once we reach what we already have
+            self.rows = self.rows[:self.refresh_count] + new + self.rows[self.refresh_count:]
+            self.refresh_count += len(new)
+            self.refresh_cursor = next_cursor
+            self.refresh_new.extend(new)
+            if page:
+                self.refresh_upper = _key(page[-1])
+            if len(new) < len(page) or next_cursor is None:
+                self.refreshing = False
+                self.cache.add(self.refresh_new)
+                self.refresh_new = []
+        else:
+            self.rows.extend(new)
+            self.cursor, self.complete = next_cursor, next_cursor is None
+            self.cache.add(new)
+            self.cache.set_tail(self.cursor, self.complete)
+        for r in new:
+            self.known.add(r["_id"])
+            self.index.add(r["_id"], r.get("text", ""))
+
+        self.apply_filter()
+        self.window.after(50, self.poll_results)
+
+    def reconcile(self, page, next_cursor):
+        """Drop cached rows inside this page's range that the server didn't return."""
+        upper = self.refresh_upper                       # None: the top of the history
+        lower = _key(page[-1]) if page and next_cursor else None   # None: nothing older
+        returned = {r["_id"] for r in page}
+        gone = [r for r in self.rows
+                if r["_id"] not in returned and (upper is None or _key(r) < upper)
+                and (lower is None or _key(r) >= lower)]
+        if not gone:
+            return
+        ids = {r["_id"] for r in gone}
+        self.rows = [r for r in self.rows if r["_id"] not in ids]
+        self.refresh_count -= sum(1 for r in self.refresh_new if r["_id"] in ids)
+        self.refresh_new = [r for r in self.refresh_new if r["_id"] not in ids]
+        for r in gone:
+            self.known.discard(r["_id"])
+            self.index.remove(r["_id"], r.get("text", ""))
+        self.cache.remove(ids)
+
+    def apply_filter(self):
+        ids = self.index.search(self.query.get())
+        self.visible = self.rows if ids is None else [r for r in self.rows if r["_id"] in ids]
+        self.update_scrollregion()
+        self.update_status()
+
+    def update_status(self):
+        if self.loading:
+            text = "Loading…"
+        elif not self.rows:
+            text = "No history found."
+        else:
+            text = f"{len(self.visible)} of {len(self.rows)} sentences"
+            if not self.complete:
+                text += " (scroll for more)"
+        self.status.set(text)
+
+    # ---------------- Virtualised rendering ----------------
+    def update_scrollregion(self):
+        width = max(self.canvas.winfo_width(), 1)
+        self.canvas.configure(scrollregion=(0, 0, width, len(self.visible) * ROW_H))
+        self.render()
+
+    def on_scroll(self, first, last):
+        self.scrollbar.set(first, last)
+        self.render()
+        rows_left = (1.0 - float(last)) * len(self.visible)
+        if rows_left < PREFETCH_ROWS:
+            self.load_next_page()
+
+    def render(self):
+        height = self.canvas.winfo_height()
+        width = self.canvas.winfo_width()
+        needed = height // ROW_H + 2
+        while len(self.pool) < needed:
+            rect = self.canvas.create_rectangle(0, 0, 0, 0, fill=self.colors['bg_secondary'], width=0)
+            text = self.canvas.create_text(0, 0, anchor='w', fill="white", font=("Segoe UI", 10))
+            self.pool.append((rect, text))
+
+        first = int(self.canvas.canvasy(0) // ROW_H)
+        max_chars = max(width // 7, 10)
+        for slot, (rect, text) in enumerate(self.pool):
+            i = first + slot
+            if i >= len(self.visible) or slot >= needed:
+                self.canvas.itemconfigure(rect, state='hidden')
+                self.canvas.itemconfigure(text, state='hidden')
+                continue
+            s = self.visible[i]
+            label = f"[{s.get('createdAt', '').split('T')[0]}] {s.get('text', '')}"
+            if len(label) > max_chars:
+                label = label[:max_chars - 1] + "…"
+            y = i * ROW_H
+            self.canvas.coords(rect, 5, y + 2, width - 5, y + ROW_H - 2)
+            self.canvas.coords(text, 10, y + ROW_H / 2)
+            self.canvas.itemconfigure(text, text=label, state='normal')
+            self.canvas.itemconfigure(rect, state='normal')
+
+    def close(self):
+        self.cache.close()
+        self.window.destroy()
+
+
+def _key(row):
+    """The server's keyset order (createdAt, _id), newest first."""
+    return row.get("createdAt", ""), row["_id"]
@@ -0,0 +1,173 @@
+# app/hybrid.py
+"""
+Cascaded recogniser: landmark classifier first, image CNN as a fallback.
+
+* Fast path  - every detected hand goes through the landmark classifier.
+* Slow path  - the image CNN (app/recognizer.ASLRecognizer) on a square
+               crop around the hand, but only when a hand's landmark
+               confidence is below `low_conf`, or when MediaPipe lost the
+               hand and its last box is at most `max_age` frames old.
+               Last boxes are kept per HandTracker track (`remember`), so
+               with several hands each lost one is looked for where it
+               was. The more confident of the two answers wins. With
+               `full_frame=True` a lost hand with no recent box is looked
+               for in the whole frame (still images framed like the
+               training set).
+* Budget     - the slow path draws from a token bucket of
+               `budget_ms` milliseconds per second (measured cost), so it
+               can never take more than that share of the frame loop.
+
+Crops must come from an undrawn frame: detect with `draw=False` and draw
+the landmarks after `classify`.
+"""
+import time
+import numpy as np
+
+
+def square_crop(frame, pixels, pad=0.25):
+    """Square crop around (21, 2) landmark pixels, padded by `pad` of the box side."""
+    h, w = frame.shape[:2]
+    (x0, y0), (x1, y1) = pixels.min(axis=0), pixels.max(axis=0)
+    side = max(x1 - x0, y1 - y0) * (1 + 2 * pad)
+    cx, cy = (x0 + x1) / 2, (y0 + y1) / 2
+    x0, x1 = int(max(cx - side / 2, 0)), int(min(cx + side / 2, w))
+    y0, y1 = int(max(cy - side / 2, 0)), int(min(cy + side / 2, h))
+    if x1 - x0 < 8 or y1 - y0 < 8:
+        return None
+    return frame[y0:y1, x0:x1]
+
+
+class LastSeen:
+    """Where a tracked hand was last detected: raw landmarks, pixels, centroid."""
+    __slots__ = ("landmarks", "pixels", "centroid", "age", "whole")
+
+    def __init__(self, landmarks, pixels, centroid, whole=False):
+        self.landmarks, self.pixels, self.centroid = landmarks, pixels, centroid
+        self.age = 0                        # frames since MediaPipe last found it
+        self.whole = whole                  # full_frame look: crop nothing
+
+
+class HybridRecognizer:
+    def __init__(self, landmark_classifier, image_recognizer, low_conf=0.6,
+                 fallback_conf=0.9, budget_ms=100.0, max_age=10, pad=0.25, full_frame=False,
+                 match_dist=0.2):
+        self.landmarks = landmark_classifier
+        self.image = image_recognizer
+        self.low_conf = low_conf            # below this the image CNN gets a look
+        self.fallback_conf = fallback_conf  # image-only answers (no landmarks) must beat this
+        self.budget_ms = budget_ms          # slow-path milliseconds per second
+        self.max_age = max_age              # frames a lost hand's box stays usable
+        self.pad = pad
+        self.full_frame = full_frame
+        self.match_dist = match_dist        # a detected hand this close covers a remembered one
+        self.tokens = budget_ms             # bucket starts full (one second's worth)
+        self.last_time = None
+        self.seen = {}                      # track id → LastSeen of the hand's last detection
+        self.recovered = []                 # LastSeen of this frame's image-only answers
+        self.stats = {"frames": 0, "image_calls": 0, "image_ms": 0.0,
+                      "over_budget": 0, "overrides": 0, "recovered": 0}
+
+    def _refill(self, now):
+        if self.last_time is not None:
+            self.tokens = min(self.budget_ms,
+                              self.tokens + (now - self.last_time) * self.budget_ms)
+        self.last_time = now
+
+    def _image_predict(self, frame, pixels):
+        if self.tokens <= 0:
+            self.stats["over_budget"] += 1
+            return None, 0.0
+        crop = frame if pixels is None else square_crop(frame, pixels, self.pad)
+        if crop is None:
+            return None, 0.0
+        t0 = time.perf_counter()
+        letter, conf = self.image.predict(crop)
+        ms = (time.perf_counter() - t0) * 1e3
+        self.tokens -= ms
+        self.stats["image_calls"] += 1
+        self.stats["image_ms"] += ms
+        if letter in ("nothing", "?"):
+            return None, 0.0
+        return letter, float(conf)
+
+    def _probs_row(self, letter, conf, num_classes):
+        """An image answer as a row in the landmark classes' order, or None if not one of them."""
+        classes = list(self.landmarks.class_names)
+        if letter not in classes:
+            return None
+        row = np.full(num_classes, (1 - conf) / max(num_classes - 1, 1), np.float32)
+        row[classes.index(letter)] = conf
+        return row
+
+    def classify(self, frame, found, now=None):
+        """
+        Returns (letters, confs, probs, centroids, sources) for this frame,
+        one entry per detected hand and then one per recovered hand. An
+        image answer replaces the hand's probs row with one peaked at its
+        letter (the image CNN's confidence there, the rest spread evenly).
+        A lost hand recovered by the image CNN gets source "image" at its
+        last centroid, so the tracker keeps its track; its last landmarks
+        and pixels are in `self.recovered`, in the same order.
+        """
+        self._refill(time.monotonic() if now is None else now)
+        self.stats["frames"] += 1
+
+        letters, confs, probs = self.landmarks.predict_batch(found.vectors())
+        letters = list(letters)
+        confs = np.array(confs, dtype=np.float32)
+        probs = np.array(probs, dtype=np.float32)
+        num_classes = probs.shape[1]
+        centroids = found.centroids()
+        sources = ["landmarks"] * len(letters)
+        self.recovered = []
+
+        for i in np.flatnonzero(confs < self.low_conf):
+            letter, conf = self._image_predict(frame, found.pixels[i])
+            row = self._probs_row(letter, conf, num_classes) if letter is not None else None
+            if row is not None and conf > confs[i]:
+                letters[i], confs[i], probs[i], sources[i] = letter, conf, row, "image"
+                self.stats["overrides"] += 1
+
+        # Tracks whose hand MediaPipe didn't find this frame: look where it last was
+        lost = [hand for hand in self.seen.values()
+                if not len(found) or np.linalg.norm(centroids - hand.centroid, axis=1).min()
+                > self.match_dist]
+        for hand in lost:
+            hand.age += 1
+        lost = [hand for hand in lost if hand.age <= self.max_age]
+        if not lost and not len(found) and self.full_frame:
+            h, w = frame.shape[:2]
+            corners = np.tile(np.array([[0, 0], [w - 1, h - 1]], np.int32), (11, 1))[:21]
+            lost = [LastSeen(np.zeros((21, 3), np.float32), corners,
+                             np.array([0.5, 0.5], np.float32), whole=True)]
+
+        rows = []
+        for hand in lost:
+            letter, conf = self._image_predict(frame, None if hand.whole else hand.pixels)
+            row = self._probs_row(letter, conf, num_classes) if letter is not None else None
+            if row is not None and conf >= self.fallback_conf:
+                self.stats["recovered"] += 1
+                letters.append(letter)
+                confs = np.append(confs, np.float32(conf))
+                rows.append(row)
+                centroids = np.concatenate([centroids, hand.centroid[None, :]])
+                sources.append("image")
+                self.recovered.append(hand)
+        if rows:
+            probs = np.concatenate([probs, np.stack(rows)])
+        return letters, confs, probs, centroids, sources
+
+    def remember(self, tracks, found, live):
+        """
+        After tracking: keep each detected hand's box under its track id.
+        `tracks` is aligned with classify's output (detected hands first);
+        `live` are the tracker's current ids, anything else is forgotten.
+        """
+        for track, i in zip(tracks, range(len(found))):
+            self.seen[track.id] = LastSeen(found.landmarks[i].copy(), found.pixels[i].copy(),
+                                           found.landmarks[i, :, :2].mean(axis=0))
+        for track_id in [t for t in self.seen if t not in live]:
+            del self.seen[track_id]
+
+    def cost_per_frame_ms(self):
+        return self.stats["image_ms"] / max(self.stats["frames"], 1)
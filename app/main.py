@@ -1,84 +1,99 @@
-import cv2, json, time, numpy as np, tensorflow as tf
-import mediapipe as mp
-from collections import deque, Counter
-from app.tts import speak
-
-# ── Load model & class labels ──────────────────────────────────────────────
-model = tf.keras.models.load_model("models/landmark_cnn.h5")
-class_names = json.load(open("models/landmark_classes.json"))
-
-# ── Mediapipe setup ───────────────────────────────────────────────────────
-mp_hands = mp.solutions.hands
-hands = mp_hands.Hands(
-    static_image_mode=False,
-    max_num_hands=1,
-    min_detection_confidence=0.3,
-    min_tracking_confidence=0.3
-)
-mp_draw = mp.solutions.drawing_utils
+import argparse, time
+import cv2
+from app.tts import speak, speaking as tts_speaking
+from app.engine import Engine
+from app.frame_bus import BusCapture
+from app.metrics import METRICS
+
+parser = argparse.ArgumentParser(description="Sign2Voice real-time ASL (OpenCV window)")
+parser.add_argument("--hands", type=int, default=1,
+                    help="Max hands to track; each hand gets its own sentence")
+parser.add_argument("--classifier", choices=["cnn", "student"], default="cnn",
+                    help="Keras CNN or the distilled NumPy student (models/landmark_student.npz), "
+                         "unless the registry names a landmark model")
+parser.add_argument("--registry", default="models/registry.json",
+                    help="Model manifest (python -m app.model_registry); activating another "
+                         "model there swaps it in while running")
+parser.add_argument("--bus", metavar="NAME",
+                    help="Read frames from a shared-memory frame bus (python -m app.frame_bus) "
+                         "instead of opening the webcam")
+parser.add_argument("--record", metavar="PATH",
+                    help="Record a session trace (landmarks, softmax, timings, commits) to PATH")
+parser.add_argument("--hybrid", action="store_true",
+                    help="Fall back to the image CNN (models/asl_cnn.h5) on hand crops when "
+                         "landmarks fail or are unsure")
+parser.add_argument("--image_budget_ms", type=float, default=100.0,
+                    help="Milliseconds per second the image CNN fallback may use")
+parser.add_argument("--metrics_port", type=int, default=9470,
+                    help="Serve Prometheus-style /metrics on 127.0.0.1:PORT (0 = off)")
+parser.add_argument("--target_ms", type=float, default=50.0,
+                    help="Frame-rate governor: paced to 30 fps, stepped down toward 10 fps "
+                         "while latency is over this and back up once under, low-power rate "
+                         "with no hand in view, stale camera frames skipped (0 = no governor)")
+parser.add_argument("--camera_fps", type=float,
+                    help="Webcam frame rate for the stale-frame estimate (default: from the camera)")
+parser.add_argument("--camera_buffer", type=int,
+                    help="Webcam driver buffer in frames (default: from the camera; "
+                         "unknown = no frames skipped)")
+parser.add_argument("--user", help="Apply this user's adapter (python -m app.personalize fit)")
+parser.add_argument("--user_dir", default="models/users")
+args = parser.parse_args()
+
+# ── Engine: models, MediaPipe, trace, metrics, frame-rate governor ────────
+# Temperature + per-letter gates from `python -m models.calibrate` (if fitted)
+# come with each model
+engine = Engine(args.registry, args.classifier, args.hybrid, args.image_budget_ms, args.hands,
+                record=args.record, record_meta=dict(source=args.bus or "webcam"),
+                metrics_port=args.metrics_port, target_ms=args.target_ms,
+                camera_fps=args.camera_fps, camera_buffer=args.camera_buffer,
+                user_dir=args.user_dir).load().warm()
+if args.user:
+    engine.personalize(args.user)
+METRICS.gauge("sign2voice_tts_speaking", "1 while the speech engine is speaking",
+              fn=tts_speaking)
 
 # ── Webcam ────────────────────────────────────────────────────────────────
-cap = cv2.VideoCapture(0)
-
-sentence     = ""
-pred_buffer  = deque(maxlen=10)   # holds last 10 confident letters
-buffer_vote  = 6                  # how many times a letter must appear
-last_added   = ""                 # last letter actually added
+cap = BusCapture(args.bus) if args.bus else cv2.VideoCapture(0)
+sentences = engine.sentences             # track id (0 in single-hand mode) → sentence
 
 print("📸  Q=quit  C=clear  S=speak")
 
 while True:
-    ok, frame = cap.read()
+    ok, frame = engine.read(cap)
+    t_start = time.perf_counter()       # read() waits on the camera; not our latency
     if not ok:
         break
 
-    img_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-    results = hands.process(img_rgb)
-
+    # the bus already holds the RGB conversion
+    result = engine.process(frame, rgb=getattr(cap, "last_rgb", None))
+    frame = result.frame
     h, w, _ = frame.shape
 
-    if results.multi_hand_landmarks:
-        hand = results.multi_hand_landmarks[0]
-        lm_vec = [c for p in hand.landmark for c in (p.x, p.y, p.z)]
-        preds  = model.predict(np.expand_dims(lm_vec, 0), verbose=0)[0]
-        conf   = preds.max()
-        letter = class_names[int(preds.argmax())]
-
-        if conf > 0.8:
-            pred_buffer.append(letter)
-
-            # Majority vote in buffer
-            vote_letter, vote_count = Counter(pred_buffer).most_common(1)[0]
-            if vote_count >= buffer_vote and vote_letter != last_added:
-                # Map special tokens
-                if vote_letter == "space":
-                    sentence += " "
-                elif vote_letter == "del":
-                    sentence  = sentence[:-1]
-                else:
-                    sentence += vote_letter
-                last_added  = vote_letter
-                pred_buffer.clear()          # reset buffer after accepting
-
-            cv2.putText(frame, f"{letter} ({conf:.2f})",
-                        (10, 60), cv2.FONT_HERSHEY_SIMPLEX, 1.5,
+    for i, (track, letter, conf, token) in enumerate(result.hands()):
+        if conf >= track.decoder.gate(letter):
+            x0, y0 = engine.pixels(result, i).min(axis=0)
+            cv2.putText(frame, f"#{track.id} {letter} ({conf:.2f})",
+                        (int(x0), max(int(y0) - 10, 30)), cv2.FONT_HERSHEY_SIMPLEX, 1.2,
                         (0, 255, 0), 3)
 
-        mp_draw.draw_landmarks(frame, hand, mp_hands.HAND_CONNECTIONS)
-    else:
-        pred_buffer.clear()
-        last_added = ""
-
-    # ── Display sentence bar ────────────────────────────────────────────
-    cv2.rectangle(frame, (0, h-60), (w, h), (0,0,0), -1)
-    cv2.putText(frame, sentence, (10, h-20), cv2.FONT_HERSHEY_SIMPLEX,
-                1.2, (255,255,255), 2)
+    # ── Display sentence bar(s) ─────────────────────────────────────────
+    rows = sentences.items() if sentences else [(None, "")]
+    bar_h = 60 * len(rows)
+    cv2.rectangle(frame, (0, h-bar_h), (w, h), (0,0,0), -1)
+    for i, (tid, text) in enumerate(rows):
+        label = text if len(rows) == 1 else f"#{tid}: {text}"
+        cv2.putText(frame, label, (10, h - bar_h + 40 + 60*i), cv2.FONT_HERSHEY_SIMPLEX,
+                    1.2, (255,255,255), 2)
 
     cv2.imshow("Sign2Voice: Real-time ASL", frame)
-    key = cv2.waitKey(1) & 0xFF
+    delay = engine.pace((time.perf_counter() - t_start) * 1e3, len(result.found), default_ms=1)
+    key = cv2.waitKey(delay) & 0xFF
     if key == ord('q'): break
-    if key == ord('c'): sentence = ""
-    if key == ord('s'): speak(sentence)
+    if key == ord('c'): sentences.clear()
+    if key == ord('s'): speak(" ".join(sentences.values()))
 
 cap.release()
 cv2.destroyAllWindows()
+engine.close()
+if engine.recorder:
+    print(f"🎞️ Session trace saved to {args.record} ({engine.recorder.count} frames)")
@@ -0,0 +1,232 @@
+# app/metrics.py
+"""
+Prometheus-style metrics for the recognition process (stdlib only).
+
+The live loops update counters / gauges / histograms in-process, and
+`start_server(port)` serves them as Prometheus text on
+http://127.0.0.1:<port>/metrics from a daemon thread. The Node server
+scrapes that for /api/health and /api/metrics.
+
+    frames = METRICS.counter("sign2voice_frames_total", "Frames processed")
+    frames.inc()
+    latency = METRICS.histogram("sign2voice_stage_latency_ms", "…", LATENCY_BUCKETS_MS, ["stage"])
+    latency.observe(3.2, stage="detect")
+    METRICS.gauge("sign2voice_tts_speaking", "…", fn=tts.speaking)   # read at scrape time
+
+Updates are plain int / float adds on the loop's thread; a scrape reads
+them without locking, so a sample may be one update behind.
+"""
+import bisect, os, sys, threading, time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+LATENCY_BUCKETS_MS = (1, 2.5, 5, 10, 20, 33, 50, 100, 250, 500, 1000)
+BATCH_BUCKETS = (0, 1, 2, 4, 8, 16, 32, 64)
+
+
+def _labels(names, values):
+    if not names:
+        return ""
+    return "{" + ",".join(f'{n}="{v}"' for n, v in zip(names, values)) + "}"
+
+
+def _num(v):
+    v = float(v)
+    if v != v:
+        return "NaN"
+    if v in (float("inf"), float("-inf")):
+        return "+Inf" if v > 0 else "-Inf"
+    return str(int(v)) if v.is_integer() else repr(v)
+
+
+class Counter:
+    kind = "counter"
+
+    def __init__(self, name, help, labelnames=()):
+        self.name, self.help, self.labelnames = name, help, tuple(labelnames)
+        self.values = {}
+
+    def inc(self, amount=1, **labels):
+        key = tuple(labels.get(n, "") for n in self.labelnames)
+        self.values[key] = self.values.get(key, 0) + amount
+
+    def samples(self):
+        for key, v in list(self.values.items()):
+            yield self.name, _labels(self.labelnames, key), v
+
+
+class Gauge(Counter):
+    """Set by the loop, or computed by `fn()` when scraped."""
+    kind = "gauge"
+
+    def __init__(self, name, help, labelnames=(), fn=None):
+        super().__init__(name, help, labelnames)
+        self.fn = fn
+
+    def set(self, value, **labels):
+        self.values[tuple(labels.get(n, "") for n in self.labelnames)] = value
+
+    def samples(self):
+        if self.fn is not None:
+            value = self.fn()
+            if value is not None:
+                yield self.name, "", value
+            return
+        yield from super().samples()
+
+
+class Histogram:
+    kind = "histogram"
+
+    def __init__(self, name, help, buckets, labelnames=()):
+        self.name, self.help, self.labelnames = name, help, tuple(labelnames)
+        self.buckets = tuple(buckets)
+        self.series = {}            # label values → [bucket counts…, +Inf count, sum]
+
+    def observe(self, value, **labels):
+        key = tuple(labels.get(n, "") for n in self.labelnames)
+        row = self.series.get(key)
+        if row is None:
+            row = self.series[key] = [0] * (len(self.buckets) + 2)
+        row[bisect.bisect_left(self.buckets, value)] += 1
+        row[-1] += value
+
+    def samples(self):
+        for key, row in list(self.series.items()):
+            row = list(row)
+            cumulative = 0
+            for le, count in zip((*self.buckets, "+Inf"), row[:-1]):
+                cumulative += count
+                le = le if le == "+Inf" else _num(le)
+                yield (f"{self.name}_bucket",
+                       _labels((*self.labelnames, "le"), (*key, le)), cumulative)
+            yield f"{self.name}_sum", _labels(self.labelnames, key), row[-1]
+            yield f"{self.name}_count", _labels(self.labelnames, key), cumulative
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self.metrics = {}
+
+    def _add(self, metric):
+        return self.metrics.setdefault(metric.name, metric)
+
+    def counter(self, name, help, labelnames=()):
+        return self._add(Counter(name, help, labelnames))
+
+    def gauge(self, name, help, labelnames=(), fn=None):
+        return self._add(Gauge(name, help, labelnames, fn))
+
+    def histogram(self, name, help, buckets=LATENCY_BUCKETS_MS, labelnames=()):
+        return self._add(Histogram(name, help, buckets, labelnames))
+
+    def render(self):
+        """Prometheus text exposition format (version 0.0.4)."""
+        lines = []
+        for m in list(self.metrics.values()):
+            try:
+                samples = list(m.samples())
+            except Exception:               # a broken fn= gauge must not break the scrape
+                continue
+            lines.append(f"# HELP {m.name} {m.help}")
+            lines.append(f"# TYPE {m.name} {m.kind}")
+            lines.extend(f"{name}{labels} {_num(value)}" for name, labels, value in samples)
+        return "\n".join(lines) + "\n"
+
+
+def rss_bytes():
+    """Current resident set size (peak RSS where /proc and psutil are unavailable)."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss
+    except ImportError:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+METRICS = MetricsRegistry()
+_started = time.time()
+METRICS.gauge("process_resident_memory_bytes", "Resident memory size in bytes", fn=rss_bytes)
+METRICS.gauge("process_start_time_seconds", "Start time since the epoch", fn=lambda: _started)
+
+
+class FrameMetrics:
+    """The live loops' per-frame numbers, shared by gui_main.py and app/main.py."""
+
+    def __init__(self, registry=METRICS, fps_smoothing=0.1):
+        self.frames = registry.counter("sign2voice_frames_total", "Frames processed")
+        self.dropped = registry.counter(
+            "sign2voice_dropped_frames_total",
+            "Frames lost before processing: failed reads, or bus frames the loop never read",
+            ["reason"])
+        self.fps = registry.gauge("sign2voice_fps", "Processed frames per second (smoothed)")
+        self.latency = registry.histogram("sign2voice_stage_latency_ms",
+                                          "Per-frame latency by stage in ms",
+                                          LATENCY_BUCKETS_MS, ["stage"])
+        self.batch = registry.histogram("sign2voice_inference_batch_size",
+                                        "Hands classified per forward pass", BATCH_BUCKETS)
+        self.alpha = fps_smoothing
+        self._fps = None
+        self._last = None
+        self._skipped = 0
+
+    def read(self, ok, capture=None):
+        """After every cap.read(): counts failures and frames a frame-bus capture skipped."""
+        if not ok:
+            self.dropped.inc(reason="read_failed")
+        skipped = getattr(capture, "skipped", 0)
+        if skipped > self._skipped:
+            self.dropped.inc(skipped - self._skipped, reason="not_read")
+            self._skipped = skipped
+
+    def frame(self, hands, detect_ms, classify_ms, frame_ms, now=None):
+        """One processed frame; `hands` is the classifier batch (0 = not called)."""
+        now = time.monotonic() if now is None else now
+        if self._last is not None and now > self._last:
+            fps = 1.0 / (now - self._last)
+            self._fps = fps if self._fps is None else self._fps + self.alpha * (fps - self._fps)
+            self.fps.set(round(self._fps, 2))
+        self._last = now
+        self.frames.inc()
+        if hands:
+            self.batch.observe(hands)
+        self.latency.observe(detect_ms, stage="detect")
+        self.latency.observe(classify_ms, stage="classify")
+        self.latency.observe(frame_ms, stage="frame")
+
+
+class _Handler(BaseHTTPRequestHandler):
+    registry = METRICS
+
+    def do_GET(self):
+        if self.path.split("?")[0] not in ("/metrics", "/"):
+            self.send_error(404)
+            return
+        body = self.registry.render().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):       # no access log on stderr
+        pass
+
+
+def start_server(port, host="127.0.0.1", registry=METRICS):
+    """Serve /metrics on a daemon thread; returns the server, or None if the port is taken."""
+    handler = type("MetricsHandler", (_Handler,), {"registry": registry})
+    try:
+        server = ThreadingHTTPServer((host, port), handler)
+    except OSError as e:
+        print(f"⚠️ Metrics endpoint not started on {host}:{port}: {e}")
+        return None
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True, name="metrics-http").start()
+    print(f"📈 Metrics on http://{host}:{server.server_port}/metrics")
+    return server
@@ -0,0 +1,377 @@
+# app/model_registry.py
+"""
+Model registry + hot swap for the live loops.
+
+The manifest (models/registry.json) lists every registered model and which
+one each task ("landmark" classifier, "image" CNN fallback) uses:
+
+    {
+      "active": {"landmark": "landmark_student:2"},
+      "models": [
+        {"name": "landmark_student", "version": 2, "task": "landmark",
+         "backend": "student", "path": "landmark_student.npz",
+         "calibration": "landmark_student_calibration.json",
+         "normalization": "wrist_scale", "classes": ["A", "B", …],
+         "sha1": "…", "created": "…",
+         "benchmark": {"load_s": 0.01, "latency_p50_ms": 0.03, …}},
+        …
+      ]
+    }
+
+Paths are relative to the manifest's folder. Register / switch models with
+
+    python -m app.model_registry register --backend student --path models/landmark_student.npz \
+        --calibration models/landmark_student_calibration.json --activate
+    python -m app.model_registry activate landmark_tflite --version 1
+    python -m app.model_registry list
+
+Without a manifest (or an active entry for a task) the loops use their
+built-in defaults (`legacy_entries`), so nothing changes until a model is
+registered.
+
+Hot swap: `LiveModel.poll()` is called between frames. When the active
+entry changes, the new model is loaded, checked against its manifest entry
+and warmed up on a background thread while the old one keeps serving;
+the next `poll()` after it is ready installs it in one assignment and
+calls `on_swap(old, new)`. The frame loop never waits for a load.
+"""
+import argparse, hashlib, importlib, json, os, threading, time
+from datetime import datetime, timezone
+import numpy as np
+
+try:                                    # python -m app.… (app/main.py, benchmarks)
+    from app.calibration import Calibration
+except ImportError:                     # gui_main.py runs from inside app/
+    from calibration import Calibration
+
+BACKENDS = {}
+
+
+def register_backend(name, task):
+    def wrap(fn):
+        BACKENDS[name] = (task, fn)
+        return fn
+    return wrap
+
+
+def _app_module(name):
+    """app.<name>, whether running as a package or as a script from inside app/."""
+    try:
+        return importlib.import_module(f"app.{name}")
+    except ModuleNotFoundError as e:
+        if e.name != "app":
+            raise
+        return importlib.import_module(name)
+
+
+@register_backend("keras", "landmark")
+def _keras(path, classes_path):
+    return _app_module("classifier").LandmarkClassifier(path, classes_path)
+
+
+@register_backend("student", "landmark")
+def _student(path, classes_path):
+    return _app_module("classifier").StudentClassifier(path)
+
+
+@register_backend("tflite", "landmark")
+def _tflite(path, classes_path):
+    return _app_module("classifier").TFLiteClassifier(path, classes_path)
+
+
+@register_backend("image_keras", "image")
+def _image_keras(path, classes_path):
+    return _app_module("recognizer").ASLRecognizer(path, classes_path)
+
+
+def class_names(model):
+    if hasattr(model, "class_names"):
+        return [str(c) for c in model.class_names]
+    return [model.labels[i] for i in sorted(model.labels)]      # ASLRecognizer
+
+
+def legacy_entries(student=False, hybrid=False):
+    """The models the loops used before the registry, relative to their models/ folder."""
+    if student:
+        landmark = {"name": "landmark_student", "version": 0, "backend": "student",
+                    "path": "landmark_student.npz",
+                    "calibration": "landmark_student_calibration.json"}
+    else:
+        landmark = {"name": "landmark_cnn", "version": 0, "backend": "keras",
+                    "path": "landmark_cnn.h5", "classes_path": "landmark_classes.json",
+                    "calibration": "landmark_calibration.json"}
+    entries = {"landmark": {"task": "landmark", **landmark}}
+    if hybrid:
+        entries["image"] = {"name": "asl_cnn", "version": 0, "task": "image",
+                            "backend": "image_keras", "path": "asl_cnn.h5",
+                            "classes_path": "label_map.json"}
+    return entries
+
+
+def entry_key(entry):
+    return f"{entry['name']}:{entry['version']}" if entry else None
+
+
+def _sha1(path, block=1 << 20):
+    h = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(block), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+class LoadedModel:
+    """A model built from a manifest entry, with its calibration and load / warm-up cost."""
+
+    def __init__(self, entry, model, calibration, load_s):
+        self.entry = entry
+        self.model = model
+        self.calibration = calibration
+        self.load_s = load_s
+        self.warm_ms = None
+
+    @property
+    def key(self):
+        return entry_key(self.entry)
+
+    def warm(self, max_hands=1, repeat=3):
+        """Run every batch shape the loop will use, so the first live frame pays no tracing."""
+        t0 = time.perf_counter()
+        for _ in range(repeat):
+            if self.entry["task"] == "image":
+                self.model.predict(np.zeros((64, 64, 3), np.uint8))
+            else:
+                for n in range(1, max_hands + 1):
+                    self.model.predict_batch(np.zeros((n, 63), np.float32))
+        self.warm_ms = (time.perf_counter() - t0) * 1e3
+        return self
+
+
+class ModelRegistry:
+    def __init__(self, path="models/registry.json", defaults=None):
+        self.path = path
+        self.base_dir = os.path.dirname(os.path.abspath(path))
+        self.defaults = defaults or {}
+        self.models = []
+        self.active_keys = {}
+        self.mtime = None
+        self.reload()
+
+    def reload(self):
+        """Re-read the manifest if it changed on disk; True if it did."""
+        try:
+            mtime = os.stat(self.path).st_mtime_ns
+        except FileNotFoundError:
+            mtime = None
+        if mtime == self.mtime:
+            return False
+        self.mtime = mtime
+        if mtime is None:
+            self.models, self.active_keys = [], {}
+            return True
+        with open(self.path) as f:
+            data = json.load(f)
+        self.models, self.active_keys = data.get("models", []), data.get("active", {})
+        return True
+
+    def save(self):
+        """Write the manifest atomically, so a loop polling it never reads half a file."""
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w") as f:
+            json.dump({"active": self.active_keys, "models": self.models}, f, indent=4)
+        os.replace(tmp, self.path)
+        self.mtime = os.stat(self.path).st_mtime_ns
+
+    def resolve(self, path):
+        return path if not path or os.path.isabs(path) else os.path.join(self.base_dir, path)
+
+    def get(self, name, version=None):
+        found = [m for m in self.models if m["name"] == name
+                 and (version is None or m["version"] == version)]
+        if not found:
+            raise KeyError(f"{name}:{version or 'latest'} is not registered in {self.path}")
+        return max(found, key=lambda m: m["version"])
+
+    def active(self, task):
+        """The entry `task` should run: the manifest's choice, else the built-in default."""
+        key = self.active_keys.get(task)
+        if key:
+            name, version = key.rsplit(":", 1)
+            return self.get(name, int(version))
+        return self.defaults.get(task)
+
+    def load(self, entry):
+        """Build the model for an entry; ValueError if it does not match the manifest."""
+        task, build = BACKENDS[entry["backend"]]
+        t0 = time.perf_counter()
+        model = build(self.resolve(entry["path"]), self.resolve(entry.get("classes_path")))
+        calibration = Calibration.load(self.resolve(entry.get("calibration")))
+        load_s = time.perf_counter() - t0
+
+        expected = entry.get("normalization")
+        actual = getattr(model, "normalization", None)
+        if expected and expected != actual:
+            raise ValueError(f"{entry_key(entry)}: manifest says {expected} input, "
+                             f"backend {entry['backend']} expects {actual}")
+        if entry.get("classes") and entry["classes"] != class_names(model):
+            raise ValueError(f"{entry_key(entry)}: class list differs from the manifest")
+        if task == "landmark":
+            model.temperature = calibration.temperature
+        return LoadedModel(entry, model, calibration, load_s)
+
+    def register(self, backend, path, name=None, classes_path=None, calibration=None,
+                 metrics=None, repeat=200):
+        """Load, benchmark and add a model as the next version of `name`; returns the entry."""
+        task = BACKENDS[backend][0]
+        name = name or os.path.splitext(os.path.basename(path))[0]
+        version = 1 + max((m["version"] for m in self.models if m["name"] == name), default=0)
+
+        def rel(p):
+            return os.path.relpath(os.path.abspath(p), self.base_dir) if p else None
+
+        entry = {"name": name, "version": version, "task": task, "backend": backend,
+                 "path": rel(path), "classes_path": rel(classes_path),
+                 "calibration": rel(calibration), "sha1": _sha1(path),
+                 "created": datetime.now(timezone.utc).isoformat(timespec="seconds")}
+        loaded = self.load(entry).warm()
+        entry["normalization"] = getattr(loaded.model, "normalization", None)
+        entry["classes"] = class_names(loaded.model)
+        entry["benchmark"] = {"load_s": loaded.load_s, **self._latency(loaded, repeat)}
+        if metrics:
+            with open(metrics) as f:
+                entry["benchmark"]["metrics"] = json.load(f)
+        self.models.append(entry)
+        self.save()
+        return entry
+
+    def activate(self, name, version=None):
+        entry = self.get(name, version)
+        self.active_keys[entry["task"]] = entry_key(entry)
+        self.save()
+        return entry
+
+    @staticmethod
+    def _latency(loaded, repeat):
+        if loaded.entry["task"] == "image":
+            x = np.random.default_rng(0).integers(0, 255, (200, 200, 3), dtype=np.uint8)
+            call = lambda: loaded.model.predict(x)
+        else:
+            x = np.random.default_rng(0).random((1, 63), dtype=np.float32)
+            call = lambda: loaded.model.predict_batch(x)
+        times = np.empty(repeat)
+        for i in range(repeat):
+            t0 = time.perf_counter()
+            call()
+            times[i] = (time.perf_counter() - t0) * 1e3
+        return {"latency_p50_ms": float(np.median(times)),
+                "latency_p95_ms": float(np.percentile(times, 95))}
+
+
+class LiveModel:
+    """
+    The model one task's loop runs. `current` only changes inside `poll()`,
+    so everything a frame does sees the same model.
+    """
+
+    def __init__(self, registry, task, on_swap=None, max_hands=1, check_every=2.0):
+        self.registry = registry
+        self.task = task
+        self.on_swap = on_swap              # on_swap(old, new), called from poll()
+        self.max_hands = max_hands
+        self.check_every = check_every      # seconds between manifest checks
+        self.current = registry.load(registry.active(task)).warm(max_hands)
+        self.failed = set()                 # keys that would not load; not retried
+        self._ready = None
+        self._loading = None
+        self._next_check = time.monotonic() + check_every
+        print(f"📦 {task} model {self.current.key} ({self.current.entry['backend']}) "
+              f"loaded in {self.current.load_s:.2f} s")
+
+    @property
+    def model(self):
+        return self.current.model
+
+    def poll(self, now=None):
+        """Call between frames: installs a warmed-up replacement, or starts one. True on swap."""
+        ready = self._ready
+        if ready is not None:
+            self._ready = None
+            old, self.current = self.current, ready
+            if self.on_swap:
+                self.on_swap(old, ready)
+            print(f"🔁 {self.task} model {old.key} → {ready.key} "
+                  f"(loaded {ready.load_s:.2f} s, warm-up {ready.warm_ms:.0f} ms, off the frame loop)")
+            return True
+
+        now = time.monotonic() if now is None else now
+        if now < self._next_check or self._loading:
+            return False
+        self._next_check = now + self.check_every
+        try:
+            self.registry.reload()
+            entry = self.registry.active(self.task)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"⚠️ Model registry unreadable, keeping {self.current.key}: {e}")
+            return False
+        key = entry_key(entry)
+        if key != self.current.key and key not in self.failed:
+            self.swap_to(entry)
+        return False
+
+    def swap_to(self, entry):
+        """Load + warm `entry` on a background thread; poll() installs it when ready."""
+        self._loading = entry_key(entry)
+        threading.Thread(target=self._prepare, args=(entry,), daemon=True,
+                         name=f"model-load-{self.task}").start()
+
+    def _prepare(self, entry):
+        try:
+            self._ready = self.registry.load(entry).warm(self.max_hands)
+        except Exception as e:
+            self.failed.add(entry_key(entry))
+            print(f"⚠️ Could not load {entry_key(entry)}, keeping {self.current.key}: {e}")
+        finally:
+            self._loading = None
+
+
+def _print_models(registry):
+    for m in sorted(registry.models, key=lambda m: (m["task"], m["name"], m["version"])):
+        mark = "*" if registry.active_keys.get(m["task"]) == entry_key(m) else " "
+        bench = m.get("benchmark", {})
+        print(f"{mark} {m['task']:<8} {entry_key(m):<28} {m['backend']:<11} "
+              f"{len(m.get('classes') or [])} classes  "
+              f"p50 {bench.get('latency_p50_ms', float('nan')):.3f} ms  {m['path']}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Sign2Voice model registry")
+    parser.add_argument("--registry", default="models/registry.json")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("list")
+    reg = sub.add_parser("register", help="Benchmark a model and add it as a new version")
+    reg.add_argument("--backend", required=True, choices=sorted(BACKENDS))
+    reg.add_argument("--path", required=True)
+    reg.add_argument("--name", help="Default: the file name without extension")
+    reg.add_argument("--classes", help="Class list / label map (keras, tflite, image_keras)")
+    reg.add_argument("--calibration", help="JSON from python -m models.calibrate")
+    reg.add_argument("--metrics", help="Evaluation JSON to store with the entry "
+                                       "(e.g. metrics/<name>_performance.json)")
+    reg.add_argument("--activate", action="store_true", help="Make it the live model")
+    act = sub.add_parser("activate", help="Switch a task to a registered model")
+    act.add_argument("name")
+    act.add_argument("--version", type=int, help="Default: latest")
+    args = parser.parse_args()
+
+    registry = ModelRegistry(args.registry)
+    if args.command == "register":
+        entry = registry.register(args.backend, args.path, args.name, args.classes,
+                                  args.calibration, args.metrics)
+        print(f"✅ Registered {entry_key(entry)}: {entry['benchmark']['latency_p50_ms']:.3f} ms p50 "
+              f"per frame, {len(entry['classes'])} classes")
+        if args.activate:
+            registry.activate(entry["name"], entry["version"])
+            print(f"🔁 {entry['task']} → {entry_key(entry)}")
+    elif args.command == "activate":
+        entry = registry.activate(args.name, args.version)
+        print(f"🔁 {entry['task']} → {entry_key(entry)} (running loops switch within seconds)")
+    _print_models(registry)
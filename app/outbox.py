@@ -0,0 +1,258 @@
+# app/outbox.py
+"""
+Write-behind outbox for saved sentences.
+
+`enqueue` only appends a row to a local SQLite journal and returns, so the
+Tk thread never waits on the network. A daemon thread drains the journal in
+batches to POST /api/sentences/bulk over one pooled requests.Session, with
+exponential backoff while the server (or Mongo) is down. Rows are deleted
+only after the server acknowledges them and every row carries a clientId
+the server de-duplicates on, so a retry after a lost response cannot save
+a sentence twice. Unsent rows survive restarts.
+
+Rows keep the JWT they were saved with. When the server answers 401 (the
+token expired, or the account is gone) those rows are moved onto the
+current login's token if it belongs to the same user (`set_token`);
+otherwise they are parked until that user logs in again, and rows of other
+tokens keep draining behind them. Any other 4xx holds the batch back (attempts
+bumped) instead of deleting it: it stays in the journal and is retried at the
+next login or start, while the rest of the queue drains. A 413 splits the
+batch instead.
+"""
+import base64, json, os, random, sqlite3, threading, time, uuid
+from datetime import datetime, timezone
+
+import requests
+from requests.adapters import HTTPAdapter
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_DB = os.path.join(BASE_DIR, "outbox.db")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    id          INTEGER PRIMARY KEY AUTOINCREMENT,
+    client_id   TEXT NOT NULL UNIQUE,
+    token       TEXT,
+    payload     TEXT NOT NULL,
+    attempts    INTEGER NOT NULL DEFAULT 0
+)
+"""
+
+
+class SentenceOutbox:
+    def __init__(self, base_url="http://localhost:5000", db_path=DEFAULT_DB,
+                 batch_size=50, timeout=10, max_backoff=60.0, on_status=None):
+        self.url = base_url.rstrip("/") + "/api/sentences/bulk"
+        self.db_path = db_path
+        self.batch_size = batch_size
+        self.timeout = timeout
+        self.max_backoff = max_backoff
+        self.on_status = on_status          # optional callback(str), called from the worker
+
+        self._db = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(_SCHEMA)
+        self._lock = threading.Lock()       # one sqlite connection, two threads
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=2)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        self.sent = 0
+        self.token = None                   # the current login's JWT (set_token)
+        self._parked = set()                # tokens the server rejected with 401
+        self._held = set()                  # row ids of batches rejected with another 4xx
+        self._thread = threading.Thread(target=self._run, name="sentence-outbox", daemon=True)
+        self._thread.start()
+        if self.pending():
+            self._wake.set()                # leftovers from a previous run
+
+    # ---------------- Producer side (UI thread) ----------------
+    def enqueue(self, text, session_id, token=None, source="gui"):
+        """Journal a sentence for delivery; never touches the network."""
+        client_id = str(uuid.uuid4())
+        payload = json.dumps({
+            "text": text,
+            "sessionId": session_id,
+            "source": source,
+            "clientId": client_id,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+        })
+        with self._lock:
+            self._db.execute("INSERT INTO outbox (client_id, token, payload) VALUES (?, ?, ?)",
+                             (client_id, token, payload))
+        self._wake.set()
+        return client_id
+
+    def set_token(self, token):
+        """A (re-)login: this user's rows, parked or not, are sent with the new token."""
+        self.token = token
+        subject = _subject(token)
+        if subject is None:
+            return
+        with self._lock:
+            old = [t for (t,) in self._db.execute("SELECT DISTINCT token FROM outbox")
+                   if t != token and _subject(t) == subject]
+            self._db.executemany("UPDATE outbox SET token = ? WHERE token IS ?",
+                                 [(token, t) for t in old])
+            self._parked.difference_update(old)
+            retry = old or self._held
+            self._held.clear()              # rejected batches get another try
+        if retry:
+            self._wake.set()
+
+    def pending(self, parked=True):
+        """Rows not yet acknowledged; parked=False leaves out rows waiting for a login."""
+        with self._lock:
+            if parked:
+                return self._db.execute("SELECT COUNT(*) FROM outbox").fetchone()[0]
+            where, params = self._sendable()
+            return self._db.execute(f"SELECT COUNT(*) FROM outbox WHERE {where}",
+                                    params).fetchone()[0]
+
+    def flush(self, timeout=None):
+        """Block until every sendable row is sent (or timeout); for shutdown and tests."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self.pending(parked=False):
+            if deadline is not None and time.monotonic() > deadline:
+                return False
+            self._wake.set()
+            time.sleep(0.05)
+        return True
+
+    def close(self, timeout=2.0):
+        self.flush(timeout)
+        self._stop.set()
+        self._wake.set()
+        self._thread.join(timeout)
+        self.session.close()
+        self._db.close()
+
+    # ---------------- Consumer side (worker thread) ----------------
+    def _sendable(self):
+        """WHERE clause and parameters for rows that may be sent now; call with _lock held."""
+        # IS rather than IN: a NULL token (saved while logged out) compares like any other
+        where = "id NOT IN (SELECT value FROM json_each(?))"
+        if self._parked:
+            where += " AND NOT (" + " OR ".join(["token IS ?"] * len(self._parked)) + ")"
+        return where, [json.dumps(sorted(self._held))] + list(self._parked)
+
+    def _next_batch(self):
+        with self._lock:
+            # Oldest token first, skipping the ones waiting for their user to log in
+            where, params = self._sendable()
+            first = self._db.execute(
+                f"SELECT token FROM outbox WHERE {where} GROUP BY token ORDER BY MIN(id) LIMIT 1",
+                params).fetchone()
+            if first is None:
+                return None, []
+            # A batch is sent with a single Authorization header
+            token = first[0]
+            rows = self._db.execute(
+                f"SELECT id, payload FROM outbox WHERE token IS ? AND {where} ORDER BY id LIMIT ?",
+                [token] + params + [self.batch_size]).fetchall()
+        return token, rows
+
+    def _unauthorized(self, token):
+        """401: move the rows onto the current login of the same user, or park them."""
+        current = self.token
+        if (token is not None and current is not None and current != token
+                and _subject(current) == _subject(token)):
+            with self._lock:
+                self._db.execute("UPDATE outbox SET token = ? WHERE token IS ?", (current, token))
+            return
+        with self._lock:
+            self._parked.add(token)
+            n = self._db.execute("SELECT COUNT(*) FROM outbox WHERE token IS ?",
+                                 (token,)).fetchone()[0]
+        self._status(f"🔒 {n} sentence(s) kept until you log in again (session expired)")
+
+    def _hold(self, ids):
+        """Keep a rejected batch in the journal, out of the queue until the next login."""
+        self._bump_attempts(ids)
+        with self._lock:
+            self._held.update(ids)
+
+    def _delete(self, ids):
+        with self._lock:
+            self._db.executemany("DELETE FROM outbox WHERE id = ?", [(i,) for i in ids])
+
+    def _bump_attempts(self, ids):
+        with self._lock:
+            self._db.executemany("UPDATE outbox SET attempts = attempts + 1 WHERE id = ?",
+                                 [(i,) for i in ids])
+
+    def _status(self, msg):
+        print(msg)
+        if self.on_status:
+            self.on_status(msg)
+
+    def _run(self):
+        backoff = 0.0
+        while not self._stop.is_set():
+            if backoff:
+                # Sleep, but let close() interrupt us
+                self._stop.wait(backoff)
+            else:
+                self._wake.wait()
+            self._wake.clear()
+
+            while not self._stop.is_set():
+                token, rows = self._next_batch()
+                if not rows:
+                    backoff = 0.0
+                    break
+                ids = [r[0] for r in rows]
+                headers = {"Authorization": f"Bearer {token}"} if token else {}
+                try:
+                    response = self.session.post(
+                        self.url, json={"sentences": [json.loads(r[1]) for r in rows]},
+                        headers=headers, timeout=self.timeout)
+                except requests.RequestException as e:
+                    response, error = None, e
+                else:
+                    error = None
+
+                if response is not None and response.status_code in (200, 201):
+                    self._delete(ids)
+                    self.sent += len(ids)
+                    self._status(f"✅ Saved {len(ids)} sentence(s)")
+                    backoff = 0.0
+                    continue
+
+                if response is not None and response.status_code == 401:
+                    self._unauthorized(token)
+                    backoff = 0.0
+                    continue
+
+                if response is not None and response.status_code == 413 and len(ids) > 1:
+                    self.batch_size = max(1, len(ids) // 2)
+                    continue
+
+                if response is not None and 400 <= response.status_code < 500 \
+                        and response.status_code not in (408, 429):
+                    # Retrying now would fail the same way; don't block the queue on them
+                    self._hold(ids)
+                    self._status(f"⚠️ {len(ids)} sentence(s) rejected ({response.status_code}, "
+                                 f"{response.text}); kept, retried at next login")
+                    continue
+
+                self._bump_attempts(ids)
+                backoff = min(self.max_backoff, max(0.5, backoff * 2)) * random.uniform(0.8, 1.2)
+                reason = error if error is not None else f"HTTP {response.status_code}"
+                self._status(f"⏳ Save deferred ({reason}); retrying in {backoff:.1f}s")
+                break
+
+
+def _subject(token):
+    """The user id inside a JWT (payload only, not verified: the server does that)."""
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        return json.loads(base64.urlsafe_b64decode(payload)).get("id")
+    except (AttributeError, IndexError, ValueError):
+        return None
@@ -0,0 +1,306 @@
+# app/personalize.py
+"""
+Per-user personalisation of the landmark classifier.
+
+Hands differ: a letter one user forms slightly differently keeps being
+misread, and every misread costs a `del` and a retry. A UserAdapter is a
+nearest-class-mean (NCM) head fitted on that user's own landmark samples:
+
+    q(c | x)  ∝ exp(-‖f(x) − μ_c‖² / τ)            over the letters the user has samples for
+    p'(c | x) ∝ p(c | x)^(1−α) · q(c | x)^α         blended with the base classifier
+
+f is either the wrist-centred, scale-free landmarks ("landmarks": works
+with every backend and survives model swaps) or the classifier's
+penultimate activations from the same forward pass ("penultimate": tied
+to the model it was fitted on). The blend weight α is picked by
+cross-validation on the user's samples, so a user whose hands the base
+model already reads well gets α = 0. Letters without samples keep the
+base model's say. Per frame this is one (hands × letters × F) distance;
+the file is a few KB of float16 means per user.
+
+Samples are an enrolment .npz (X (N, 63) raw landmarks, y letters) and/or
+session traces (app/session_recorder.py), labelled by the letters the user
+kept: a commit undone by `del` is not used.
+
+    python -m app.personalize fit --user 42 --samples enrol.npz --trace app/recordings/*.s2v
+    python -m app.personalize show --user 42
+
+The GUI loads the logged-in user's adapter in perform_login
+(SIGN2VOICE_USER_DIR, default models/users/).
+"""
+import argparse, json, os, time
+import numpy as np
+
+try:                                    # python -m app.… (app/main.py, benchmarks)
+    from app.classifier import apply_temperature, normalize_landmarks
+    from app.session_recorder import SessionTrace
+except ImportError:                     # gui_main.py runs from inside app/
+    from classifier import apply_temperature, normalize_landmarks
+    from session_recorder import SessionTrace
+
+USER_DIR = os.path.join("models", "users")
+ALPHAS = (0.0, 0.25, 0.5, 0.75, 0.9)
+FEATURES = ("landmarks", "penultimate")
+
+
+def check_features(classifier, space):
+    if space == "penultimate" and not getattr(classifier, "has_features", False):
+        raise ValueError(f"{type(classifier).__name__} has no penultimate features; "
+                         f"use --features landmarks")
+
+
+def features_of(classifier, vecs, space="landmarks"):
+    """(raw softmax, features) for (N, 63) landmark vectors."""
+    if space == "penultimate":
+        return classifier.proba_and_features(vecs)
+    return classifier.predict_proba(vecs), normalize_landmarks(vecs)
+
+
+def user_path(user_id, user_dir=USER_DIR):
+    safe = "".join(ch if ch.isalnum() or ch in "-_.@" else "_" for ch in str(user_id))
+    return os.path.join(user_dir, f"{safe}.npz")
+
+
+def _ncm_log_probs(feats, means, m2, tau):
+    """log q over the user's letters: softmax of −squared distance / τ."""
+    d = (feats * feats).sum(axis=1, keepdims=True) - 2.0 * feats @ means.T + m2
+    s = d * np.float32(-1.0 / tau)
+    s -= s.max(axis=1, keepdims=True)
+    s -= np.log(np.exp(s).sum(axis=1, keepdims=True))
+    return s
+
+
+def _blend(probs, logq, idx, alpha):
+    """p^(1−α) q^α, renormalised; letters without a mean get the user's least likely q."""
+    if alpha == 0.0:
+        return probs
+    logp = np.log(np.clip(probs, 1e-12, 1.0)) * (1.0 - alpha)
+    logp += alpha * logq.min(axis=1, keepdims=True)
+    logp[:, idx] += alpha * (logq - logq.min(axis=1, keepdims=True))
+    logp -= logp.max(axis=1, keepdims=True)
+    np.exp(logp, out=logp)
+    logp /= logp.sum(axis=1, keepdims=True)
+    return logp
+
+
+def _fit_means(feats, labels, k):
+    means = np.zeros((k, feats.shape[1]), np.float32)
+    np.add.at(means, labels, feats)
+    means /= np.bincount(labels, minlength=k)[:, None]
+    spread = float(((feats - means[labels]) ** 2).sum(axis=1).mean())
+    return means, max(spread, 1e-6)
+
+
+class UserAdapter:
+    def __init__(self, classes, idx, means, tau, alpha, features="landmarks", model=None,
+                 meta=None):
+        self.classes = list(classes)               # the base classifier's class order
+        self.idx = np.asarray(idx, np.int64)       # columns of the user's letters
+        self.means = np.asarray(means, np.float32)
+        self.m2 = (self.means * self.means).sum(axis=1)[None, :]
+        self.tau = float(tau)
+        self.alpha = float(alpha)
+        self.features = features
+        self.model = model                         # registry key, for penultimate features
+        self.meta = meta or {}
+
+    @classmethod
+    def fit(cls, classifier, X, y, features="landmarks", model=None, alphas=ALPHAS, folds=5,
+            min_per_class=3, seed=0):
+        """Fit on (N, 63) raw landmarks and letter labels; α by k-fold accuracy."""
+        check_features(classifier, features)
+        classes = [str(c) for c in classifier.class_names]
+        col = {c: i for i, c in enumerate(classes)}
+        y = np.asarray([str(v) for v in y])
+        known = np.array([v in col for v in y], bool)
+        X, y = np.asarray(X, np.float32)[known], y[known]
+        letters, counts = np.unique(y, return_counts=True)
+        letters = letters[counts >= min_per_class]
+        keep = np.isin(y, letters)
+        X, y = X[keep], y[keep]
+        if not len(letters):
+            raise ValueError(f"No letter has {min_per_class}+ samples")
+        probs, feats = features_of(classifier, X, features)
+        feats = feats.astype(np.float32)
+        labels = np.searchsorted(letters, y)       # position among the user's letters
+        targets = np.array([col[v] for v in y])
+        idx = np.array([col[v] for v in letters])
+
+        # α: accuracy over held-out folds, ties to the smaller (safer) weight. Folds are
+        # stratified, so with min_per_class >= 2 every letter keeps a training sample.
+        folds = max(2, min(folds, min_per_class))
+        fold = np.empty(len(y), np.int64)
+        order = np.random.default_rng(seed).permutation(len(y))
+        for c in range(len(letters)):
+            members = order[labels[order] == c]
+            fold[members] = np.arange(len(members)) % folds
+        correct = np.zeros(len(alphas))
+        for f in range(folds):
+            train, val = fold != f, fold == f
+            means_f, tau_f = _fit_means(feats[train], labels[train], len(letters))
+            logq = _ncm_log_probs(feats[val], means_f, (means_f ** 2).sum(axis=1)[None], tau_f)
+            for a, alpha in enumerate(alphas):
+                pred = _blend(probs[val], logq, idx, alpha).argmax(axis=1)
+                correct[a] += (pred == targets[val]).sum()
+        best = int(np.argmax(correct))             # argmax keeps the first (smallest) on ties
+
+        means, tau = _fit_means(feats, labels, len(letters))
+        base_acc = float((probs.argmax(axis=1) == targets).mean())
+        return cls(classes, idx, means, tau, alphas[best], features, model,
+                   meta={"samples": int(len(y)), "letters": [str(c) for c in letters],
+                         "cv_accuracy": {str(a): float(c / len(y)) for a, c in zip(alphas, correct)},
+                         "base_accuracy": base_acc, "created": time.time()})
+
+    def adjust(self, probs, feats):
+        """Raw (N, C) softmax + (N, F) features → personalised softmax."""
+        if self.alpha == 0.0 or not len(probs):
+            return probs
+        logq = _ncm_log_probs(np.asarray(feats, np.float32), self.means, self.m2, self.tau)
+        return _blend(probs, logq, self.idx, self.alpha)
+
+    def compatible(self, classifier, model_key=None):
+        if [str(c) for c in classifier.class_names] != self.classes:
+            return False
+        if self.features == "landmarks":
+            return self.means.shape[1] == 63
+        return getattr(classifier, "has_features", False) and model_key == self.model
+
+    def save(self, path):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        header = {"classes": self.classes, "tau": self.tau, "alpha": self.alpha,
+                  "features": self.features, "model": self.model, "meta": self.meta}
+        tmp = path + ".tmp.npz"
+        np.savez_compressed(tmp, idx=self.idx.astype(np.int16),
+                            means=self.means.astype(np.float16),
+                            header=np.array(json.dumps(header)))
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path, allow_pickle=False) as data:
+            header = json.loads(str(data["header"]))
+            return cls(header["classes"], data["idx"], data["means"].astype(np.float32),
+                       header["tau"], header["alpha"], header["features"], header["model"],
+                       header.get("meta"))
+
+
+class PersonalizedClassifier:
+    """The base classifier with a UserAdapter applied before its temperature."""
+
+    def __init__(self, base, adapter):
+        self.base = base
+        self.adapter = adapter
+        self.class_names = base.class_names
+        self.normalization = base.normalization
+
+    @property
+    def temperature(self):
+        return self.base.temperature
+
+    def predict_proba(self, vecs):
+        vecs = np.asarray(vecs, np.float32).reshape(-1, 63)
+        return self.adapter.adjust(*features_of(self.base, vecs, self.adapter.features))
+
+    def predict_batch(self, vecs):
+        probs = apply_temperature(self.predict_proba(vecs), self.base.temperature)
+        idx = probs.argmax(axis=1)
+        confs = probs[np.arange(len(idx)), idx]
+        return [self.class_names[i] for i in idx], confs, probs
+
+
+def load_user(user_id, user_dir=USER_DIR):
+    """The user's adapter, or None if they have not been fitted."""
+    path = user_path(user_id, user_dir)
+    return UserAdapter.load(path) if os.path.exists(path) else None
+
+
+def samples_from_trace(path, window=10):
+    """
+    (X, y) from a session trace: the last `window` frames of each hand before
+    every commit the user kept. A commit followed by `del` on the same hand
+    was a misread, so its frames are left out; the `del` itself is kept.
+    """
+    trace = SessionTrace(path)
+    r = trace.records
+    kept, stacks = [], {}
+    for i, j in zip(*np.nonzero(r["token"])):
+        tid, token = int(r["track_id"][i][j]), r["token"][i][j].decode()
+        stack = stacks.setdefault(tid, [])
+        if token == "del":
+            if stack:
+                stack.pop()
+            kept.append((i, tid, token))
+        else:
+            stack.append((i, tid, token))
+    kept += [c for stack in stacks.values() for c in stack]
+
+    X, y = [], []
+    for i, tid, token in kept:
+        for k in range(max(0, i - window + 1), i + 1):
+            slots = np.flatnonzero(r["track_id"][k][:r["n_hands"][k]] == tid)
+            if len(slots):
+                X.append(r["landmarks"][k][slots[0]].reshape(63))
+                y.append(token)
+    return np.asarray(X, np.float32).reshape(-1, 63), np.asarray(y)
+
+
+def _load_samples(args):
+    X, y = [], []
+    for path in args.samples or []:
+        with np.load(path, allow_pickle=False) as data:
+            X.append(data["X"].reshape(-1, 63).astype(np.float32))
+            y.append(data["y"].astype(str))
+    for path in args.trace or []:
+        Xt, yt = samples_from_trace(path, args.window)
+        X.append(Xt)
+        y.append(yt)
+    if not X:
+        raise SystemExit("Give --samples and/or --trace")
+    return np.concatenate(X), np.concatenate(y)
+
+
+def main(args):
+    path = user_path(args.user, args.user_dir)
+    if args.command == "show":
+        adapter = load_user(args.user, args.user_dir)
+        if adapter is None:
+            raise SystemExit(f"No adapter for user {args.user} in {args.user_dir}")
+        print(json.dumps({"path": path, "bytes": os.path.getsize(path), "alpha": adapter.alpha,
+                          "features": adapter.features, "model": adapter.model,
+                          **adapter.meta}, indent=2))
+        return
+
+    try:
+        from app.model_registry import LiveModel, ModelRegistry, legacy_entries
+    except ImportError:
+        from model_registry import LiveModel, ModelRegistry, legacy_entries
+    registry = ModelRegistry(args.registry, defaults=legacy_entries(args.classifier == "student"))
+    model = LiveModel(registry, "landmark")
+    try:
+        check_features(model.model, args.features)
+        X, y = _load_samples(args)
+        adapter = UserAdapter.fit(model.model, X, y, args.features, model.current.key)
+    except ValueError as e:
+        raise SystemExit(f"❌ {e}")
+    adapter.save(path)
+    cv = adapter.meta["cv_accuracy"]
+    print(f"👤 User {args.user}: {adapter.meta['samples']} samples, "
+          f"{len(adapter.idx)} letters, α={adapter.alpha} ({args.features})")
+    print(f"   accuracy on own samples: base {adapter.meta['base_accuracy']:.3f} → "
+          f"{cv[str(adapter.alpha)]:.3f} cross-validated")
+    print(f"💾 Saved {path} ({os.path.getsize(path)} bytes)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Per-user classifier personalisation")
+    parser.add_argument("command", choices=["fit", "show"])
+    parser.add_argument("--user", required=True, help="User id (the GUI uses the login id)")
+    parser.add_argument("--user_dir", default=USER_DIR)
+    parser.add_argument("--samples", nargs="+", help="Enrolment .npz files with X and y")
+    parser.add_argument("--trace", nargs="+", help="Session traces of this user")
+    parser.add_argument("--window", type=int, default=10,
+                        help="Frames before each kept commit used as samples")
+    parser.add_argument("--features", choices=FEATURES, default="landmarks")
+    parser.add_argument("--registry", default="models/registry.json")
+    parser.add_argument("--classifier", choices=["cnn", "student"], default="cnn")
+    main(parser.parse_args())
@@ -1,9 +1,17 @@
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 from keras.models import load_model
 import cv2
 
+# cv2.resize's default, which utils/preprocessing.py trains with; predict and
+# predict_batch must match it or the two paths disagree near decision edges
+INTERPOLATION = cv2.INTER_LINEAR
+
 class ASLRecognizer:
+    normalization = "bgr_unit"     # BGR pixels / 255, as models/gesture_cnn.py trains
+
     def __init__(self, model_path="models/asl_cnn.h5", label_map_path="models/label_map.json", img_size=64):
         # Load Keras model
         self.model = load_model(model_path)
@@ -14,9 +22,9 @@ class ASLRecognizer:
         self.img_size = img_size
 
     def preprocess(self, frame):
-    # Convert BGR to RGB
-        img_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        img_resized = cv2.resize(img_rgb, (self.img_size, self.img_size))
+        # models/gesture_cnn.py trains on cv2.imread output, so frames stay BGR
+        img_resized = cv2.resize(frame, (self.img_size, self.img_size),
+                                 interpolation=INTERPOLATION)
         img_normalized = img_resized.astype(np.float32) / 255.0
         img_batch = np.expand_dims(img_normalized, axis=0)
         return img_batch
@@ -28,8 +36,66 @@ class ASLRecognizer:
         Returns: (predicted_letter:str, confidence:float)
         """
         img = self.preprocess(frame)
-        preds = self.model.predict(img)
-        class_idx = np.argmax(preds)
+        preds = self.model(img, training=False).numpy()
+        class_idx = int(np.argmax(preds))
         confidence = preds[0][class_idx]
         letter = self.labels.get(class_idx, "?")
         return letter, confidence
+
+    def _load_into(self, buf, i, item):
+        """Decode (if a path) and resize one image straight into buf[i]; False if unreadable."""
+        img = cv2.imread(item) if isinstance(item, (str, os.PathLike)) else item
+        if img is None:
+            return False
+        if img.ndim == 2:
+            img = cv2.cvtColor(img, cv2.COLOR_GRAY2BGR)
+        cv2.resize(img, (self.img_size, self.img_size), dst=buf[i],
+                   interpolation=INTERPOLATION)
+        return True
+
+    def predict_batch(self, frames, batch_size=64, workers=None):
+        """
+        Predict a whole stream of images - BGR arrays and/or image paths.
+
+        Images are decoded and resized by a thread pool into a preallocated
+        uint8 batch while the model runs on the previous one; every model
+        call sees the same (batch_size, img, img, 3) shape, the tail padded.
+        Returns: (letters:list[str], confidences:np.ndarray); unreadable
+        paths give ("?", 0.0).
+        """
+        size = (batch_size, self.img_size, self.img_size, 3)
+        bufs = [np.zeros(size, np.uint8), np.zeros(size, np.uint8)]   # double-buffered
+        x = np.empty(size, np.float32)
+        letters, confs = [], []
+
+        def chunks():
+            chunk = []
+            for item in frames:
+                chunk.append(item)
+                if len(chunk) == batch_size:
+                    yield chunk
+                    chunk = []
+            if chunk:
+                yield chunk
+
+        def infer(buf, ok):
+            np.multiply(buf, np.float32(1 / 255), out=x, casting="unsafe")   # normalise on the fly
+            probs = self.model(x, training=False).numpy()[:len(ok)]
+            idx = probs.argmax(axis=1)
+            conf = probs[np.arange(len(idx)), idx]
+            ok = np.asarray(ok)
+            letters.extend(self.labels.get(int(i), "?") if k else "?" for i, k in zip(idx, ok))
+            confs.append(np.where(ok, conf, 0.0))
+
+        with ThreadPoolExecutor(max_workers=workers or min(8, os.cpu_count() or 1)) as pool:
+            pending = None                   # (buf, futures) decoding in the background
+            for n, chunk in enumerate(chunks()):
+                buf = bufs[n % 2]
+                futures = [pool.submit(self._load_into, buf, i, item) for i, item in enumerate(chunk)]
+                if pending:
+                    infer(pending[0], [f.result() for f in pending[1]])
+                pending = (buf, futures)
+            if pending:
+                infer(pending[0], [f.result() for f in pending[1]])
+
+        return letters, (np.concatenate(confs) if confs else np.empty(0, np.float32))
@@ -0,0 +1,184 @@
+# app/session_recorder.py
+"""
+Opt-in trace of the live loop for offline analysis (no video is stored).
+
+One fixed-width record per frame, appended to a memory-mapped file:
+
+    t, seq                 wall-clock time, frame number
+    n_hands                hands in this frame (<= max_hands)
+    track_id   (H,)        HandTracker id per hand slot
+    landmarks  (H, 21, 3)  float32 raw MediaPipe x, y, z
+    probs      (H, C)      float16 softmax (after calibration)
+    token      (H,)        decoder commit this frame ("" if none, else letter/space/del)
+    detect_ms, classify_ms, frame_ms
+    valid                  written last; 0 marks a record the writer never finished
+
+File layout: a 4 KiB JSON header (magic, dtype, classes, max_hands, meta)
+then the records. The file grows in chunks and is trimmed to the last
+record on close, so a crashed session is still readable up to its last
+valid record.
+
+    python -m app.session_recorder app/recordings/session.s2v    # summary
+"""
+import argparse, json, os, time
+import numpy as np
+
+MAGIC = "S2VTRACE"
+VERSION = 1
+HEADER_BYTES = 4096
+TOKEN_LEN = 8
+
+
+def record_dtype(max_hands, num_classes):
+    return np.dtype([
+        ("t", "<f8"), ("seq", "<i8"),
+        ("n_hands", "u1"), ("valid", "u1"),
+        ("track_id", "<i4", (max_hands,)),
+        ("landmarks", "<f4", (max_hands, 21, 3)),
+        ("probs", "<f2", (max_hands, num_classes)),
+        ("token", f"S{TOKEN_LEN}", (max_hands,)),
+        ("detect_ms", "<f4"), ("classify_ms", "<f4"), ("frame_ms", "<f4"),
+    ], align=True)
+
+
+def _read_header(f):
+    raw = f.read(HEADER_BYTES).rstrip(b"\0 ")
+    header = json.loads(raw)
+    if header.get("magic") != MAGIC:
+        raise ValueError("Not a Sign2Voice session trace")
+    return header
+
+
+class SessionRecorder:
+    def __init__(self, path, classes, max_hands=1, chunk=4096, **meta):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self.classes = list(classes)
+        self.max_hands = max_hands
+        self.dtype = record_dtype(max_hands, len(self.classes))
+        self.chunk = chunk
+        header = json.dumps({
+            "magic": MAGIC, "version": VERSION, "record_size": self.dtype.itemsize,
+            "max_hands": max_hands, "classes": self.classes, "created": time.time(),
+            "meta": meta,
+        }).encode()
+        if len(header) > HEADER_BYTES:
+            raise ValueError("Trace header too large")
+        with open(path, "wb") as f:
+            f.write(header.ljust(HEADER_BYTES, b" "))
+        self.count = 0
+        self.capacity = 0
+        self.records = None
+        self._grow()
+
+    def _grow(self):
+        if self.records is not None:
+            self.records.flush()
+        self.capacity += self.chunk
+        with open(self.path, "r+b") as f:
+            f.truncate(HEADER_BYTES + self.capacity * self.dtype.itemsize)
+        self.records = np.memmap(self.path, self.dtype, "r+", HEADER_BYTES, (self.capacity,))
+
+    def record(self, seq, landmarks, track_ids, probs, tokens,
+               detect_ms=0.0, classify_ms=0.0, frame_ms=0.0):
+        """
+        Append one frame. landmarks (n, 21, 3), probs (n, C), track_ids and
+        tokens of length n (token None for no commit); hands past max_hands
+        are dropped.
+        """
+        if self.count == self.capacity:
+            self._grow()
+        r = self.records[self.count]
+        n = min(len(landmarks), self.max_hands)
+        r["t"] = time.time()
+        r["seq"] = seq
+        r["n_hands"] = n
+        if n:
+            r["landmarks"][:n] = landmarks[:n]
+            r["probs"][:n] = probs[:n]
+            r["track_id"][:n] = track_ids[:n]
+            r["token"][:n] = [(t or "").encode()[:TOKEN_LEN] for t in tokens[:n]]
+        r["detect_ms"], r["classify_ms"], r["frame_ms"] = detect_ms, classify_ms, frame_ms
+        r["valid"] = 1
+        self.count += 1
+
+    def close(self):
+        if self.records is None:
+            return
+        self.records.flush()
+        self.records = None
+        with open(self.path, "r+b") as f:
+            f.truncate(HEADER_BYTES + self.count * self.dtype.itemsize)
+
+
+class SessionTrace:
+    """Read-only view of a recorded session."""
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self.header = _read_header(f)
+        self.classes = self.header["classes"]
+        self.max_hands = self.header["max_hands"]
+        self.meta = self.header.get("meta", {})
+        dtype = record_dtype(self.max_hands, len(self.classes))
+        if dtype.itemsize != self.header["record_size"]:
+            raise ValueError("Trace record layout does not match this version")
+        n = (os.path.getsize(path) - HEADER_BYTES) // dtype.itemsize
+        records = np.memmap(path, dtype, "r", HEADER_BYTES, (n,)) if n else np.empty(0, dtype)
+        # A crashed writer leaves a zeroed tail; keep up to the last finished record
+        valid = np.flatnonzero(records["valid"])
+        self.records = records[:valid[-1] + 1] if len(valid) else records[:0]
+
+    def __len__(self):
+        return len(self.records)
+
+    def hands(self):
+        """
+        Every recorded hand, flattened: dict of landmarks (M, 63) float32,
+        probs (M, C) float32, track_id, seq and t per hand.
+        """
+        r = self.records
+        mask = np.arange(self.max_hands)[None, :] < r["n_hands"][:, None]
+        return {
+            "landmarks": r["landmarks"][mask].reshape(-1, 63).astype(np.float32),
+            "probs": r["probs"][mask].astype(np.float32),
+            "track_id": r["track_id"][mask],
+            "seq": np.broadcast_to(r["seq"][:, None], mask.shape)[mask],
+            "t": np.broadcast_to(r["t"][:, None], mask.shape)[mask],
+        }
+
+    def dataset(self, min_conf=0.0):
+        """(X, y, classes) pseudo-labelled from the recorded predictions, for retraining."""
+        h = self.hands()
+        y = h["probs"].argmax(axis=1)
+        keep = h["probs"].max(axis=1) >= min_conf
+        return h["landmarks"][keep], y[keep], self.classes
+
+    def commits(self):
+        """[(t, seq, track_id, token)] in order."""
+        out = []
+        for i, j in zip(*np.nonzero(self.records["token"])):
+            r = self.records[i]
+            out.append((float(r["t"]), int(r["seq"]), int(r["track_id"][j]), r["token"][j].decode()))
+        return out
+
+    def timings(self):
+        """Per-stage mean / p95 milliseconds."""
+        return {k: {"mean": float(self.records[k].mean()),
+                    "p95": float(np.percentile(self.records[k], 95))}
+                for k in ("detect_ms", "classify_ms", "frame_ms")} if len(self) else {}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Summarise a recorded session trace")
+    parser.add_argument("path")
+    args = parser.parse_args()
+    trace = SessionTrace(args.path)
+    hands = trace.hands()
+    commits = trace.commits()
+    span = trace.records["t"][-1] - trace.records["t"][0] if len(trace) > 1 else 0.0
+    print(f"🎞️ {len(trace)} frames over {span:.1f} s | {len(hands['landmarks'])} hands | "
+          f"{len(commits)} commits")
+    for stage, s in trace.timings().items():
+        print(f"  {stage:<12} mean {s['mean']:.2f} ms  p95 {s['p95']:.2f} ms")
+    print("  text: " + "".join(" " if tok == "space" else "⌫" if tok == "del" else tok
+                               for _, _, _, tok in commits))
@@ -1,18 +1,144 @@
 # app/suggestions.py
-from transformers import GPT2Tokenizer, GPT2LMHeadModel
-import torch, re, os
+"""
+Smart next-word suggestions from a local distilgpt2.
+
+The language model runs behind a small backend interface so the engine can be
+switched by configuration (env var SIGN2VOICE_SUGG_BACKEND):
+
+    torch       eager PyTorch float32 (reference)
+    torch-int8  torch dynamic int8 quantisation of the Linear layers
+    onnx-int8   ONNX export with dynamic int8 quantisation, run by onnxruntime
+
+Nothing heavy is imported until the first suggestion is requested.
+
+Export the ONNX model once (from Sign2Voice/ root):
+
+    python -m app.suggestions --export-onnx
+"""
+import os, re
+from collections import OrderedDict
+import numpy as np
+
+MODEL_NAME = "distilgpt2"
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+ONNX_DIR = os.path.join(os.path.dirname(BASE_DIR), "models", "distilgpt2-onnx")
+ONNX_FP32 = os.path.join(ONNX_DIR, "model.onnx")
+ONNX_INT8 = os.path.join(ONNX_DIR, "model.int8.onnx")
+
+BACKENDS = ("torch", "torch-int8", "onnx-int8")
+DEFAULT_BACKEND = os.environ.get("SIGN2VOICE_SUGG_BACKEND", "torch")
+
+# Suggestions for recently seen contexts (default backend only); 0 disables
+CACHE_SIZE = int(os.environ.get("SIGN2VOICE_SUGG_CACHE", "256"))
+
+
+class TorchBackend:
+    """Eager PyTorch model, optionally with dynamic int8 Linear layers."""
+
+    def __init__(self, quantize=False):
+        import torch
+        from transformers import GPT2LMHeadModel
+        model = GPT2LMHeadModel.from_pretrained(MODEL_NAME)
+        model.eval()
+        if quantize:
+            # GPT-2 uses Conv1D (not nn.Linear) for its projections, so only
+            # the LM head is picked up unless we convert them first.
+            from transformers.pytorch_utils import Conv1D
+            _conv1d_to_linear(model, Conv1D)
+            model = torch.ao.quantization.quantize_dynamic(
+                model, {torch.nn.Linear}, dtype=torch.qint8)
+        self._torch = torch
+        self.model = model
+
+    def next_token_logits(self, input_ids):
+        # per call: grad mode is thread-local and this runs on the suggestion worker
+        with self._torch.inference_mode():
+            ids = self._torch.from_numpy(input_ids[None, :])
+            logits = self.model(ids).logits
+            return logits[0, -1].float().numpy()
+
+
+class OnnxBackend:
+    """Dynamic-int8 ONNX graph run through onnxruntime (no torch import)."""
+
+    def __init__(self, path=ONNX_INT8, threads=None):
+        import onnxruntime as ort
+        if not os.path.exists(path):
+            raise FileNotFoundError(
+                f"{path} not found - run `python -m app.suggestions --export-onnx` first")
+        opts = ort.SessionOptions()
+        opts.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if threads:
+            opts.intra_op_num_threads = threads
+        self.session = ort.InferenceSession(path, opts, providers=["CPUExecutionProvider"])
+
+    def next_token_logits(self, input_ids):
+        logits, = self.session.run(["logits"], {"input_ids": input_ids[None, :]})
+        return logits[0, -1]
+
+
+def _conv1d_to_linear(module, conv1d_cls):
+    """Swap HF Conv1D layers for equivalent nn.Linear so they can be quantised."""
+    import torch
+    for name, child in module.named_children():
+        if isinstance(child, conv1d_cls):
+            n_in, n_out = child.weight.shape
+            linear = torch.nn.Linear(n_in, n_out)
+            linear.weight.data = child.weight.data.t().contiguous()
+            linear.bias.data = child.bias.data
+            setattr(module, name, linear)
+        else:
+            _conv1d_to_linear(child, conv1d_cls)
+
+
+def load_backend(name=DEFAULT_BACKEND):
+    if name == "torch":
+        return TorchBackend()
+    if name == "torch-int8":
+        return TorchBackend(quantize=True)
+    if name == "onnx-int8":
+        return OnnxBackend()
+    raise ValueError(f"Unknown suggestion backend {name!r} (expected one of {BACKENDS})")
+
+
+_tokenizer = None
+_backends = {}
+_cache = OrderedDict()          # (context, k) → suggestions, least recently used first
+cache_stats = {"hits": 0, "misses": 0}
+
+
+def cache_hit_rate():
+    """Share of get_suggestions calls answered from the cache (None before the first)."""
+    total = cache_stats["hits"] + cache_stats["misses"]
+    return cache_stats["hits"] / total if total else None
+
+def get_tokenizer():
+    global _tokenizer
+    if _tokenizer is None:
+        from transformers import GPT2Tokenizer
+        _tokenizer = GPT2Tokenizer.from_pretrained(MODEL_NAME)
+    return _tokenizer
+
+def get_backend(name=DEFAULT_BACKEND):
+    if name not in _backends:
+        _backends[name] = load_backend(name)
+    return _backends[name]
 
-# Load a small, fast model once
-tokenizer = GPT2Tokenizer.from_pretrained("distilgpt2")
-model     = GPT2LMHeadModel.from_pretrained("distilgpt2")
-model.eval()
 
 def _clean(tok: str) -> str:
     tok = tok.strip()
     # filter out very short or non-alpha tokens
     return tok if len(tok) > 1 and re.fullmatch(r"[A-Za-z']+", tok) else ""
 
-def get_suggestions(context: str, k: int = 3):
+def top_token_ids(context: str, n: int, backend=None):
+    """Ids of the n most likely next tokens, best first."""
+    backend = backend or get_backend()
+    input_ids = np.asarray(get_tokenizer().encode(context), dtype=np.int64)
+    logits = backend.next_token_logits(input_ids)
+    top = np.argpartition(logits, -n)[-n:]
+    return top[np.argsort(logits[top])[::-1]].tolist()
+
+def get_suggestions(context: str, k: int = 3, backend=None):
     """
     Return up to k high-probability next-word suggestions
     based on GPT-2's softmax of the very next token.
@@ -21,18 +147,15 @@ def get_suggestions(context: str, k: int = 3):
     context = context.strip()
     if not context:
         return []
+    key = (context, k)
+    if backend is None and key in _cache:
+        _cache.move_to_end(key)
+        cache_stats["hits"] += 1
+        return list(_cache[key])
 
-    # Encode context
-    input_ids = tokenizer.encode(context, return_tensors="pt")
-
-    # Get logits for next token
-    with torch.no_grad():
-        logits = model(input_ids).logits
-    next_logits = logits[0, -1]
-
-    # Top-k probabilities (grab a few extra for filtering)
-    top_k = torch.topk(next_logits, k * 4)     # more to allow filtering
-    tokens = top_k.indices.tolist()
+    # Top-k token ids (grab a few extra for filtering)
+    tokens = top_token_ids(context, k * 4, backend)
+    tokenizer = get_tokenizer()
 
     suggestions = []
     for tid in tokens:
@@ -41,4 +164,76 @@ def get_suggestions(context: str, k: int = 3):
             suggestions.append(word)
         if len(suggestions) >= k:
             break
+    if backend is None and CACHE_SIZE > 0:
+        cache_stats["misses"] += 1
+        _cache[key] = list(suggestions)
+        while len(_cache) > CACHE_SIZE:
+            _cache.popitem(last=False)
     return suggestions
+
+
+def topk_parity(candidate, reference, contexts, k=3):
+    """
+    Compare a backend's top-k next tokens with a reference backend.
+
+    Returns a dict with the mean top-k overlap (0-1), the top-1 agreement
+    rate and the contexts whose top-1 token differs.
+    """
+    overlap, top1, mismatches = [], 0, []
+    for ctx in contexts:
+        want = top_token_ids(ctx, k, reference)
+        got = top_token_ids(ctx, k, candidate)
+        overlap.append(len(set(want) & set(got)) / k)
+        if want[0] == got[0]:
+            top1 += 1
+        else:
+            mismatches.append(ctx)
+    return {
+        "topk_overlap": float(np.mean(overlap)) if overlap else 1.0,
+        "top1_agreement": top1 / len(contexts) if contexts else 1.0,
+        "mismatches": mismatches,
+    }
+
+
+def export_onnx(out_dir=ONNX_DIR, opset=17):
+    """Export distilgpt2 (logits only, no KV cache) and quantise it to int8."""
+    import torch
+    from transformers import GPT2LMHeadModel
+    from onnxruntime.quantization import quantize_dynamic, QuantType
+
+    class _LogitsOnly(torch.nn.Module):
+        def __init__(self, lm):
+            super().__init__()
+            self.lm = lm
+
+        def forward(self, input_ids):
+            return self.lm(input_ids, use_cache=False).logits
+
+    os.makedirs(out_dir, exist_ok=True)
+    fp32 = os.path.join(out_dir, os.path.basename(ONNX_FP32))
+    int8 = os.path.join(out_dir, os.path.basename(ONNX_INT8))
+
+    lm = GPT2LMHeadModel.from_pretrained(MODEL_NAME).eval()
+    dummy = torch.tensor([get_tokenizer().encode("hello my name is")])
+    torch.onnx.export(
+        _LogitsOnly(lm), (dummy,), fp32,
+        input_names=["input_ids"], output_names=["logits"],
+        dynamic_axes={"input_ids": {0: "batch", 1: "seq"},
+                      "logits": {0: "batch", 1: "seq"}},
+        opset_version=opset,
+    )
+    quantize_dynamic(fp32, int8, weight_type=QuantType.QInt8)
+    print(f"💾 Saved {fp32}")
+    print(f"💾 Saved {int8}")
+    return int8
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="distilgpt2 suggestion backends")
+    parser.add_argument("--export-onnx", action="store_true",
+                        help="Export + int8-quantise the ONNX model")
+    parser.add_argument("--out", default=ONNX_DIR)
+    args = parser.parse_args()
+    if args.export_onnx:
+        export_onnx(args.out)
@@ -0,0 +1,115 @@
+# app/temporal.py
+"""
+Streaming inference for the temporal landmark model (models/temporal_model.py).
+
+The model is a causal, dilated Conv1D stack (a small TCN) over per-frame
+features, read out at the last time step. Its receptive field is exactly
+the training window, so running it incrementally gives the same answer as
+re-running it on the last `window` frames - but each new frame costs one
+conv tap per layer instead of the whole window:
+
+* every conv layer keeps a ring buffer of its last (k - 1) * dilation + 1
+  inputs,
+* `step()` pushes the new frame's features through the stack once.
+
+Per-frame features (`frame_features`): the wrist-centred, scale-normalised
+hand (app.classifier.normalize_landmarks) plus the wrist's velocity in
+image coordinates, so movement signs like J and Z are visible.
+"""
+import numpy as np
+
+from app.classifier import normalize_landmarks
+
+NUM_FEATURES = 66
+
+
+def frame_features(landmarks, prev_wrist=None):
+    """(T, 63) raw landmark vectors → (T, 66) features; velocity of frame 0 uses prev_wrist."""
+    lm = np.asarray(landmarks, dtype=np.float32).reshape(-1, 63)
+    wrist = lm[:, :3]
+    before = np.concatenate([wrist[:1] if prev_wrist is None else prev_wrist[None, :],
+                             wrist[:-1]], axis=0)
+    return np.concatenate([normalize_landmarks(lm), wrist - before], axis=1)
+
+
+def forward_fill(landmarks, present):
+    """Hold the last seen hand over frames where it was lost (leading gaps take the first)."""
+    lm = np.asarray(landmarks, dtype=np.float32).copy()
+    idx = np.where(present, np.arange(len(lm)), 0)
+    np.maximum.accumulate(idx, out=idx)
+    first = np.argmax(present) if present.any() else 0
+    idx[:first] = first
+    return lm[idx]
+
+
+class TemporalClassifier:
+    """NumPy weights exported by models/temporal_model.py (.npz)."""
+
+    def __init__(self, weights_path=None, weights=None):
+        data = np.load(weights_path, allow_pickle=False) if weights_path else weights
+        self.class_names = [str(c) for c in data["classes"]]
+        self.W_in = data["W_in"].astype(np.float32)
+        self.b_in = data["b_in"].astype(np.float32)
+        self.dilations = [int(d) for d in data["dilations"]]
+        self.kernels = [data[f"K{i}"].astype(np.float32) for i in range(len(self.dilations))]
+        self.biases = [data[f"c{i}"].astype(np.float32) for i in range(len(self.dilations))]
+        self.W_out = data["W_out"].astype(np.float32)
+        self.b_out = data["b_out"].astype(np.float32)
+        k = self.kernels[0].shape[0]
+        self.window = 1 + (k - 1) * sum(self.dilations)    # receptive field
+        self.reset()
+
+    def reset(self):
+        """Forget the stream (hand lost for good, new user, …)."""
+        self.buffers = [np.zeros(((K.shape[0] - 1) * d + 1, K.shape[1]), np.float32)
+                        for K, d in zip(self.kernels, self.dilations)]
+        self.pos = 0                 # frames seen; ring index = pos % len(buffer)
+        self.prev_wrist = None
+        self.last_landmarks = None
+
+    def step(self, landmarks=None):
+        """
+        Feed one frame's (63,) landmarks, or None when the hand was not
+        detected (the last hand is held). Returns the (C,) softmax once a
+        full window has been seen, else None.
+        """
+        if landmarks is None:
+            if self.last_landmarks is None:
+                return None
+            landmarks = self.last_landmarks
+        landmarks = np.asarray(landmarks, dtype=np.float32).reshape(63)
+        self.last_landmarks = landmarks
+        x = frame_features(landmarks[None, :], self.prev_wrist)[0]
+        self.prev_wrist = landmarks[:3].copy()
+
+        h = np.maximum(x @ self.W_in + self.b_in, 0)
+        for K, c, d, buf in zip(self.kernels, self.biases, self.dilations, self.buffers):
+            n = len(buf)
+            buf[self.pos % n] = h
+            k = K.shape[0]
+            # Keras causal conv: out[t] = sum_i in[t - (k-1-i)*d] @ K[i]
+            out = c.copy()
+            for i in range(k):
+                out += buf[(self.pos - (k - 1 - i) * d) % n] @ K[i]
+            h = np.maximum(out, 0)
+        self.pos += 1
+        if self.pos < self.window:
+            return None
+        logits = h @ self.W_out + self.b_out
+        logits -= logits.max()
+        e = np.exp(logits)
+        return e / e.sum()
+
+    def predict_window(self, features):
+        """Reference / batch path: (N, window, 66) features → (N, C) softmax."""
+        h = np.maximum(features @ self.W_in + self.b_in, 0)
+        for K, c, d in zip(self.kernels, self.biases, self.dilations):
+            k = K.shape[0]
+            pad = np.zeros((h.shape[0], (k - 1) * d, h.shape[2]), np.float32)
+            hp = np.concatenate([pad, h], axis=1)
+            out = sum(hp[:, i * d: i * d + h.shape[1]] @ K[i] for i in range(k)) + c
+            h = np.maximum(out, 0)
+        logits = h[:, -1] @ self.W_out + self.b_out
+        logits -= logits.max(axis=1, keepdims=True)
+        e = np.exp(logits)
+        return e / e.sum(axis=1, keepdims=True)
@@ -1,13 +1,25 @@
 # app/tts.py
 import pyttsx3
 
+_speaking = 0                   # 1 while speak() is in runAndWait (metrics)
+
 _engine = pyttsx3.init()        # initialise once
 _engine.setProperty("rate", 180)  # words-per-minute
 _engine.setProperty("volume", 1.0)
 
 def speak(text: str):
-    """Speak the given text aloud (non-blocking)."""
+    """Speak the given text aloud; returns once it has been spoken."""
+    global _speaking
     if not text.strip():
         return
-    _engine.say(text)
-    _engine.runAndWait()
+    _speaking = 1
+    try:
+        _engine.say(text)
+        _engine.runAndWait()
+    finally:
+        _speaking = 0
+
+
+def speaking():
+    """1 while an utterance is being spoken, else 0 (speak() blocks, so there is no backlog)."""
+    return _speaking
@@ -0,0 +1,129 @@
+# benchmarks/calibration_bench.py
+"""
+Frames-to-commit with the fixed gate vs calibrated per-letter gates.
+
+Simulates an overconfident classifier: every letter has its own
+separability, some letters have a confusable partner, and frame noise is
+AR(1)-correlated like a real webcam stream. A held-out set of frames is
+used to fit the calibration exactly as models/calibrate.py does, then both
+decoders run over the same signed letter sequences.
+
+    python -m benchmarks.calibration_bench --letters 2000 --hold 30
+"""
+import argparse
+import numpy as np
+
+from app.classifier import apply_temperature
+from app.decoder import LetterDecoder
+from benchmarks.common import print_table
+from models.calibrate import derive_gates, expected_calibration_error, fit_temperature
+
+CLASSES = [chr(ord("A") + i) for i in range(26)] + ["space", "del"]
+
+
+class SimulatedClassifier:
+    def __init__(self, rng, overconfidence=2.5, noise=1.0, rho=0.7):
+        n = len(CLASSES)
+        self.rng = rng
+        self.separability = rng.uniform(1.5, 4.5, n)
+        self.partner = rng.permutation(n)
+        self.partner_weight = np.where(rng.random(n) < 0.3, rng.uniform(0.5, 0.9, n), 0.0)
+        self.overconfidence = overconfidence
+        self.noise = noise
+        self.rho = rho
+
+    def _probs(self, labels, eps):
+        logits = self.noise * eps
+        idx = np.arange(len(labels))
+        logits[idx, labels] += self.separability[labels]
+        logits[idx, self.partner[labels]] += self.separability[labels] * self.partner_weight[labels]
+        logits *= self.overconfidence
+        logits -= logits.max(axis=1, keepdims=True)
+        p = np.exp(logits)
+        return p / p.sum(axis=1, keepdims=True)
+
+    def frames(self, labels):
+        """Independent frames (the held-out split)."""
+        return self._probs(labels, self.rng.standard_normal((len(labels), len(CLASSES))))
+
+    def stream(self, labels):
+        """Consecutive frames with AR(1) noise."""
+        eps = self.rng.standard_normal((len(labels), len(CLASSES)))
+        for t in range(1, len(labels)):
+            eps[t] = self.rho * eps[t - 1] + np.sqrt(1 - self.rho ** 2) * eps[t]
+        return self._probs(labels, eps)
+
+
+def run(decoder, probs, labels, hold):
+    """Frames-to-commit per letter, wrong commits and letters never committed."""
+    names = np.asarray(CLASSES)
+    pred = probs.argmax(axis=1)
+    conf = probs.max(axis=1)
+    latencies, wrong, missed = [], 0, 0
+    for start in range(0, len(labels), hold):
+        target = CLASSES[labels[start]]
+        decoder.reset()                     # hand drops between letters
+        hit = None
+        for t in range(start, start + hold):
+            token = decoder.update(names[pred[t]], conf[t])
+            if token is None:
+                continue
+            if token == target and hit is None:
+                hit = t - start + 1
+            elif token != target:
+                wrong += 1
+        if hit is None:
+            missed += 1
+        else:
+            latencies.append(hit)
+    return latencies, wrong, missed
+
+
+def main(args):
+    rng = np.random.default_rng(args.seed)
+    clf = SimulatedClassifier(rng, args.overconfidence)
+    n = len(CLASSES)
+
+    held_y = rng.integers(0, n, args.held_out)
+    held = clf.frames(held_y)
+    temperature = fit_temperature(held, held_y)
+    gates = derive_gates(apply_temperature(held, temperature), held_y, CLASSES)
+
+    seq = rng.integers(0, n, args.letters)
+    labels = np.repeat(seq, args.hold)
+    probs = clf.stream(labels)
+
+    policies = {
+        "fixed (0.8, 6 votes)": (LetterDecoder(), probs),
+        "temperature only": (LetterDecoder(), apply_temperature(probs, temperature)),
+        "calibrated gates": (LetterDecoder(
+            thresholds={c: g["threshold"] for c, g in gates.items()},
+            votes={c: g["vote"] for c, g in gates.items()}),
+            apply_temperature(probs, temperature)),
+    }
+    rows = []
+    for name, (decoder, p) in policies.items():
+        lat, wrong, missed = run(decoder, p, labels, args.hold)
+        rows.append({"policy": name,
+                     "mean_frames": float(np.mean(lat)) if lat else float("nan"),
+                     "p95_frames": float(np.percentile(lat, 95)) if lat else float("nan"),
+                     "wrong_per_100": 100 * wrong / args.letters,
+                     "missed_per_100": 100 * missed / args.letters})
+
+    print(f"T = {temperature:.2f} | held-out ECE {expected_calibration_error(held, held_y):.3f} → "
+          f"{expected_calibration_error(apply_temperature(held, temperature), held_y):.3f} | "
+          f"{len(gates)}/{n} letters with faster gates")
+    print_table(rows, ["policy", "mean_frames", "p95_frames", "wrong_per_100", "missed_per_100"])
+    base, cal = rows[0]["mean_frames"], rows[-1]["mean_frames"]
+    print(f"\nMean frames-to-commit {base:.2f} → {cal:.2f} ({100 * (1 - cal / base):.1f}% fewer)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--letters", type=int, default=2000)
+    parser.add_argument("--hold", type=int, default=30, help="Frames each letter is held")
+    parser.add_argument("--held_out", type=int, default=20000, help="Frames for fitting")
+    parser.add_argument("--overconfidence", type=float, default=2.5,
+                        help="Logit scale of the simulated model (true T)")
+    parser.add_argument("--seed", type=int, default=0)
+    main(parser.parse_args())
@@ -0,0 +1,51 @@
+# benchmarks/common.py
+"""Small helpers shared by the benchmark scripts."""
+import os, sys, time
+import numpy as np
+
+
+def rss_mb():
+    """Current resident set size of this process in MB."""
+    try:
+        import psutil
+        return psutil.Process(os.getpid()).memory_info().rss / 2**20
+    except ImportError:
+        import resource
+        # ru_maxrss is the peak, in KB on Linux and bytes on macOS
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / (2**20 if sys.platform == "darwin" else 2**10)
+
+
+def time_calls(fn, repeat, warmup=3):
+    """Call fn() repeat times and return per-call latencies in ms."""
+    for _ in range(warmup):
+        fn()
+    times = np.empty(repeat)
+    for i in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        times[i] = (time.perf_counter() - t0) * 1e3
+    return times
+
+
+def summarize(times_ms):
+    """mean / p50 / p95 of a latency array (ms)."""
+    return {
+        "mean_ms": float(np.mean(times_ms)),
+        "p50_ms": float(np.percentile(times_ms, 50)),
+        "p95_ms": float(np.percentile(times_ms, 95)),
+    }
+
+
+def print_table(rows, columns):
+    """Print a list of dicts as a fixed-width table."""
+    widths = [max(len(c), *(len(_fmt(r.get(c))) for r in rows)) for c in columns]
+    print("  ".join(c.ljust(w) for c, w in zip(columns, widths)))
+    for r in rows:
+        print("  ".join(_fmt(r.get(c)).ljust(w) for c, w in zip(columns, widths)))
+
+
+def _fmt(v):
+    if isinstance(v, float):
+        return f"{v:.3f}"
+    return "" if v is None else str(v)
@@ -0,0 +1,97 @@
+# benchmarks/engine_bench.py
+"""
+Engine.process (one classifier call per frame) vs Engine.process_batch
+(one call per N frames) on the same recorded hands.
+
+A scratch registry holds a NumPy student (models/landmark_student.npz if
+given, else random weights) and a synthetic session trace drives the
+"trace" detector, so no camera, MediaPipe or TensorFlow is needed. Every
+batch size must commit exactly the tokens the per-frame run commits.
+
+    python -m benchmarks.engine_bench --frames 3000 --hands 2 --batch 8 32 128
+"""
+import argparse, os, shutil, sys, tempfile, time
+import numpy as np
+
+from app.engine import Engine
+from app.metrics import MetricsRegistry
+from app.model_registry import ModelRegistry
+from app.session_recorder import SessionRecorder
+from benchmarks.common import print_table
+from benchmarks.hot_swap_bench import make_student
+
+
+def make_trace(path, frames, hands, classes, seed=0):
+    """Hands that hold still for a while, then move on: enough repeats to commit letters."""
+    rng = np.random.default_rng(seed)
+    recorder = SessionRecorder(path, classes, hands)
+    poses = rng.random((16, hands, 21, 3), dtype=np.float32)
+    for i in range(frames):
+        n = 0 if i % 60 >= 50 else hands            # hands leave the view now and then
+        pose = poses[(i // 60) % len(poses)]
+        jitter = 0.002 * rng.standard_normal(pose.shape).astype(np.float32)
+        recorder.record(i, (pose + jitter)[:n], list(range(n)), np.zeros((n, len(classes))),
+                        [None] * n)
+    recorder.close()
+
+
+def run(registry_path, trace_path, hands, batch, frames):
+    engine = Engine(registry_path, "student", max_hands=hands, detector="trace",
+                    detector_options={"path": trace_path}, metrics=MetricsRegistry(),
+                    draw=False).load().warm()
+    engine.classifier.temperature = 0.05          # random weights: sharpen so letters commit
+    blank = np.zeros((48, 64, 3), np.uint8)
+    tokens = []
+    t0 = time.perf_counter()
+    for start in range(0, frames, batch):
+        chunk = [blank] * min(batch, frames - start)
+        results = ([engine.process(chunk[0])] if batch == 1 else engine.process_batch(chunk))
+        tokens.extend((r.seq, t.id, tok) for r in results
+                      for t, _, _, tok in r.hands() if tok is not None)
+    elapsed = time.perf_counter() - t0
+    engine.close()
+    return {"batch": batch, "frames_per_s": frames / elapsed,
+            "us_per_frame": elapsed / frames * 1e6, "tokens": len(tokens)}, tokens
+
+
+def main(args):
+    tmp = tempfile.mkdtemp()
+    try:
+        student = os.path.join(tmp, "student.npz")
+        if args.student:
+            shutil.copy(args.student, student)
+        else:
+            make_student(student, args.hidden)
+        registry_path = os.path.join(tmp, "registry.json")
+        registry = ModelRegistry(registry_path)
+        entry = registry.register("student", student, repeat=5)
+        registry.activate(entry["name"])
+        classes = [str(c) for c in entry["classes"]]
+        trace_path = os.path.join(tmp, "trace.s2v")
+        make_trace(trace_path, args.frames, args.hands, classes)
+
+        rows, reference = [], None
+        for batch in [1, *args.batch]:
+            row, tokens = run(registry_path, trace_path, args.hands, batch, args.frames)
+            reference = tokens if reference is None else reference
+            row["same_tokens"] = tokens == reference
+            row["speedup"] = rows[0]["us_per_frame"] / row["us_per_frame"] if rows else 1.0
+            rows.append(row)
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+    print_table(rows, ["batch", "frames_per_s", "us_per_frame", "speedup", "tokens", "same_tokens"])
+    if not all(r["same_tokens"] for r in rows):
+        print("❌ process_batch committed different tokens than process")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--frames", type=int, default=3000)
+    parser.add_argument("--hands", type=int, default=2)
+    parser.add_argument("--batch", type=int, nargs="+", default=[8, 32, 128])
+    parser.add_argument("--student", help="A trained models/landmark_student.npz")
+    parser.add_argument("--hidden", type=int, nargs="+", default=[256, 256],
+                        help="Random student width when --student is not given")
+    main(parser.parse_args())
@@ -0,0 +1,196 @@
+# benchmarks/governor_bench.py
+"""
+Latency and CPU of the live loop under three policies: a fixed 10 ms
+reschedule, the FrameGovernor (app/governor.py) with its active rate pinned
+at --max_fps ("governor fixed"), and the governor stepping its rate down
+toward --min_fps while latency is over --target_ms ("governor adaptive").
+
+The loop is the GUI's: read a frame, RecognitionPipeline.process, wait,
+repeat. What MediaPipe would cost is stood in for by a fixed amount of
+real CPU work per frame (--detect_ms; MediaPipe resizes to fixed model
+inputs, so its cost hardly depends on the frame size), and the camera is
+simulated on the wall clock: frames arrive at --camera_fps into a small
+driver buffer that drops the oldest frame when full, like a V4L2 webcam,
+and a grab() with nothing buffered waits for the next frame. The governor
+reads the rate and buffer depth off the camera as it does from
+cv2.VideoCapture; --unknown_buffer plays a camera that doesn't report them.
+A hand is in view for the first --hand_s seconds of every --cycle_s.
+
+Latency is capture → result; CPU is process time / wall time. "loaded"
+multiplies the detector cost by --load (another process on the CPU);
+active_fps is the rate the adaptive governor settled on.
+
+    python -m benchmarks.governor_bench --seconds 12 --detect_ms 25 --load 3
+"""
+import argparse, os, sys, tempfile, time
+import cv2
+import numpy as np
+
+from app.camera import DetectedHands
+from app.governor import FrameGovernor
+from app.model_registry import LiveModel, ModelRegistry
+from app.engine import RecognitionPipeline
+from benchmarks.common import print_table
+from benchmarks.hot_swap_bench import make_student
+
+
+class SimCamera:
+    """Frames stamped with their capture time; read() returns the oldest still buffered."""
+    def __init__(self, fps=30, buffer=4, width=640, height=480):
+        self.fps, self.buffer = fps, buffer
+        self.frame = np.random.default_rng(0).integers(0, 255, (height, width, 3), np.uint8)
+        self.t0 = time.perf_counter()
+        self.next = 0
+        self.captured_at = None
+        self.dropped = 0
+        self.reports_buffer = True
+
+    def grab(self):
+        newest = int((time.perf_counter() - self.t0) * self.fps)
+        if self.next > newest:                     # nothing new yet: wait for the camera
+            time.sleep(max(0.0, self.t0 + self.next / self.fps - time.perf_counter()))
+            newest = self.next
+        oldest = max(self.next, newest - self.buffer + 1)
+        self.dropped += oldest - self.next         # overwritten in the driver buffer
+        self.captured_at = self.t0 + oldest / self.fps
+        self.next = oldest + 1
+        return True
+
+    def read(self):
+        return self.grab(), self.frame
+
+    def get(self, prop):
+        """cv2.VideoCapture.get for the two properties the governor asks about."""
+        if prop == cv2.CAP_PROP_FPS:
+            return float(self.fps)
+        if prop == cv2.CAP_PROP_BUFFERSIZE:
+            return float(self.buffer) if self.reports_buffer else -1.0
+        return 0.0
+
+
+class SimDetector:
+    """Fixed CPU cost per frame; hands on a fixed schedule."""
+    def __init__(self, camera, reps, hand_s, cycle_s):
+        self.camera, self.reps = camera, reps
+        self.hand_s, self.cycle_s = hand_s, cycle_s
+        self.landmarks = np.random.default_rng(1).random((1, 21, 3), dtype=np.float32)
+
+    def detect_hands(self, img, draw=True, rgb=None):
+        rgb = cv2.cvtColor(img, cv2.COLOR_BGR2RGB) if rgb is None else rgb
+        for _ in range(self.reps):
+            cv2.GaussianBlur(rgb, (15, 15), 0)
+        visible = (self.camera.captured_at - self.camera.t0) % self.cycle_s < self.hand_s
+        lm = self.landmarks if visible else self.landmarks[:0]
+        h, w = img.shape[:2]
+        pixels = (lm[:, :, :2] * np.array([w, h], np.float32)).astype(np.int32)
+        return img, DetectedHands(lm, pixels, ["Right"] * len(lm), [])
+
+    def draw(self, img, found):
+        pass
+
+
+def calibrate_reps(detect_ms, width=640, height=480):
+    rgb = np.zeros((height, width, 3), np.uint8)
+    t0 = time.perf_counter()
+    for _ in range(20):
+        cv2.GaussianBlur(rgb, (15, 15), 0)
+    per_call = (time.perf_counter() - t0) / 20 * 1e3
+    return max(1, round(detect_ms / per_call))
+
+
+POLICIES = ("fixed 10 ms", "governor fixed", "governor adaptive")
+
+
+def run(registry, reps, args, policy, load):
+    camera = SimCamera(args.camera_fps, args.buffer)
+    camera.reports_buffer = not args.unknown_buffer
+    detector = SimDetector(camera, round(reps * load), args.hand_s, args.cycle_s)
+    pipeline = RecognitionPipeline(detector, LiveModel(registry, "landmark"), draw=False)
+    governor = None
+    if policy != "fixed 10 ms":
+        min_fps = args.min_fps if policy == "governor adaptive" else args.max_fps
+        governor = FrameGovernor(args.target_ms, max_fps=args.max_fps, min_fps=min_fps)
+    if governor:
+        governor.configure_camera(camera)
+
+    latency = []
+    wall0, cpu0 = time.perf_counter(), time.process_time()
+    while time.perf_counter() - wall0 < args.seconds:
+        for _ in range(governor.stale_frames() if governor else 0):
+            camera.grab()
+        ok, frame = camera.read()
+        t_start = time.perf_counter()
+        result = pipeline.process(frame)
+        now = time.perf_counter()
+        latency.append((now - camera.captured_at) * 1e3)
+        if governor:
+            delay = governor.update((now - t_start) * 1e3, len(result.found))
+        else:
+            delay = 10
+        time.sleep(delay / 1e3)                    # root.after(delay, update_frame)
+    wall, cpu = time.perf_counter() - wall0, time.process_time() - cpu0
+
+    latency = np.array(latency)
+    return {"policy": policy,
+            "cpu": "loaded" if load > 1 else "normal",
+            "frames": len(latency), "fps": len(latency) / wall,
+            "latency_p50_ms": float(np.percentile(latency, 50)),
+            "latency_p95_ms": float(np.percentile(latency, 95)),
+            "cpu_pct": 100 * cpu / wall,
+            "active_fps": governor.fps if governor else float("nan"),
+            "idle_frames": governor.stats["idle_frames"] if governor else 0,
+            "overwritten": camera.dropped,
+            "stale_grabbed": governor.stats["stale_dropped"] if governor else 0}
+
+
+def main(args):
+    reps = calibrate_reps(args.detect_ms)
+    print(f"🧪 Detector stand-in: {reps} blur passes ≈ {args.detect_ms} ms at 640x480")
+    with tempfile.TemporaryDirectory() as tmp:
+        make_student(os.path.join(tmp, "student.npz"), [256])
+        registry = ModelRegistry(os.path.join(tmp, "registry.json"))
+        registry.register("student", os.path.join(tmp, "student.npz"), repeat=5)
+        registry.activate("student")
+        rows = [run(registry, reps, args, policy, load)
+                for load in (1.0, args.load) for policy in POLICIES]
+
+    print_table(rows, ["policy", "cpu", "frames", "fps", "latency_p50_ms", "latency_p95_ms",
+                       "cpu_pct", "active_fps", "idle_frames", "overwritten", "stale_grabbed"])
+    normal = dict(zip(POLICIES, rows[:3]))
+    loaded = dict(zip(POLICIES, rows[3:]))
+    adaptive, pinned = loaded["governor adaptive"], loaded["governor fixed"]
+    print(f"\nloaded: adaptive vs fixed rate - latency p50 {pinned['latency_p50_ms']:.0f} → "
+          f"{adaptive['latency_p50_ms']:.0f} ms, p95 {pinned['latency_p95_ms']:.0f} → "
+          f"{adaptive['latency_p95_ms']:.0f} ms, CPU {pinned['cpu_pct']:.0f} → "
+          f"{adaptive['cpu_pct']:.0f}% at {adaptive['active_fps']:.1f} fps")
+    if normal["governor adaptive"]["cpu_pct"] > normal["fixed 10 ms"]["cpu_pct"]:
+        print("❌ Governor did not cut CPU")
+        sys.exit(1)
+    if adaptive["cpu_pct"] > pinned["cpu_pct"]:
+        print("❌ Adaptive rate did not cut loaded CPU")
+        sys.exit(1)
+    # without the buffer depth nothing is skipped, so loaded latency can't improve
+    if not args.unknown_buffer and adaptive["latency_p50_ms"] > loaded["fixed 10 ms"]["latency_p50_ms"]:
+        print("❌ Governor did not cut loaded latency")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seconds", type=float, default=12.0, help="Per policy and load")
+    parser.add_argument("--detect_ms", type=float, default=25.0,
+                        help="Detector cost at full resolution on an unloaded CPU")
+    parser.add_argument("--load", type=float, default=3.0,
+                        help="Detector cost multiplier for the loaded-CPU runs")
+    parser.add_argument("--target_ms", type=float, default=50.0)
+    parser.add_argument("--max_fps", type=float, default=30.0, help="Governor active rate")
+    parser.add_argument("--min_fps", type=float, default=10.0,
+                        help="Lowest rate the adaptive governor steps down to")
+    parser.add_argument("--camera_fps", type=float, default=30.0)
+    parser.add_argument("--buffer", type=int, default=4, help="Camera driver buffer (frames)")
+    parser.add_argument("--unknown_buffer", action="store_true",
+                        help="The camera doesn't report its buffer depth (no stale grabs)")
+    parser.add_argument("--hand_s", type=float, default=3.0,
+                        help="Seconds a hand is in view at the start of each cycle")
+    parser.add_argument("--cycle_s", type=float, default=8.0)
+    main(parser.parse_args())
@@ -0,0 +1,92 @@
+# benchmarks/hot_swap_bench.py
+"""
+Does switching models mid-session cost frames?
+
+Registers two NumPy student models (random weights, wide enough that
+loading and warming them takes real time) in a scratch registry, runs a
+paced frame loop, and switches the active model part-way through:
+
+* hot swap         - LiveModel.poll() each frame; load + warm-up happen
+                     on a background thread, the swap is one assignment.
+* blocking reload  - what restarting the classifier in the loop costs:
+                     load + warm-up inside the frame that notices.
+
+A frame is "dropped" when its work overruns the frame budget.
+
+    python -m benchmarks.hot_swap_bench --frames 300 --hidden 1024 1024
+"""
+import argparse, os, sys, tempfile, time
+import numpy as np
+
+from app.model_registry import LiveModel, ModelRegistry
+from benchmarks.common import print_table, summarize
+
+
+def make_student(path, hidden, classes=26, seed=0):
+    rng = np.random.default_rng(seed)
+    sizes = [63, *hidden, classes]
+    arrays = {"n_layers": np.array(len(sizes) - 1),
+              "classes": np.array([chr(65 + i) for i in range(classes)])}
+    for i, (a, b) in enumerate(zip(sizes[:-1], sizes[1:])):
+        arrays[f"W{i}"] = rng.normal(0, 1 / np.sqrt(a), (a, b)).astype(np.float32)
+        arrays[f"b{i}"] = np.zeros(b, np.float32)
+    np.savez(path, **arrays)
+
+
+def run(live, registry, frames, swap_at, fps, blocking):
+    budget_ms = 1e3 / fps
+    hands = np.random.default_rng(1).random((frames, 1, 63), dtype=np.float32)
+    work_ms, served_by = np.empty(frames), []
+    for i in range(frames):
+        t0 = time.perf_counter()
+        if i == swap_at:
+            registry.activate("student_b")
+            if blocking:
+                live.current = registry.load(registry.active("landmark")).warm()
+        if not blocking:
+            live.poll()
+        live.model.predict_batch(hands[i])
+        served_by.append(live.current.key)
+        work_ms[i] = (time.perf_counter() - t0) * 1e3
+        time.sleep(max(0.0, budget_ms / 1e3 - (time.perf_counter() - t0)))
+    swapped = served_by.index("student_b:1") if "student_b:1" in served_by else None
+    return {"policy": "blocking reload" if blocking else "hot swap",
+            **summarize(work_ms), "max_ms": float(work_ms.max()),
+            "dropped": int((work_ms > budget_ms).sum()),
+            "swap_frame": swapped, "frames_to_swap": None if swapped is None else swapped - swap_at}
+
+
+def main(args):
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, seed in (("student_a", 0), ("student_b", 1)):
+            make_student(os.path.join(tmp, f"{name}.npz"), args.hidden, seed=seed)
+        rows = []
+        for blocking in (False, True):
+            path = os.path.join(tmp, f"registry_{int(blocking)}.json")
+            registry = ModelRegistry(path)
+            for name in ("student_a", "student_b"):
+                entry = registry.register("student", os.path.join(tmp, f"{name}.npz"), repeat=20)
+            registry.activate("student_a")
+            print(f"📦 {entry['name']}: load {entry['benchmark']['load_s'] * 1e3:.0f} ms, "
+                  f"{entry['benchmark']['latency_p50_ms']:.2f} ms/frame")
+            live = LiveModel(registry, "landmark", check_every=args.check_every)
+            rows.append(run(live, registry, args.frames, args.swap_at, args.fps, blocking))
+
+    print_table(rows, ["policy", "mean_ms", "p95_ms", "max_ms", "dropped",
+                       "swap_frame", "frames_to_swap"])
+    hot = rows[0]
+    if hot["swap_frame"] is None or hot["dropped"]:
+        print("❌ Hot swap missed the switch or overran the frame budget")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--swap_at", type=int, default=100)
+    parser.add_argument("--fps", type=float, default=30.0)
+    parser.add_argument("--hidden", type=int, nargs="+", default=[2048, 2048, 2048],
+                        help="Student width: bigger = slower load and warm-up")
+    parser.add_argument("--check_every", type=float, default=0.1,
+                        help="Seconds between manifest checks in LiveModel.poll")
+    main(parser.parse_args())
@@ -0,0 +1,102 @@
+# benchmarks/hybrid_bench.py
+"""
+Accuracy gained by the image-CNN fallback vs what it costs per frame.
+
+Images in per-letter folders (e.g. the ASL alphabet test split) are
+replayed as a video at --fps: MediaPipe runs once per image, then the
+landmark-only path and HybridRecognizer at several `low_conf` settings
+classify the same detections. The compute budget is enforced on the
+simulated clock, so "over_budget" shows how often it capped the slow path.
+
+    python -m benchmarks.hybrid_bench --dir data/raw/asl_alphabet_test --fps 30
+"""
+import argparse, os, time
+import cv2
+import numpy as np
+
+from app.camera import DetectedHands, HandDetector
+from app.classifier import LandmarkClassifier, StudentClassifier
+from app.hybrid import HybridRecognizer
+from app.recognizer import ASLRecognizer
+from benchmarks.common import print_table
+from benchmarks.recognizer_bench import list_images
+
+
+def detect_all(paths):
+    detector = HandDetector(max_hands=1, detection_confidence=0.3, static_image_mode=True)
+    frames = []
+    for p in paths:
+        img = cv2.imread(p)
+        if img is None:
+            continue
+        _, found = detector.detect_hands(img, draw=False)
+        frames.append((img, os.path.basename(os.path.dirname(p)),
+                       DetectedHands(found.landmarks.copy(), found.pixels.copy(),
+                                     list(found.handedness), found.raw)))
+    return frames
+
+
+def run(frames, classify):
+    correct, ms = 0, []
+    for i, (img, truth, found) in enumerate(frames):
+        t0 = time.perf_counter()
+        letters, _ = classify(i, img, found)
+        ms.append((time.perf_counter() - t0) * 1e3)
+        correct += bool(letters) and letters[0] == truth
+    return correct / len(frames), float(np.mean(ms)), float(np.percentile(ms, 95))
+
+
+def main(args):
+    paths = list_images(args.dir, args.limit)
+    print(f"🔍 Detecting hands in {len(paths)} images …")
+    frames = detect_all(paths)
+    detected = sum(len(f) > 0 for _, _, f in frames) / len(frames)
+
+    classifier = (StudentClassifier(args.student) if args.student
+                  else LandmarkClassifier(args.landmark_model, args.landmark_classes))
+    image = ASLRecognizer(args.image_model, args.image_labels)
+
+    def landmarks_only(i, img, found):
+        letters, confs, _ = classifier.predict_batch(found.vectors())
+        return letters, confs
+
+    acc, mean_ms, p95_ms = run(frames, landmarks_only)
+    rows = [{"policy": "landmarks only", "accuracy": acc, "mean_ms": mean_ms, "p95_ms": p95_ms,
+             "image_calls_pct": 0.0, "over_budget": 0}]
+
+    for low_conf in args.low_conf:
+        hybrid = HybridRecognizer(classifier, image, low_conf=low_conf, budget_ms=args.budget_ms,
+                                  max_age=0, full_frame=True)   # independent, training-style images
+
+        def cascaded(i, img, found):
+            letters, confs, *_ = hybrid.classify(img, found, now=i / args.fps)
+            return letters, confs
+
+        acc, mean_ms, p95_ms = run(frames, cascaded)
+        rows.append({"policy": f"hybrid low_conf={low_conf}", "accuracy": acc,
+                     "mean_ms": mean_ms, "p95_ms": p95_ms,
+                     "image_calls_pct": 100 * hybrid.stats["image_calls"] / len(frames),
+                     "over_budget": hybrid.stats["over_budget"]})
+
+    print(f"MediaPipe found a hand in {100 * detected:.1f}% of images | "
+          f"budget {args.budget_ms:.0f} ms/s at {args.fps:.0f} fps")
+    print_table(rows, ["policy", "accuracy", "mean_ms", "p95_ms", "image_calls_pct", "over_budget"])
+    base = rows[0]
+    for r in rows[1:]:
+        print(f"  {r['policy']}: +{100 * (r['accuracy'] - base['accuracy']):.2f} pts accuracy "
+              f"for +{r['mean_ms'] - base['mean_ms']:.2f} ms/frame")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--dir", required=True, help="Images in per-letter folders")
+    parser.add_argument("--landmark_model", default="models/landmark_cnn.h5")
+    parser.add_argument("--landmark_classes", default="models/landmark_classes.json")
+    parser.add_argument("--student", help="Use this distilled student .npz as the fast path")
+    parser.add_argument("--image_model", default="models/asl_cnn.h5")
+    parser.add_argument("--image_labels", default="models/label_map.json")
+    parser.add_argument("--low_conf", type=float, nargs="+", default=[0.5, 0.6, 0.8])
+    parser.add_argument("--budget_ms", type=float, default=100.0)
+    parser.add_argument("--fps", type=float, default=30.0)
+    parser.add_argument("--limit", type=int, default=0)
+    main(parser.parse_args())
@@ -0,0 +1,70 @@
+# benchmarks/landmarks_bench.py
+"""
+Per-frame cost of turning MediaPipe landmark protos into usable data.
+
+Compares the old list-of-tuples conversion in HandDetector plus the
+`lm_vec` list comprehension the live loops used, against the buffered
+NumPy conversion HandDetector.convert does now. Uses synthetic protos, so
+no camera or MediaPipe graph run is needed.
+
+    python -m benchmarks.landmarks_bench --hands 2
+"""
+import argparse
+import numpy as np
+from mediapipe.framework.formats import landmark_pb2, classification_pb2
+
+from app.camera import HandDetector
+from benchmarks.common import time_calls, summarize, print_table
+
+
+def make_protos(n_hands, rng):
+    hands, handedness = [], []
+    for i in range(n_hands):
+        lms = landmark_pb2.NormalizedLandmarkList()
+        for x, y, z in rng.random((21, 3)):
+            lms.landmark.add(x=x, y=y, z=z)
+        hands.append(lms)
+        cl = classification_pb2.ClassificationList()
+        cl.classification.add(label="Left" if i % 2 else "Right", score=0.9)
+        handedness.append(cl)
+    return hands, handedness
+
+
+def legacy(hands, shape):
+    all_landmarks, vecs = [], []
+    for handLms in hands:
+        landmarks = []
+        for id, lm in enumerate(handLms.landmark):
+            h, w, _ = shape
+            cx, cy = int(lm.x * w), int(lm.y * h)
+            landmarks.append((id, cx, cy))
+        all_landmarks.append(landmarks)
+        lm_vec = [c for p in handLms.landmark for c in (p.x, p.y, p.z)]
+        vecs.append(np.expand_dims(lm_vec, 0))
+    return all_landmarks, vecs
+
+
+def main(args):
+    rng = np.random.default_rng(0)
+    detector = HandDetector(max_hands=args.hands)
+    shape = (480, 640, 3)
+
+    rows = []
+    for n in range(1, args.hands + 1):
+        hands, handedness = make_protos(n, rng)
+        for name, fn in {
+            "legacy": lambda: legacy(hands, shape),
+            "numpy": lambda: detector.convert(hands, handedness, shape).vectors(),
+        }.items():
+            stats = summarize(time_calls(fn, args.repeat) * 1e3)
+            rows.append({"hands": n, "conversion": name,
+                         "mean_us": stats["mean_ms"], "p95_us": stats["p95_ms"]})
+
+    print_table(rows, ["hands", "conversion", "mean_us", "p95_us"])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--hands", type=int, default=2)
+    parser.add_argument("--repeat", type=int, default=5000)
+    main(parser.parse_args())
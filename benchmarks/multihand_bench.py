@@ -0,0 +1,45 @@
+# benchmarks/multihand_bench.py
+"""
+Per-frame classification cost versus number of hands.
+
+Compares the old per-hand `model.predict` calls, per-hand direct model calls
+and the single batched call used by LandmarkClassifier.
+
+    python -m benchmarks.multihand_bench --model models/landmark_cnn.h5
+"""
+import argparse
+import numpy as np
+import tensorflow as tf
+
+from benchmarks.common import time_calls, summarize, print_table
+from models.landmark_cnn import build_model
+
+
+def main(args):
+    if args.model:
+        model = tf.keras.models.load_model(args.model)
+    else:
+        model = build_model(num_classes=28)   # untrained, same cost
+    rng = np.random.default_rng(0)
+
+    rows = []
+    for n in range(1, args.max_hands + 1):
+        vecs = rng.random((n, 63), dtype=np.float32)
+        strategies = {
+            "predict x N": lambda: [model.predict(v[None], verbose=0) for v in vecs],
+            "call x N": lambda: [model(v[None], training=False).numpy() for v in vecs],
+            "batched": lambda: model(vecs, training=False).numpy(),
+        }
+        for name, fn in strategies.items():
+            stats = summarize(time_calls(fn, args.repeat))
+            rows.append({"hands": n, "strategy": name, **stats})
+
+    print_table(rows, ["hands", "strategy", "mean_ms", "p50_ms", "p95_ms"])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--model", help="Trained .h5 (default: untrained build_model)")
+    parser.add_argument("--max_hands", type=int, default=4)
+    parser.add_argument("--repeat", type=int, default=200)
+    main(parser.parse_args())
@@ -0,0 +1,103 @@
+# benchmarks/outbox_bench.py
+"""
+Throughput and loss-freedom of the sentence outbox against a flaky stub of
+POST /api/sentences/bulk (no Node / Mongo needed).
+
+The stub fails a fraction of requests with 503, and a fraction *after*
+storing the batch (the response is lost), so the run exercises both retry
+paths. It de-duplicates on clientId like the real endpoint. The run fails
+unless every enqueued sentence is stored exactly once.
+
+    python -m benchmarks.outbox_bench --n 2000 --fail_rate 0.2
+"""
+import argparse, json, os, random, sys, tempfile, threading, time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+
+from app.outbox import SentenceOutbox
+from benchmarks.common import summarize, print_table
+
+
+def make_stub(fail_rate, lost_rate, latency_s):
+    stored, lock = {}, threading.Lock()
+    stats = {"requests": 0, "failed": 0, "lost": 0}
+
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def do_POST(self):
+            body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            time.sleep(latency_s)
+            with lock:
+                stats["requests"] += 1
+                roll = random.random()
+                if roll < fail_rate:
+                    stats["failed"] += 1
+                    self.send_response(503)
+                    self.end_headers()
+                    return
+                for item in body["sentences"]:
+                    stored[item["clientId"]] = stored.get(item["clientId"], 0) + 1
+                if roll < fail_rate + lost_rate:
+                    stats["lost"] += 1
+                    self.send_response(502)   # stored, but the client never hears it
+                    self.end_headers()
+                    return
+            self.send_response(201)
+            self.send_header("Content-Type", "application/json")
+            self.end_headers()
+            self.wfile.write(b'{"message": "ok"}')
+
+    return Handler, stored, stats
+
+
+def main(args):
+    random.seed(args.seed)
+    handler, stored, stats = make_stub(args.fail_rate, args.lost_rate, args.latency_ms / 1e3)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        outbox = SentenceOutbox(f"http://127.0.0.1:{server.server_port}",
+                                db_path=os.path.join(tmp, "outbox.db"),
+                                batch_size=args.batch, max_backoff=0.2)
+        outbox._status = lambda msg: None
+
+        enqueue_ms = np.empty(args.n)
+        ids = []
+        t0 = time.perf_counter()
+        for i in range(args.n):
+            t = time.perf_counter()
+            ids.append(outbox.enqueue(f"sentence {i}", "bench", token="t"))
+            enqueue_ms[i] = (time.perf_counter() - t) * 1e3
+        drained = outbox.flush(timeout=args.timeout)
+        elapsed = time.perf_counter() - t0
+        outbox.close()
+    server.shutdown()
+
+    missing = [c for c in ids if c not in stored]
+    print_table([{"stage": "enqueue (UI thread)", **summarize(enqueue_ms)}],
+                ["stage", "mean_ms", "p50_ms", "p95_ms"])
+    print(f"\n{args.n} sentences in {elapsed:.2f}s → {args.n / elapsed:.0f} sentences/s")
+    print(f"requests={stats['requests']} failed={stats['failed']} lost_responses={stats['lost']}")
+    print(f"stored={len(stored)} missing={len(missing)} "
+          f"re-sent after lost response={sum(v > 1 for v in stored.values())}")
+
+    if not drained or missing:
+        print("❌ outbox lost sentences")
+        sys.exit(1)
+    print("✅ every sentence stored (duplicates collapse on clientId server-side)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--n", type=int, default=2000)
+    parser.add_argument("--batch", type=int, default=50)
+    parser.add_argument("--fail_rate", type=float, default=0.2)
+    parser.add_argument("--lost_rate", type=float, default=0.05)
+    parser.add_argument("--latency_ms", type=float, default=5.0)
+    parser.add_argument("--timeout", type=float, default=120.0)
+    parser.add_argument("--seed", type=int, default=1)
+    main(parser.parse_args())
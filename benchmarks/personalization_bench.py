@@ -0,0 +1,225 @@
+# benchmarks/personalization_bench.py
+"""
+Effective words per minute with the shared student vs the same student plus
+each user's adapter (app/personalize.py), on held-out frames of simulated
+users.
+
+Everything is synthetic: every letter has a prototype pose, some letters
+have a near twin, and each simulated user forms a few letters their own
+way (a fixed pull toward another letter) on top of a small personal
+offset. A fixed per-letter shift is exactly what a nearest-class-mean head
+corrects, so the gain here is an upper bound, not a measurement on real
+users; real signers drift, and their enrolment comes from noisier traces.
+Run it on recorded per-user traces (app/personalize.samples_from_trace)
+before quoting a number. The base
+student is trained on a population of other users. For each test user an
+adapter is fitted on a short enrolment (a few bursts of frames per letter),
+saved, loaded back, and then phrases are "typed" frame by frame through
+the real LetterDecoder at 30 fps: a wrong commit costs a `del` and a retry,
+a letter that never commits is given up after --give_up_s. With the
+default 6-frame vote and 6-frame gap, 30 WPM is the ceiling.
+
+    python -m benchmarks.personalization_bench --users 8 --enrol 12
+"""
+import argparse, difflib, os, shutil, sys, tempfile
+import numpy as np
+
+from app.classifier import StudentClassifier, normalize_landmarks
+from app.decoder import LetterDecoder, apply_token
+from app.personalize import PersonalizedClassifier, UserAdapter
+from benchmarks.common import print_table, time_calls
+
+CLASSES = [chr(ord("A") + i) for i in range(26)] + ["space", "del"]
+PHRASES = ["THE QUICK BROWN FOX", "JUMPS OVER THE LAZY DOG", "PLEASE CALL ME LATER",
+           "WHERE IS THE STATION", "I NEED SOME WATER", "THANK YOU VERY MUCH"]
+FPS = 30
+
+
+class Hands:
+    """Letter prototypes in the wrist-centred frame, and the raw vectors a camera would see."""
+
+    def __init__(self, rng, twins=8, twin_dist=0.5):
+        self.rng = rng
+        self.protos = rng.normal(0, 1, (len(CLASSES), 21, 3)).astype(np.float32)
+        self.protos[:, 0] = 0.0
+        for a, b in rng.choice(len(CLASSES), (twins, 2), replace=False):
+            self.protos[b] = self.protos[a] + twin_dist * rng.normal(0, 1, (21, 3))
+            self.protos[b, 0] = 0.0
+
+    def user(self, offset, quirks, pull):
+        """Per-letter poses of one user: an offset everywhere, some letters pulled toward another."""
+        rng = self.rng
+        poses = self.protos + offset * rng.normal(0, 1, self.protos.shape).astype(np.float32)
+        for c in rng.choice(len(CLASSES), quirks, replace=False):
+            other = rng.choice([k for k in range(len(CLASSES)) if k != c])
+            poses[c] += rng.uniform(*pull) * (self.protos[other] - self.protos[c])
+        poses[:, 0] = 0.0
+        return poses
+
+    def raw(self, lm, rng=None):
+        """(N, 21, 3) hand-frame poses → (N, 63) image-space vectors at a random place and size."""
+        rng = rng or self.rng
+        n = len(lm)
+        scale = rng.uniform(0.05, 0.15, (n, 1, 1))
+        where = np.concatenate([rng.uniform(0.3, 0.7, (n, 1, 2)), np.zeros((n, 1, 1))], axis=2)
+        return (where + scale * lm).reshape(n, 63).astype(np.float32)
+
+    def frames(self, poses, labels, noise, rho=0.7, rng=None):
+        """Consecutive frames of `labels` with AR(1) jitter, as a webcam stream."""
+        rng = rng or self.rng
+        eps = rng.normal(0, 1, (len(labels), 21, 3))
+        for t in range(1, len(labels)):
+            eps[t] = rho * eps[t - 1] + np.sqrt(1 - rho ** 2) * eps[t]
+        return self.raw(poses[labels] + noise * eps, rng)
+
+
+def train_student(hands, path, users, per_letter, noise, hidden, seed):
+    """The shared model: an MLP on many population users, exported as a student .npz."""
+    from sklearn.neural_network import MLPClassifier
+    X, y = [], []
+    for _ in range(users):
+        poses = hands.user(offset=0.08, quirks=0, pull=(0, 0))
+        labels = np.repeat(np.arange(len(CLASSES)), per_letter)
+        X.append(normalize_landmarks(hands.frames(poses, labels, noise, rho=0.0)))
+        y.append(labels)
+    mlp = MLPClassifier(hidden_layer_sizes=tuple(hidden), max_iter=300, random_state=seed)
+    mlp.fit(np.concatenate(X), np.concatenate(y))
+    arrays = {"n_layers": np.array(len(mlp.coefs_)), "classes": np.array(CLASSES)}
+    for i, (W, b) in enumerate(zip(mlp.coefs_, mlp.intercepts_)):
+        arrays[f"W{i}"] = W.astype(np.float32)
+        arrays[f"b{i}"] = b.astype(np.float32)
+    np.savez(path, **arrays)
+    return StudentClassifier(path)
+
+
+def enrolment(hands, poses, bursts, burst_len, noise):
+    """A few short holds of every letter, like the frames before kept commits in a trace."""
+    X, y = [], []
+    for c in range(len(CLASSES)):
+        for _ in range(bursts):
+            X.append(hands.frames(poses, np.full(burst_len, c), noise))
+            y += [CLASSES[c]] * burst_len
+    return np.concatenate(X), np.asarray(y)
+
+
+def sign(classifier, hands, poses, token, noise, give_up, rng):
+    """Hold one letter until the decoder commits something → (frames, token or None)."""
+    decoder = LetterDecoder()
+    frames = hands.frames(poses, np.full(give_up, CLASSES.index(token)), noise, rng=rng)
+    for i, vec in enumerate(frames):
+        letters, confs, _ = classifier.predict_batch(vec[None])
+        committed = decoder.update(letters[0], float(confs[0]))
+        if committed is not None:
+            return i + 1, committed
+    return give_up, None
+
+
+def type_phrase(classifier, hands, poses, phrase, noise, give_up, gap, rng):
+    """Sign `phrase` letter by letter, fixing wrong commits with `del` → (frames, text, fixes)."""
+    text, frames, fixes = "", 0, 0
+    for ch in phrase:
+        target = "space" if ch == " " else ch
+        for _ in range(3):                          # three tries, then move on
+            n, token = sign(classifier, hands, poses, target, noise, give_up, rng)
+            frames += n + gap
+            if token is None:
+                break
+            text = apply_token(text, token)
+            if token == target:
+                break
+            if token != "del":
+                fixes += 1
+                n, token = sign(classifier, hands, poses, "del", noise, give_up, rng)
+                frames += n + gap
+                if token is not None:
+                    text = apply_token(text, token)
+    return frames, text, fixes
+
+
+def effective_wpm(classifier, hands, poses, args, seed):
+    """Words (5 characters of the phrase got right) per minute over PHRASES."""
+    rng = np.random.default_rng(seed)           # same held-out frames for every classifier
+    frames = chars = fixes = 0
+    for phrase in PHRASES:
+        n, text, f = type_phrase(classifier, hands, poses, phrase, args.noise,
+                                 int(args.give_up_s * FPS), args.gap, rng)
+        frames += n
+        fixes += f
+        blocks = difflib.SequenceMatcher(None, text, phrase, autojunk=False).get_matching_blocks()
+        chars += sum(b.size for b in blocks)
+    minutes = frames / FPS / 60
+    return chars / 5 / minutes, fixes
+
+
+def main(args):
+    rng = np.random.default_rng(args.seed)
+    hands = Hands(rng)
+    tmp = tempfile.mkdtemp()
+    rows, sizes, overhead = [], [], {}
+    try:
+        base = train_student(hands, os.path.join(tmp, "student.npz"), args.population,
+                             args.train_per_letter, args.noise, args.hidden, args.seed)
+        one_hand = hands.raw(hands.protos[:1])
+        base_us = np.median(time_calls(lambda: base.predict_batch(one_hand), 500)) * 1e3
+        for u in range(args.users):
+            poses = hands.user(args.offset, args.quirks, (args.pull_min, args.pull_max))
+            X, y = enrolment(hands, poses, args.enrol // args.burst, args.burst, args.noise)
+            row = {"user": u}
+            row["base_wpm"], row["base_fixes"] = effective_wpm(base, hands, poses, args,
+                                                               (args.seed, u))
+            for features in args.features:
+                path = os.path.join(tmp, f"user{u}_{features}.npz")
+                UserAdapter.fit(base, X, y, features).save(path)
+                adapter = UserAdapter.load(path)    # what the GUI gets at login: float16 means
+                sizes.append(os.path.getsize(path))
+                personal = PersonalizedClassifier(base, adapter)
+                wpm, fixes = effective_wpm(personal, hands, poses, args, (args.seed, u))
+                row[f"{features}_alpha"] = adapter.alpha
+                row[f"{features}_wpm"], row[f"{features}_fixes"] = wpm, fixes
+                if u == 0:
+                    us = np.median(time_calls(lambda: personal.predict_batch(one_hand), 500)) * 1e3
+                    overhead[features] = us - base_us
+            rows.append(row)
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+    columns = ["user", "base_wpm", "base_fixes"]
+    for features in args.features:
+        columns += [f"{features}_alpha", f"{features}_wpm", f"{features}_fixes"]
+    mean = {"user": "mean"}
+    for c in columns[1:]:
+        mean[c] = float(np.mean([r[c] for r in rows]))
+    print_table(rows + [mean], columns)
+    print(f"\nstudent predict_batch (1 hand): {base_us:.1f} µs; adapter adds "
+          + ", ".join(f"{f} {us:+.1f} µs" for f, us in overhead.items())
+          + f"; adapter file {min(sizes)}–{max(sizes)} bytes")
+
+    for features in args.features:
+        gain = mean[f"{features}_wpm"] / mean["base_wpm"]
+        print(f"{features}: {mean['base_wpm']:.2f} → {mean[f'{features}_wpm']:.2f} WPM "
+              f"({gain:.2f}x)")
+        if mean[f"{features}_wpm"] < mean["base_wpm"]:
+            print(f"❌ {features} adapters made typing slower")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--users", type=int, default=8, help="Held-out test users")
+    parser.add_argument("--enrol", type=int, default=12, help="Enrolment frames per letter")
+    parser.add_argument("--burst", type=int, default=4, help="Frames per enrolment hold")
+    parser.add_argument("--features", nargs="+", default=["landmarks", "penultimate"],
+                        choices=["landmarks", "penultimate"])
+    parser.add_argument("--quirks", type=int, default=6,
+                        help="Letters each user forms their own way")
+    parser.add_argument("--pull_min", type=float, default=0.3)
+    parser.add_argument("--pull_max", type=float, default=0.6)
+    parser.add_argument("--offset", type=float, default=0.1, help="Personal offset on every letter")
+    parser.add_argument("--noise", type=float, default=0.15, help="Per-frame jitter")
+    parser.add_argument("--gap", type=int, default=6, help="Frames between letters")
+    parser.add_argument("--give_up_s", type=float, default=3.0)
+    parser.add_argument("--population", type=int, default=30, help="Users the student trains on")
+    parser.add_argument("--train_per_letter", type=int, default=20)
+    parser.add_argument("--hidden", type=int, nargs="+", default=[64, 64])
+    parser.add_argument("--seed", type=int, default=0)
+    main(parser.parse_args())
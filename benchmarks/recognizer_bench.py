@@ -0,0 +1,73 @@
+# benchmarks/recognizer_bench.py
+"""
+Images/s of the image CNN (ASLRecognizer) over a directory of images.
+
+Compares the one-image-at-a-time `predict` with `predict_batch` (threaded
+decode + resize into a preallocated batch, fixed-size batched inference),
+and reports top-1 accuracy when images sit in per-letter folders.
+
+    python -m benchmarks.recognizer_bench --dir data/raw/asl_alphabet_test \
+        --model models/asl_cnn.h5 --labels models/label_map.json --batch 64
+"""
+import argparse, os, time
+import cv2
+
+from app.recognizer import ASLRecognizer
+from benchmarks.common import print_table
+
+IMAGE_EXTS = (".jpg", ".jpeg", ".png")
+
+
+def list_images(root, limit=0):
+    paths = sorted(os.path.join(d, f) for d, _, files in os.walk(root)
+                   for f in files if f.lower().endswith(IMAGE_EXTS))
+    return paths[:limit] if limit else paths
+
+
+def accuracy(paths, letters, labels):
+    known = set(labels.values())
+    truth = [os.path.basename(os.path.dirname(p)) for p in paths]
+    scored = [(t, l) for t, l in zip(truth, letters) if t in known]
+    return sum(t == l for t, l in scored) / len(scored) if scored else float("nan")
+
+
+def main(args):
+    paths = list_images(args.dir, args.limit)
+    if not paths:
+        raise SystemExit(f"No images under {args.dir}")
+    rec = ASLRecognizer(args.model, args.labels, args.img_size)
+    rows = []
+
+    single = paths[:args.single]
+    rec.predict(cv2.imread(single[0]))                      # warm-up
+    t0 = time.perf_counter()
+    single_letters = [rec.predict(cv2.imread(p))[0] for p in single]
+    secs = time.perf_counter() - t0
+    rows.append({"method": "predict (1 image)", "images": len(single), "seconds": secs,
+                 "images_per_s": len(single) / secs,
+                 "accuracy": accuracy(single, single_letters, rec.labels)})
+
+    rec.predict_batch(paths[:args.batch], args.batch, args.workers)   # warm-up / trace
+    t0 = time.perf_counter()
+    letters, _ = rec.predict_batch(paths, args.batch, args.workers)
+    secs = time.perf_counter() - t0
+    rows.append({"method": f"predict_batch ({args.batch})", "images": len(paths), "seconds": secs,
+                 "images_per_s": len(paths) / secs,
+                 "accuracy": accuracy(paths, letters, rec.labels)})
+
+    print_table(rows, ["method", "images", "seconds", "images_per_s", "accuracy"])
+    print(f"\nSpeed-up: {rows[1]['images_per_s'] / rows[0]['images_per_s']:.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--dir", required=True, help="Image folder (searched recursively)")
+    parser.add_argument("--model", default="models/asl_cnn.h5")
+    parser.add_argument("--labels", default="models/label_map.json")
+    parser.add_argument("--img_size", type=int, default=64)
+    parser.add_argument("--batch", type=int, default=64)
+    parser.add_argument("--workers", type=int, default=0, help="Decode threads (0 = auto)")
+    parser.add_argument("--single", type=int, default=200,
+                        help="Images timed through the one-at-a-time predict")
+    parser.add_argument("--limit", type=int, default=0, help="Max images (0 = all)")
+    main(parser.parse_args())
@@ -0,0 +1,80 @@
+# benchmarks/suggestions_bench.py
+"""
+Compare the distilgpt2 suggestion backends: load time, latency, RSS and
+top-k parity against the float32 torch model.
+
+Each backend is measured in a fresh subprocess so load time and RSS are not
+polluted by the others.
+
+    python -m app.suggestions --export-onnx      # once, for onnx-int8
+    python -m benchmarks.suggestions_bench --backends torch torch-int8 onnx-int8
+"""
+import argparse, json, subprocess, sys, time
+
+from benchmarks.common import rss_mb, time_calls, summarize, print_table
+
+CONTEXTS = [
+    "I want to", "thank you for", "how are", "my name is", "can you help",
+    "I am going to the", "please call my", "where is the", "good morning",
+    "see you", "I need some", "what time is", "nice to meet",
+]
+
+
+def run_worker(backend, repeat, k):
+    from app import suggestions
+
+    rss0 = rss_mb()
+    t0 = time.perf_counter()
+    suggestions.get_tokenizer()
+    engine = suggestions.get_backend(backend)
+    load_s = time.perf_counter() - t0
+
+    ctx = iter(CONTEXTS * (repeat // len(CONTEXTS) + 2))
+    times = time_calls(lambda: suggestions.get_suggestions(next(ctx), k, engine), repeat)
+
+    result = {"backend": backend, "load_s": load_s,
+              "rss_mb": rss_mb(), "rss_delta_mb": rss_mb() - rss0,
+              **summarize(times)}
+    if backend != "torch":
+        reference = suggestions.get_backend("torch")
+        parity = suggestions.topk_parity(engine, reference, CONTEXTS, k)
+        result["topk_overlap"] = parity["topk_overlap"]
+        result["top1_agree"] = parity["top1_agreement"]
+    print(json.dumps(result))
+
+
+def main(args):
+    rows = []
+    for backend in args.backends:
+        out = subprocess.run(
+            [sys.executable, "-m", "benchmarks.suggestions_bench",
+             "--worker", backend, "--repeat", str(args.repeat), "--k", str(args.k)],
+            capture_output=True, text=True)
+        if out.returncode != 0:
+            print(f"❌ {backend} failed:\n{out.stderr}")
+            continue
+        rows.append(json.loads(out.stdout.strip().splitlines()[-1]))
+
+    print_table(rows, ["backend", "load_s", "rss_mb", "mean_ms", "p50_ms",
+                       "p95_ms", "topk_overlap", "top1_agree"])
+
+    failed = [r["backend"] for r in rows
+              if r.get("topk_overlap", 1.0) < args.min_overlap]
+    if failed:
+        print(f"❌ top-{args.k} overlap below {args.min_overlap} for {failed}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backends", nargs="+", default=["torch", "torch-int8", "onnx-int8"])
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--k", type=int, default=3)
+    parser.add_argument("--min_overlap", type=float, default=0.66,
+                        help="Fail if a backend's mean top-k overlap drops below this")
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.worker:
+        run_worker(args.worker, args.repeat, args.k)
+    else:
+        main(args)
@@ -0,0 +1,100 @@
+# benchmarks/temporal_bench.py
+"""
+Per-frame cost of the streaming temporal model vs recomputing the window.
+
+Uses models/temporal_model.npz if given, else random weights of the same
+shape (cost does not depend on the values). Checks first that
+TemporalClassifier.step() reproduces predict_window() on the last window
+of the stream, then times both per frame against the 33 ms frame budget.
+
+    python -m benchmarks.temporal_bench --frames 3000
+    python -m benchmarks.temporal_bench --weights models/temporal_model.npz
+"""
+import argparse, sys, time
+import numpy as np
+
+from app.temporal import NUM_FEATURES, TemporalClassifier, frame_features
+from benchmarks.common import print_table, summarize
+
+
+def random_weights(classes=26, width=48, kernel=3, dilations=(1, 2, 4, 8), seed=0):
+    rng = np.random.default_rng(seed)
+    w = {"classes": np.array([chr(65 + i % 26) for i in range(classes)]),
+         "dilations": np.array(dilations, np.int32),
+         "W_in": rng.normal(0, 1 / np.sqrt(NUM_FEATURES), (NUM_FEATURES, width)),
+         "b_in": rng.normal(0, 0.1, width),
+         "W_out": rng.normal(0, 1 / np.sqrt(width), (width, classes)), "b_out": np.zeros(classes)}
+    for i in range(len(dilations)):
+        w[f"K{i}"] = rng.normal(0, 1 / np.sqrt(kernel * width), (kernel, width, width))
+        w[f"c{i}"] = rng.normal(0, 0.1, width)
+    return w
+
+
+def hand_stream(n, seed=1):
+    """Smoothly moving random hand with ~10% dropped detections (None)."""
+    rng = np.random.default_rng(seed)
+    base = rng.random(63, dtype=np.float32)
+    drift = np.cumsum(rng.normal(0, 0.01, (n, 63)), axis=0).astype(np.float32)
+    return [None if rng.random() < 0.1 else base + drift[i] for i in range(n)]
+
+
+def check_equivalence(clf, stream):
+    """step() after the whole stream vs predict_window() on its last window of features."""
+    clf.reset()
+    held, prev = [], None
+    for lm in stream:
+        out = clf.step(lm)
+        prev = lm if lm is not None else prev
+        if prev is not None:
+            held.append(prev)
+    held = np.array(held, np.float32)
+    feats = frame_features(held)[-clf.window:]
+    ref = clf.predict_window(feats[None])[0]
+    return float(np.abs(out - ref).max())
+
+
+def main(args):
+    weights = np.load(args.weights) if args.weights else random_weights()
+    clf = TemporalClassifier(weights=weights)
+    stream = hand_stream(args.frames)
+
+    diff = check_equivalence(clf, stream[: clf.window * 3])
+    print(f"🔁 step() vs predict_window(): max |Δp| = {diff:.2e} (window {clf.window} frames)")
+
+    clf.reset()
+    step_ms = np.empty(len(stream))
+    for i, lm in enumerate(stream):
+        t0 = time.perf_counter()
+        clf.step(lm)
+        step_ms[i] = (time.perf_counter() - t0) * 1e3
+    step_ms = step_ms[clf.window:]
+
+    # What a non-streaming model would do: keep the window, recompute it every frame
+    held = np.array([lm if lm is not None else stream[0] for lm in stream], np.float32)
+    recompute_ms = np.empty(len(stream) - clf.window)
+    for i in range(clf.window, len(stream)):
+        t0 = time.perf_counter()
+        clf.predict_window(frame_features(held[i - clf.window + 1: i + 1])[None])
+        recompute_ms[i - clf.window] = (time.perf_counter() - t0) * 1e3
+
+    rows = [{"path": "streaming step()", **summarize(step_ms)},
+            {"path": "recompute window", **summarize(recompute_ms)}]
+    for r in rows:
+        r["budget_pct"] = 100 * r["p95_ms"] / args.budget_ms
+    print_table(rows, ["path", "mean_ms", "p50_ms", "p95_ms", "budget_pct"])
+    print(f"\nStreaming is {rows[1]['mean_ms'] / rows[0]['mean_ms']:.1f}x cheaper per frame; "
+          f"p95 uses {rows[0]['budget_pct']:.2f}% of the {args.budget_ms:.0f} ms frame budget")
+
+    if diff > 1e-4 or rows[0]["p95_ms"] > args.max_share * args.budget_ms:
+        print("❌ Streaming output differs from the reference or is over budget")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--weights", help="models/temporal_model.npz (default: random weights)")
+    parser.add_argument("--frames", type=int, default=3000)
+    parser.add_argument("--budget_ms", type=float, default=33.3, help="Frame budget at 30 fps")
+    parser.add_argument("--max_share", type=float, default=0.05,
+                        help="Fail if step() p95 exceeds this share of the frame budget")
+    main(parser.parse_args())
@@ -0,0 +1,69 @@
+# benchmarks/training_bench.py
+"""
+Training throughput of the landmark CNN on CPU: the old NumPy
+`model.fit(validation_split=0.1)` input path against the tf.data pipeline,
+optionally across float policies and thread counts.
+
+    python -m benchmarks.training_bench --train data/landmarks_train.npz --epochs 3
+    python -m benchmarks.training_bench --synthetic 50000 --precision float32 mixed_bfloat16
+"""
+import argparse
+import numpy as np
+import tensorflow as tf
+
+from benchmarks.common import print_table
+from models.landmark_cnn import (load_data, build_model, configure_runtime,
+                                 make_dataset, ThroughputLogger)
+
+
+def run(X, y, num_classes, args, pipeline, precision, threads):
+    configure_runtime(args.seed, threads, precision=precision)
+    model = build_model(num_classes)
+    n_val = len(X) // 10
+    logger = ThroughputLogger(len(X) - n_val)
+    if pipeline == "numpy":
+        model.fit(X, y, epochs=args.epochs, batch_size=args.batch,
+                  validation_split=0.1, callbacks=[logger], verbose=0)
+    else:
+        train = make_dataset(X[n_val:], y[n_val:], args.batch, shuffle=True,
+                             seed=args.seed, threads=threads)
+        val = make_dataset(X[:n_val], y[:n_val], args.batch, threads=threads)
+        model.fit(train, validation_data=val, epochs=args.epochs,
+                  callbacks=[logger], verbose=0)
+    tf.keras.backend.clear_session()
+    return {"pipeline": pipeline, "precision": precision, "threads": threads or "default",
+            **{k: v for k, v in logger.summary().items() if k != "epochs"}}
+
+
+def main(args):
+    if args.train:
+        X, y, classes = load_data(args.train)
+        num_classes = len(classes)
+    else:
+        rng = np.random.default_rng(args.seed)
+        X = rng.random((args.synthetic, 63), dtype=np.float32)
+        y = rng.integers(0, 28, args.synthetic).astype(np.int32)
+        num_classes = 28
+
+    rows = []
+    for threads in args.threads:
+        for precision in args.precision:
+            for pipeline in ("numpy", "tf.data"):
+                rows.append(run(X, y, num_classes, args, pipeline, precision, threads))
+    tf.keras.mixed_precision.set_global_policy("float32")
+
+    print_table(rows, ["pipeline", "precision", "threads", "first_epoch_s",
+                       "mean_epoch_s", "mean_samples_per_s"])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--train", help="Landmark .npz (default: synthetic data)")
+    parser.add_argument("--synthetic", type=int, default=50000)
+    parser.add_argument("--epochs", type=int, default=3)
+    parser.add_argument("--batch", type=int, default=128)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--threads", type=int, nargs="+", default=[0])
+    parser.add_argument("--precision", nargs="+", default=["float32"],
+                        choices=["float32", "mixed_float16", "mixed_bfloat16"])
+    main(parser.parse_args())
@@ -0,0 +1,155 @@
+"""
+Confidence calibration and per-letter commit gates
+--------------------------------------------------
+1. Temperature scaling: one scalar T fitted on the held-out validation split
+   by minimising the negative log-likelihood of softmax(log p / T).
+2. Per-letter gates from the calibrated validation confusion matrix: for each
+   letter, the lowest confidence threshold at which predictions of that
+   letter are still >= --target_precision correct, and the number of votes
+   needed so that a wrong commit needs every vote to be wrong
+   ((1 - precision) ** votes <= --target_error).
+
+Letters that never reach the precision target keep the old fixed gate
+(conf >= 0.8, 6 votes). Loaded by app/main.py and app/gui_main.py.
+
+Usage (from Sign2Voice/ root):
+
+    python -m models.calibrate --data data/landmarks_train.npz
+    python -m models.calibrate --data data/landmarks_train.npz \
+        --backend numpy --model models/landmark_student.npz \
+        --out models/landmark_student_calibration.json
+
+Saves:
+    models/landmark_calibration.json     (temperature + per-letter gates)
+    metrics/calibration_report.json      (NLL / ECE before and after, on test)
+"""
+
+import argparse, json, os
+import numpy as np
+
+from app.calibration import Calibration
+from app.classifier import apply_temperature
+
+
+def nll(probs, y):
+    return float(-np.log(np.clip(probs[np.arange(len(y)), y], 1e-12, 1.0)).mean())
+
+
+def expected_calibration_error(probs, y, bins=15):
+    conf = probs.max(axis=1)
+    correct = probs.argmax(axis=1) == y
+    edges = np.minimum((conf * bins).astype(int), bins - 1)
+    counts = np.bincount(edges, minlength=bins)
+    gap = np.abs(np.bincount(edges, correct, bins) - np.bincount(edges, conf, bins))
+    return float(gap.sum() / max(counts.sum(), 1))
+
+
+def fit_temperature(probs, y, lo=0.05, hi=20.0, iters=60):
+    """Golden-section search for the NLL-minimising T (NLL is unimodal in log T)."""
+    a, b = np.log(lo), np.log(hi)
+    g = (np.sqrt(5) - 1) / 2
+    f = lambda log_t: nll(apply_temperature(probs, float(np.exp(log_t))), y)
+    c, d = b - g * (b - a), a + g * (b - a)
+    fc, fd = f(c), f(d)
+    for _ in range(iters):
+        if fc < fd:
+            b, d, fd = d, c, fc
+            c = b - g * (b - a)
+            fc = f(c)
+        else:
+            a, c, fc = c, d, fd
+            d = a + g * (b - a)
+            fd = f(d)
+    return float(np.exp((a + b) / 2))
+
+
+def derive_gates(probs, y, classes, target_precision=0.98, target_error=1e-3,
+                 min_vote=2, max_vote=6, default_threshold=0.8, min_support=20,
+                 grid=np.arange(0.30, 0.96, 0.05)):
+    """
+    Per-letter {"threshold", "vote", "precision", "support"} from calibrated
+    validation probabilities. Only letters that get a lower threshold or
+    fewer votes than the defaults are returned.
+    """
+    num_classes = len(classes)
+    pred = probs.argmax(axis=1)
+    conf = probs.max(axis=1)
+    gates = {}
+    for c, name in enumerate(classes):
+        for t in grid:
+            # Column c of the gated confusion matrix: true labels of frames called c
+            keep = (pred == c) & (conf >= t)
+            support = int(keep.sum())
+            if support < min_support:
+                break
+            confused = np.bincount(y[keep], minlength=num_classes)
+            precision = confused[c] / support
+            if precision >= target_precision:
+                err = max(1.0 - precision, 1e-6)
+                vote = int(np.clip(np.ceil(np.log(target_error) / np.log(err)), min_vote, max_vote))
+                threshold = float(min(round(t, 2), default_threshold))
+                if threshold < default_threshold or vote < max_vote:
+                    gates[name] = {"threshold": threshold, "vote": vote,
+                                   "precision": float(precision), "support": support}
+                break
+    return gates
+
+
+def main(args):
+    from models.evaluate import BACKENDS
+    from models.landmark_cnn import prepare_splits
+
+    _, X_val, X_test, _, y_val, y_test, classes = prepare_splits(args.data, args.seed, verbose=False)
+    backend = BACKENDS[args.backend](args.model, args.classes)
+    if list(backend.class_names) != list(classes):
+        raise SystemExit("❌ Model classes do not match the dataset's class list")
+
+    val = backend.predict_proba(X_val.astype(np.float32))
+    test = backend.predict_proba(X_test.astype(np.float32))
+
+    temperature = fit_temperature(val, y_val)
+    val_cal = apply_temperature(val, temperature)
+    test_cal = apply_temperature(test, temperature)
+    gates = derive_gates(val_cal, y_val, classes, args.target_precision, args.target_error,
+                         args.min_vote, args.vote, args.threshold)
+
+    calib = Calibration(temperature, gates, args.threshold, args.vote, list(classes))
+    calib.save(args.out, model=args.model, backend=args.backend)
+
+    report = {
+        "temperature": temperature,
+        "test_nll_before": nll(test, y_test), "test_nll_after": nll(test_cal, y_test),
+        "test_ece_before": expected_calibration_error(test, y_test),
+        "test_ece_after": expected_calibration_error(test_cal, y_test),
+        "letters_with_faster_gates": len(gates),
+        "mean_vote": float(np.mean([gates.get(c, {"vote": args.vote})["vote"] for c in classes])),
+    }
+    os.makedirs("metrics", exist_ok=True)
+    with open(args.report, "w") as f:
+        json.dump(report, f, indent=4)
+
+    print(f"🌡️ Temperature {temperature:.3f} | test ECE {report['test_ece_before']:.4f} → "
+          f"{report['test_ece_after']:.4f} | NLL {report['test_nll_before']:.4f} → "
+          f"{report['test_nll_after']:.4f}")
+    print(f"🚦 {len(gates)}/{len(classes)} letters get faster gates "
+          f"(mean votes {report['mean_vote']:.2f} vs {args.vote})")
+    print(f"💾 Saved {args.out} and {args.report}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--data", required=True, help="Landmark .npz the model was trained on")
+    parser.add_argument("--backend", default="keras", help="Backend from models/evaluate.py")
+    parser.add_argument("--model", default="models/landmark_cnn.h5")
+    parser.add_argument("--classes", default="models/landmark_classes.json")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--target_precision", type=float, default=0.98,
+                        help="Per-frame precision a letter needs at its threshold")
+    parser.add_argument("--target_error", type=float, default=1e-3,
+                        help="Allowed chance that every vote of a commit is wrong")
+    parser.add_argument("--threshold", type=float, default=0.8, help="Default / max confidence gate")
+    parser.add_argument("--vote", type=int, default=6, help="Default / max votes")
+    parser.add_argument("--min_vote", type=int, default=2)
+    parser.add_argument("--out", default="models/landmark_calibration.json")
+    parser.add_argument("--report", default="metrics/calibration_report.json")
+    main(parser.parse_args())
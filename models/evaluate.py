@@ -0,0 +1,261 @@
+"""
+Standalone evaluation of a saved landmark classifier
+----------------------------------------------------
+Re-scores any trained / distilled / converted model on the held-out test
+split without retraining. The test split is materialised once as .npy next
+to the .npz and memory-mapped on later runs, inference runs in fixed-size
+batches through a registered backend, and per-class metrics are computed
+from a bincount confusion matrix.
+
+Usage (from Sign2Voice/ root):
+
+    python -m models.evaluate --data data/landmarks_train.npz \
+        --backend keras  --model models/landmark_cnn.h5
+    python -m models.evaluate --data data/landmarks_train.npz \
+        --backend numpy  --model models/landmark_student.npz --name student
+    python -m models.evaluate --data data/landmarks_train.npz \
+        --backend tflite --model models/landmark_cnn.tflite \
+        --export_tflite models/landmark_cnn.h5 --quantize --plots
+
+Saves (prefix = --name, default the backend):
+    metrics/<name>_classification_report.json   (same layout as the trainer's)
+    metrics/<name>_performance.json             (latency / throughput)
+    metrics/<name>_confusion_matrix.png         (--plots only)
+"""
+
+import argparse, json, os, time
+import numpy as np
+
+BACKENDS = {}
+
+def register_backend(name):
+    def wrap(cls):
+        BACKENDS[name] = cls
+        return cls
+    return wrap
+
+
+def _load_classes(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+@register_backend("keras")
+class KerasBackend:
+    def __init__(self, model_path, classes_path):
+        import tensorflow as tf
+        self.model = tf.keras.models.load_model(model_path)
+        self.class_names = _load_classes(classes_path)
+
+    @classmethod
+    def from_model(cls, model, class_names):
+        """Wrap an already-loaded model (the trainer evaluates before exiting)."""
+        self = cls.__new__(cls)
+        self.model, self.class_names = model, list(class_names)
+        return self
+
+    def predict_proba(self, x):
+        return self.model(x, training=False).numpy()
+
+
+@register_backend("numpy")
+class NumpyBackend:
+    """Distilled student exported by models/landmark_distill.py."""
+    def __init__(self, model_path, classes_path=None):
+        from app.classifier import StudentClassifier
+        self.student = StudentClassifier(model_path)
+        self.class_names = self.student.class_names
+
+    def predict_proba(self, x):
+        return self.student.predict_proba(x)
+
+
+@register_backend("tflite")
+class TFLiteBackend:
+    def __init__(self, model_path, classes_path, threads=None):
+        try:
+            from tflite_runtime.interpreter import Interpreter
+        except ImportError:
+            from tensorflow.lite import Interpreter
+        self.interpreter = Interpreter(model_path=model_path, num_threads=threads)
+        self.input = self.interpreter.get_input_details()[0]
+        self.output = self.interpreter.get_output_details()[0]
+        self.batch = None
+        self.class_names = _load_classes(classes_path)
+
+    def predict_proba(self, x):
+        if self.batch != len(x):
+            self.interpreter.resize_tensor_input(self.input["index"], [len(x), x.shape[1]])
+            self.interpreter.allocate_tensors()
+            self.batch = len(x)
+        self.interpreter.set_tensor(self.input["index"], x.astype(self.input["dtype"]))
+        self.interpreter.invoke()
+        return self.interpreter.get_tensor(self.output["index"])
+
+
+def export_tflite(keras_path, out, quantize=False):
+    """Convert a saved Keras model for the tflite backend (optionally dynamic-range int8)."""
+    import tensorflow as tf
+    converter = tf.lite.TFLiteConverter.from_keras_model(tf.keras.models.load_model(keras_path))
+    if quantize:
+        converter.optimizations = [tf.lite.Optimize.DEFAULT]
+    with open(out, "wb") as f:
+        f.write(converter.convert())
+
+
+def load_test_split(data_path, seed=42, cache_dir=None):
+    """
+    Memory-mapped (X_test, y_test, classes) for a landmark .npz.
+
+    The split is the trainer's (models.landmark_cnn.prepare_splits); it is
+    written once as .npy and reused while it is newer than the .npz.
+    """
+    cache_dir = cache_dir or os.path.dirname(os.path.abspath(data_path))
+    stem = os.path.join(cache_dir, os.path.splitext(os.path.basename(data_path))[0] + "_test")
+    paths = {k: f"{stem}_{k}.npy" for k in ("X", "y")}
+    classes_path = f"{stem}_classes.json"
+    src_mtime = os.path.getmtime(data_path)
+
+    fresh = all(os.path.exists(p) and os.path.getmtime(p) >= src_mtime
+                for p in [*paths.values(), classes_path])
+    if not fresh:
+        from models.landmark_cnn import prepare_splits
+        _, _, X_test, _, _, y_test, classes = prepare_splits(data_path, seed, verbose=False)
+        np.save(paths["X"], np.ascontiguousarray(X_test, dtype=np.float32))
+        np.save(paths["y"], y_test.astype(np.int32))
+        with open(classes_path, "w") as f:
+            json.dump(classes, f)
+
+    X = np.load(paths["X"], mmap_mode="r")
+    y = np.load(paths["y"], mmap_mode="r")
+    return X, y, _load_classes(classes_path)
+
+
+def run_inference(backend, X, batch):
+    """Batched predictions plus per-batch latencies (ms); every batch is full-size."""
+    n = len(X)
+    preds = np.empty(n, dtype=np.int32)
+    buf = np.zeros((batch, X.shape[1]), dtype=np.float32)
+    backend.predict_proba(buf)                  # warm-up / graph trace
+    times = []
+    for start in range(0, n, batch):
+        chunk = X[start:start + batch]
+        buf[:len(chunk)] = chunk                # pad the tail to a fixed shape
+        t0 = time.perf_counter()
+        probs = backend.predict_proba(buf)
+        times.append((time.perf_counter() - t0) * 1e3)
+        preds[start:start + len(chunk)] = probs[:len(chunk)].argmax(axis=1)
+    return preds, np.asarray(times)
+
+
+def single_sample_latency(backend, sample, repeat=500):
+    x = np.ascontiguousarray(sample[None, :], dtype=np.float32)
+    for _ in range(20):
+        backend.predict_proba(x)
+    times = np.empty(repeat)
+    for i in range(repeat):
+        t0 = time.perf_counter()
+        backend.predict_proba(x)
+        times[i] = (time.perf_counter() - t0) * 1e6
+    return float(np.median(times)), float(np.percentile(times, 95))
+
+
+def confusion(y_true, y_pred, num_classes):
+    return np.bincount(y_true * num_classes + y_pred,
+                       minlength=num_classes ** 2).reshape(num_classes, num_classes)
+
+
+def classification_report_dict(cm, class_names):
+    """sklearn.classification_report(output_dict=True) layout, from a confusion matrix."""
+    tp = np.diag(cm).astype(np.float64)
+    support = cm.sum(axis=1)
+    predicted = cm.sum(axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        precision = np.nan_to_num(tp / predicted)
+        recall = np.nan_to_num(tp / support)
+        f1 = np.nan_to_num(2 * precision * recall / (precision + recall))
+
+    report = {
+        name: {"precision": float(p), "recall": float(r), "f1-score": float(f), "support": int(s)}
+        for name, p, r, f, s in zip(class_names, precision, recall, f1, support)
+    }
+    total = int(support.sum())
+    report["accuracy"] = float(tp.sum() / total) if total else 0.0
+    report["macro avg"] = {"precision": float(precision.mean()), "recall": float(recall.mean()),
+                           "f1-score": float(f1.mean()), "support": total}
+    w = support / max(total, 1)
+    report["weighted avg"] = {"precision": float(precision @ w), "recall": float(recall @ w),
+                              "f1-score": float(f1 @ w), "support": total}
+    return report
+
+
+def evaluate(backend, X, y, batch=1024):
+    preds, batch_ms = run_inference(backend, X, batch)
+    num_classes = len(backend.class_names)
+    cm = confusion(np.asarray(y), preds, num_classes)
+    p50_us, p95_us = single_sample_latency(backend, X[0])
+    performance = {
+        "samples": int(len(X)),
+        "batch": batch,
+        "batch_latency_p50_ms": float(np.median(batch_ms)),
+        "batch_latency_p95_ms": float(np.percentile(batch_ms, 95)),
+        "throughput_samples_per_s": float(len(X) / (batch_ms.sum() / 1e3)),
+        "single_sample_p50_us": p50_us,
+        "single_sample_p95_us": p95_us,
+    }
+    return classification_report_dict(cm, backend.class_names), cm, performance
+
+
+def main(args):
+    if args.export_tflite:
+        export_tflite(args.export_tflite, args.model, args.quantize)
+        print(f"💾 Converted {args.export_tflite} → {args.model}")
+    if args.backend not in BACKENDS:
+        raise SystemExit(f"Unknown backend {args.backend!r}; registered: {sorted(BACKENDS)}")
+    name = args.name or args.backend
+    os.makedirs(args.out_dir, exist_ok=True)
+
+    X, y, classes = load_test_split(args.data, args.seed)
+    backend = BACKENDS[args.backend](args.model, args.classes)
+    if list(backend.class_names) != list(classes):
+        raise SystemExit("❌ Model classes do not match the dataset's class list")
+    print(f"📦 Test samples: {len(X)} | backend: {args.backend}")
+
+    report, cm, performance = evaluate(backend, X, y, args.batch)
+
+    report_path = os.path.join(args.out_dir, f"{name}_classification_report.json")
+    perf_path = os.path.join(args.out_dir, f"{name}_performance.json")
+    with open(report_path, "w") as f:
+        json.dump(report, f, indent=4)
+    with open(perf_path, "w") as f:
+        json.dump({"backend": args.backend, "model": args.model, **performance}, f, indent=4)
+
+    print(f"🎯 Accuracy: {report['accuracy']:.4f}")
+    print(f"⚡ {performance['throughput_samples_per_s']:.0f} samples/s (batch {args.batch}) | "
+          f"single sample p50 {performance['single_sample_p50_us']:.1f} µs")
+    print(f"📊 Saved {report_path} and {perf_path}")
+
+    if args.plots:
+        from models.landmark_cnn import plot_confusion_matrix, plot_metrics
+        plot_metrics(report, classes, os.path.join(args.out_dir, f"{name}_precision_recall_bar_chart.png"))
+        plot_confusion_matrix(cm, classes, os.path.join(args.out_dir, f"{name}_confusion_matrix.png"))
+        print("📈 Plots saved")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--data", required=True, help="Landmark .npz the model was trained on")
+    parser.add_argument("--backend", default="keras", help=f"One of: {', '.join(BACKENDS)}")
+    parser.add_argument("--model", default="models/landmark_cnn.h5")
+    parser.add_argument("--classes", default="models/landmark_classes.json")
+    parser.add_argument("--name", help="Report file prefix (default: backend name)")
+    parser.add_argument("--batch", type=int, default=1024)
+    parser.add_argument("--seed", type=int, default=42,
+                        help="Seed the model was trained with (affects only the val split)")
+    parser.add_argument("--out_dir", default="metrics")
+    parser.add_argument("--plots", action="store_true", help="Also write PNG plots (matplotlib)")
+    parser.add_argument("--export_tflite", metavar="KERAS_MODEL",
+                        help="First convert this .h5 to --model (use with --backend tflite)")
+    parser.add_argument("--quantize", action="store_true",
+                        help="Dynamic-range int8 weights for --export_tflite")
+    main(parser.parse_args())
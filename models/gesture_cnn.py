@@ -10,6 +10,10 @@ Usage (from Sign2Voice/ root):
         --batch 64 \
         --limit_per_class 1000   # images per letter (speed-up)
 
+The first run decodes + resizes every image once (process pool) into a
+uint8 store under --cache_dir; later runs open it memory-mapped and only
+rebuild it when the source images change (utils/preprocessing.py).
+
         
 
         
@@ -22,6 +26,7 @@ import os, json, argparse
 import numpy as np
 import tensorflow as tf                      
 from keras import layers, models             # ← NEW: pull layers/models from Keras 3
+from sklearn.model_selection import train_test_split
 from utils.preprocessing import load_asl_dataset
 
 
@@ -50,6 +55,17 @@ def build_cnn(input_shape=(64, 64, 3), num_classes=29):
     return model
 
 
+def make_dataset(X, y, batch, shuffle=False, seed=42):
+    """uint8 images → float32 [0, 1] per batch, so the full set never exists as float32."""
+    ds = tf.data.Dataset.from_tensor_slices((X, y))
+    if shuffle:
+        ds = ds.shuffle(min(len(X), 20000), seed=seed, reshuffle_each_iteration=True)
+    return (ds.batch(batch)
+              .map(lambda x, t: (tf.cast(x, tf.float32) / 255.0, t),
+                   num_parallel_calls=tf.data.AUTOTUNE)
+              .prefetch(tf.data.AUTOTUNE))
+
+
 def main(args):
     # 1️⃣  Load & split data
     print("⏳ Loading dataset …")
@@ -58,6 +74,9 @@ def main(args):
         img_size=(args.img_size, args.img_size),
         test_size=0.2,
         limit_per_class=args.limit_per_class,
+        cache_dir=None if args.no_cache else args.cache_dir,
+        normalize=False,
+        workers=args.workers,
     )
 
     num_classes = len(label_map)
@@ -68,16 +87,17 @@ def main(args):
                       num_classes=num_classes)
     model.summary()
 
-    # 3️⃣  Train
+    # 3️⃣  Train (10% of the training split held out for validation)
+    X_fit, X_val, y_fit, y_val = train_test_split(
+        X_train, y_train, test_size=0.1, random_state=42, stratify=y_train)
     history = model.fit(
-        X_train, y_train,
+        make_dataset(X_fit, y_fit, args.batch, shuffle=True),
+        validation_data=make_dataset(X_val, y_val, args.batch),
         epochs=args.epochs,
-        batch_size=args.batch,
-        validation_split=0.1,
     )
 
     # 4️⃣  Evaluate
-    test_loss, test_acc = model.evaluate(X_test, y_test, verbose=0)
+    test_loss, test_acc = model.evaluate(make_dataset(X_test, y_test, args.batch), verbose=0)
     print(f"🧪 Test accuracy: {test_acc:.4f}")
 
     # 5️⃣  Save model + label map
@@ -100,5 +120,11 @@ if __name__ == "__main__":
     parser.add_argument("--img_size", type=int, default=64)
     parser.add_argument("--limit_per_class", type=int, default=1000,
                         help="Images per class to load (speed-up). Set 0 for unlimited")
+    parser.add_argument("--cache_dir", default="data/cache",
+                        help="Resized uint8 image store (built on first use)")
+    parser.add_argument("--no_cache", action="store_true",
+                        help="Decode every image from disk instead of using the store")
+    parser.add_argument("--workers", type=int, default=0,
+                        help="Processes for building the store (0 = all cores)")
     args = parser.parse_args()
     main(args)
@@ -1,34 +1,86 @@
-import argparse, json, os
+import argparse, json, os, time
 import numpy as np
 import tensorflow as tf
 from tensorflow.keras import layers, models
 from sklearn.model_selection import train_test_split
-from sklearn.metrics import classification_report, confusion_matrix
 from contextlib import redirect_stdout
-import matplotlib.pyplot as plt
-import seaborn as sns
+from models.evaluate import KerasBackend, evaluate
 
 def load_data(path):
     data = np.load(path, allow_pickle=True)
     X, y, classes = data["X"], data["y"], list(data["classes"])
     return X, y, classes
 
-def build_model(num_classes):
+def configure_runtime(seed=42, threads=0, deterministic=False, precision="float32"):
+    """Seed every RNG, size TF's thread pools and pick the float policy."""
+    tf.keras.utils.set_random_seed(seed)          # python, numpy and tf
+    if deterministic:
+        tf.config.experimental.enable_op_determinism()
+    if threads:
+        try:
+            tf.config.threading.set_intra_op_parallelism_threads(threads)
+            tf.config.threading.set_inter_op_parallelism_threads(max(1, threads // 2))
+        except RuntimeError:
+            # Pools are fixed once TF has run anything in this process
+            print(f"⚠️ TF already initialised; --threads {threads} only applies to tf.data")
+    # mixed_bfloat16 is the one that helps on recent CPUs, mixed_float16 on GPUs
+    tf.keras.mixed_precision.set_global_policy(precision)
+
+def make_dataset(X, y, batch, shuffle=False, seed=42, threads=0):
+    """In-memory tf.data pipeline: cache → shuffle → batch → prefetch."""
+    ds = tf.data.Dataset.from_tensor_slices((X.astype(np.float32), y.astype(np.int32))).cache()
+    if shuffle:
+        ds = ds.shuffle(len(X), seed=seed, reshuffle_each_iteration=True)
+    ds = ds.batch(batch).prefetch(tf.data.AUTOTUNE)
+    if threads:
+        options = tf.data.Options()
+        options.threading.private_threadpool_size = threads
+        ds = ds.with_options(options)
+    return ds
+
+class ThroughputLogger(tf.keras.callbacks.Callback):
+    """Records wall time and samples/s of every training epoch."""
+    def __init__(self, num_samples):
+        super().__init__()
+        self.num_samples = num_samples
+        self.epochs = []
+
+    def on_epoch_begin(self, epoch, logs=None):
+        self._t0 = time.perf_counter()
+
+    def on_epoch_end(self, epoch, logs=None):
+        secs = time.perf_counter() - self._t0
+        self.epochs.append({"epoch": epoch + 1, "seconds": secs,
+                            "samples_per_s": self.num_samples / secs})
+
+    def summary(self):
+        # The first epoch includes tracing / cache fill, so report it apart
+        steady = self.epochs[1:] or self.epochs
+        return {
+            "epochs": self.epochs,
+            "first_epoch_s": self.epochs[0]["seconds"] if self.epochs else None,
+            "mean_epoch_s": float(np.mean([e["seconds"] for e in steady])) if steady else None,
+            "mean_samples_per_s": float(np.mean([e["samples_per_s"] for e in steady])) if steady else None,
+        }
+
+def build_model(num_classes, conv=(64, 128), dense=256, dropout=0.3):
     model = models.Sequential([
         layers.Reshape((21, 3), input_shape=(63,)),
-        layers.Conv1D(64, 3, activation="relu"),
-        layers.Conv1D(128, 3, activation="relu"),
+        *[layers.Conv1D(f, 3, activation="relu") for f in conv],
         layers.Flatten(),
-        layers.Dense(256, activation="relu"),
-        layers.Dropout(0.3),
-        layers.Dense(num_classes, activation="softmax")
+        layers.Dense(dense, activation="relu"),
+        layers.Dropout(dropout),
+        layers.Dense(num_classes, activation="softmax", dtype="float32")  # keep softmax fp32 under mixed precision
     ])
     model.compile(optimizer="adam",
                   loss="sparse_categorical_crossentropy",
                   metrics=["accuracy"])
     return model
 
-def plot_metrics(report, class_names):
+def plot_metrics(report, class_names, out="metrics/precision_recall_bar_chart.png"):
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
     precision = [report[cls]["precision"] for cls in class_names]
     recall = [report[cls]["recall"] for cls in class_names]
     x = np.arange(len(class_names))
@@ -42,42 +94,65 @@ def plot_metrics(report, class_names):
     plt.title("Precision and Recall per Class")
     plt.legend()
     plt.tight_layout()
-    plt.savefig("metrics/precision_recall_bar_chart.png")
+    plt.savefig(out)
     plt.close()
 
-def plot_confusion_matrix(cm, class_names):
+def plot_confusion_matrix(cm, class_names, out="metrics/confusion_matrix.png"):
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    import seaborn as sns
     plt.figure(figsize=(12, 10))
     sns.heatmap(cm, annot=True, fmt='d', cmap='Blues', xticklabels=class_names, yticklabels=class_names)
     plt.title("Confusion Matrix")
     plt.xlabel("Predicted")
     plt.ylabel("Actual")
     plt.tight_layout()
-    plt.savefig("metrics/confusion_matrix.png")
+    plt.savefig(out)
     plt.close()
 
-def main(args):
-    # Load data
-    X, y, classes = load_data(args.train)
-    os.makedirs("models", exist_ok=True)
-    os.makedirs("metrics", exist_ok=True)
+def remap_labels(y, min_samples):
+    """Drop classes with fewer than min_samples; relabel the rest 0..k-1 with a lookup array."""
+    counts = np.bincount(y)
+    keep_classes = np.flatnonzero(counts >= min_samples)
+    lookup = np.full(len(counts), -1, dtype=np.int32)
+    lookup[keep_classes] = np.arange(len(keep_classes), dtype=np.int32)
+    new_y = lookup[y]
+    return new_y >= 0, new_y, keep_classes
+
+def prepare_splits(path, seed=42, min_samples=100, verbose=True):
+    """Load the .npz, drop rare classes and return the fit/val/test splits."""
+    X, y, classes = load_data(path)
 
     # Drop low sample classes
-    min_samples = 100
-    keep_mask = np.bincount(y) >= min_samples
-    keep_classes = [i for i, k in enumerate(keep_mask) if k]
-    mapping = {old: new for new, old in enumerate(keep_classes)}
-    indices = np.isin(y, keep_classes)
+    indices, y, keep_classes = remap_labels(y, min_samples)
 
     X = X[indices]
-    y = np.vectorize(mapping.get)(y[indices])
+    y = y[indices]
     classes = [classes[i] for i in keep_classes]
 
-    print(f"✅ {len(classes)} classes kept | Total samples: {len(X)}")
-
     X_train, X_test, y_train, y_test = train_test_split(
         X, y, test_size=0.3, stratify=y, random_state=42
     )
-    print(f"📦 Train: {len(X_train)} | Test: {len(X_test)}")
+    # Stratified hold-out instead of validation_split (which takes the unshuffled tail)
+    X_fit, X_val, y_fit, y_val = train_test_split(
+        X_train, y_train, test_size=0.1, stratify=y_train, random_state=seed
+    )
+    if verbose:
+        print(f"✅ {len(classes)} classes kept | Total samples: {len(X)}")
+        print(f"📦 Train: {len(X_fit)} | Val: {len(X_val)} | Test: {len(X_test)}")
+    return X_fit, X_val, X_test, y_fit, y_val, y_test, classes
+
+def main(args):
+    configure_runtime(args.seed, args.threads, args.deterministic, args.precision)
+
+    # Load data
+    X_fit, X_val, X_test, y_fit, y_val, y_test, classes = prepare_splits(args.train, args.seed)
+    os.makedirs("models", exist_ok=True)
+    os.makedirs("metrics", exist_ok=True)
+
+    train_ds = make_dataset(X_fit, y_fit, args.batch, shuffle=True, seed=args.seed, threads=args.threads)
+    val_ds = make_dataset(X_val, y_val, args.batch, threads=args.threads)
 
     model = build_model(num_classes=len(classes))
 
@@ -86,43 +161,59 @@ def main(args):
         with redirect_stdout(f):
             model.summary()
 
+    throughput = ThroughputLogger(len(X_fit))
+    callbacks = [throughput]
+    if args.patience:
+        callbacks.append(tf.keras.callbacks.EarlyStopping(
+            monitor="val_loss", patience=args.patience, restore_best_weights=True))
+
     history = model.fit(
-        X_train, y_train,
+        train_ds,
+        validation_data=val_ds,
         epochs=args.epochs,
-        batch_size=args.batch,
-        validation_split=0.1,
+        callbacks=callbacks,
         verbose=2
     )
 
     with open("models/landmark_cnn_history.json", "w") as f:
         json.dump(history.history, f)
 
-    test_loss, test_acc = model.evaluate(X_test, y_test, verbose=0)
+    bench = {
+        "device": "GPU" if tf.config.list_physical_devices("GPU") else "CPU",
+        "precision": args.precision,
+        "threads": args.threads,
+        "batch": args.batch,
+        "train_samples": len(X_fit),
+        **throughput.summary(),
+    }
+    with open("metrics/training_benchmark.json", "w") as f:
+        json.dump(bench, f, indent=4)
+    print(f"⏱️ {bench['mean_epoch_s']:.2f} s/epoch | {bench['mean_samples_per_s']:.0f} samples/s "
+          f"→ metrics/training_benchmark.json")
+
+    model.save("models/landmark_cnn.h5")
+    with open("models/landmark_classes.json", "w") as f:
+        json.dump(classes, f)
+
+    # Same code path as `python -m models.evaluate`, on the in-memory model
+    report_dict, cm, performance = evaluate(KerasBackend.from_model(model, classes),
+                                            X_test, y_test)
+    test_acc = report_dict["accuracy"]
     print(f"\n🎯 Test accuracy: {test_acc:.4f}")
     with open("models/landmark_cnn_accuracy.txt", "w") as f:
         f.write(f"Test accuracy: {test_acc:.4f}\n")
 
-    y_pred = model.predict(X_test)
-    y_pred_labels = np.argmax(y_pred, axis=1)
-
-    report_dict = classification_report(
-        y_test, y_pred_labels, target_names=classes, output_dict=True, digits=3
-    )
     with open("metrics/classification_report.json", "w") as f:
         json.dump(report_dict, f, indent=4)
+    with open("metrics/keras_performance.json", "w") as f:
+        json.dump({"backend": "keras", "model": "models/landmark_cnn.h5", **performance}, f, indent=4)
     print("\n📊 Classification report saved to metrics/classification_report.json")
 
-    # Plot metrics
-    plot_metrics(report_dict, classes)
-    print("📈 Bar chart saved to metrics/precision_recall_bar_chart.png")
-
-    cm = confusion_matrix(y_test, y_pred_labels)
-    plot_confusion_matrix(cm, classes)
-    print("📉 Confusion matrix saved to metrics/confusion_matrix.png")
-
-    model.save("models/landmark_cnn.h5")
-    with open("models/landmark_classes.json", "w") as f:
-        json.dump(classes, f)
+    if args.plots:
+        plot_metrics(report_dict, classes)
+        print("📈 Bar chart saved to metrics/precision_recall_bar_chart.png")
+        plot_confusion_matrix(cm, classes)
+        print("📉 Confusion matrix saved to metrics/confusion_matrix.png")
 
     print("✅ All artifacts saved in /models and /metrics folders.")
 
@@ -132,4 +223,15 @@ if __name__ == "__main__":
     parser.add_argument("--train", required=True, help="Path to .npz landmark file")
     parser.add_argument("--epochs", type=int, default=20)
     parser.add_argument("--batch", type=int, default=128)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--threads", type=int, default=0,
+                        help="TF intra-op / tf.data threads (0 = TF default)")
+    parser.add_argument("--deterministic", action="store_true",
+                        help="Deterministic TF ops (bit-reproducible, slower)")
+    parser.add_argument("--precision", default="float32",
+                        choices=["float32", "mixed_float16", "mixed_bfloat16"])
+    parser.add_argument("--patience", type=int, default=5,
+                        help="Early-stopping patience on val_loss (0 = off)")
+    parser.add_argument("--no_plots", dest="plots", action="store_false",
+                        help="Skip the matplotlib charts (JSON reports only)")
     main(parser.parse_args())
\ No newline at end of file
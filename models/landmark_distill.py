@@ -0,0 +1,170 @@
+"""
+Knowledge distillation of the landmark CNN into a tiny MLP student
+-----------------------------------------------------------------
+The student is a small Dense-ReLU stack over wrist-centred, scale-normalised
+landmark vectors (app.classifier.normalize_landmarks). It learns from the
+trained CNN's temperature-softened outputs plus the hard labels, and is
+exported as plain NumPy weights so the live loops run it without
+TensorFlow (app.classifier.StudentClassifier).
+
+Usage (from Sign2Voice/ root, after training models/landmark_cnn.h5):
+
+    python -m models.landmark_distill \
+        --train data/landmarks_train.npz \
+        --teacher models/landmark_cnn.h5 \
+        --hidden 64 --temperature 4 --alpha 0.7
+
+Saves:
+    models/landmark_student.npz                      (weights + class list)
+    metrics/student_classification_report.json
+    metrics/student_confusion_matrix.png
+    metrics/student_benchmark.json                   (accuracy + latency vs teacher)
+"""
+
+import argparse, json, os, time
+import numpy as np
+import tensorflow as tf
+from tensorflow.keras import layers, models
+from sklearn.metrics import classification_report, confusion_matrix
+
+from app.classifier import normalize_landmarks, StudentClassifier
+from models.landmark_cnn import (configure_runtime, prepare_splits, plot_confusion_matrix,
+                                 plot_metrics)
+
+
+def soften(probs, temperature):
+    """Teacher softmax → softmax(log p / T); log p equals the logits up to a constant."""
+    logits = np.log(np.clip(probs, 1e-8, 1.0)) / temperature
+    logits -= logits.max(axis=1, keepdims=True)
+    e = np.exp(logits)
+    return (e / e.sum(axis=1, keepdims=True)).astype(np.float32)
+
+
+def distillation_loss(num_classes, temperature, alpha):
+    """y_true packs [soft teacher targets | one-hot labels]; y_pred are student logits."""
+    def loss(y_true, logits):
+        soft, hard = y_true[:, :num_classes], y_true[:, num_classes:]
+        kd = tf.keras.losses.kl_divergence(soft, tf.nn.softmax(logits / temperature))
+        ce = tf.keras.losses.categorical_crossentropy(hard, logits, from_logits=True)
+        return alpha * kd * temperature ** 2 + (1 - alpha) * ce
+    return loss
+
+
+def build_student(num_classes, hidden=(64,), dropout=0.1):
+    stack = [layers.InputLayer(input_shape=(63,))]
+    for units in hidden:
+        stack += [layers.Dense(units, activation="relu"), layers.Dropout(dropout)]
+    return models.Sequential(stack + [layers.Dense(num_classes)])   # logits
+
+
+def export_student(model, classes, path):
+    dense = [l for l in model.layers if isinstance(l, layers.Dense)]
+    arrays = {"n_layers": np.array(len(dense)), "classes": np.array(classes)}
+    for i, layer in enumerate(dense):
+        W, b = layer.get_weights()
+        arrays[f"W{i}"], arrays[f"b{i}"] = W.astype(np.float32), b.astype(np.float32)
+    np.savez(path, **arrays)
+
+
+def single_sample_latency_us(fn, sample, repeat=2000, warmup=50):
+    x = sample[None, :]
+    for _ in range(warmup):
+        fn(x)
+    times = np.empty(repeat)
+    for i in range(repeat):
+        t0 = time.perf_counter()
+        fn(x)
+        times[i] = (time.perf_counter() - t0) * 1e6
+    return float(np.median(times)), float(np.percentile(times, 95))
+
+
+def main(args):
+    configure_runtime(args.seed, args.threads)
+    os.makedirs("metrics", exist_ok=True)
+
+    X_fit, X_val, X_test, y_fit, y_val, y_test, classes = prepare_splits(args.train, args.seed)
+    num_classes = len(classes)
+
+    teacher = tf.keras.models.load_model(args.teacher)
+    print("🧑‍🏫 Scoring teacher soft targets …")
+    teacher_fit = teacher.predict(X_fit, batch_size=2048, verbose=0)
+    teacher_val = teacher.predict(X_val, batch_size=2048, verbose=0)
+
+    def targets(teacher_probs, y):
+        return np.concatenate([soften(teacher_probs, args.temperature),
+                               np.eye(num_classes, dtype=np.float32)[y]], axis=1)
+
+    student = build_student(num_classes, tuple(args.hidden), args.dropout)
+    student.compile(optimizer=tf.keras.optimizers.Adam(args.lr),
+                    loss=distillation_loss(num_classes, args.temperature, args.alpha))
+    student.fit(
+        normalize_landmarks(X_fit), targets(teacher_fit, y_fit),
+        validation_data=(normalize_landmarks(X_val), targets(teacher_val, y_val)),
+        epochs=args.epochs, batch_size=args.batch, shuffle=True, verbose=2,
+        callbacks=[tf.keras.callbacks.EarlyStopping(
+            monitor="val_loss", patience=args.patience, restore_best_weights=True)],
+    )
+
+    export_student(student, classes, args.out)
+    print(f"💾 Saved student to {args.out}")
+
+    # Evaluate the exported NumPy student exactly as the live loops run it
+    numpy_student = StudentClassifier(args.out)
+    y_pred = numpy_student.predict_proba(X_test).argmax(axis=1)
+    y_teacher = teacher.predict(X_test, batch_size=2048, verbose=0).argmax(axis=1)
+    student_acc = float((y_pred == y_test).mean())
+    teacher_acc = float((y_teacher == y_test).mean())
+
+    report_dict = classification_report(
+        y_test, y_pred, target_names=classes, output_dict=True, digits=3
+    )
+    with open("metrics/student_classification_report.json", "w") as f:
+        json.dump(report_dict, f, indent=4)
+    plot_metrics(report_dict, classes, "metrics/student_precision_recall_bar_chart.png")
+    plot_confusion_matrix(confusion_matrix(y_test, y_pred), classes,
+                          "metrics/student_confusion_matrix.png")
+
+    student_us = single_sample_latency_us(numpy_student.predict_proba, X_test[0])
+    teacher_us = single_sample_latency_us(lambda x: teacher(x, training=False).numpy(), X_test[0])
+    bench = {
+        "teacher_acc": teacher_acc,
+        "student_acc": student_acc,
+        "accuracy_loss": teacher_acc - student_acc,
+        "student_params": int(student.count_params()),
+        "teacher_params": int(teacher.count_params()),
+        "student_latency_p50_us": student_us[0],
+        "student_latency_p95_us": student_us[1],
+        "teacher_latency_p50_us": teacher_us[0],
+        "teacher_latency_p95_us": teacher_us[1],
+        "config": {"hidden": args.hidden, "temperature": args.temperature, "alpha": args.alpha},
+    }
+    with open("metrics/student_benchmark.json", "w") as f:
+        json.dump(bench, f, indent=4)
+
+    print(f"\n🎯 Teacher acc {teacher_acc:.4f} | Student acc {student_acc:.4f} "
+          f"(loss {bench['accuracy_loss']:.4f})")
+    print(f"⚡ Student {student_us[0]:.1f} µs/sample vs teacher {teacher_us[0]:.1f} µs (CPU, p50)")
+    if bench["accuracy_loss"] > args.max_acc_loss:
+        print(f"⚠️ Accuracy loss above --max_acc_loss {args.max_acc_loss}")
+    if student_us[0] > 100:
+        print("⚠️ Student p50 latency above the 100 µs budget")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--train", required=True, help="Path to .npz landmark file")
+    parser.add_argument("--teacher", default="models/landmark_cnn.h5")
+    parser.add_argument("--out", default="models/landmark_student.npz")
+    parser.add_argument("--hidden", type=int, nargs="+", default=[64])
+    parser.add_argument("--dropout", type=float, default=0.1)
+    parser.add_argument("--temperature", type=float, default=4.0)
+    parser.add_argument("--alpha", type=float, default=0.7,
+                        help="Weight of the soft-target loss vs hard labels")
+    parser.add_argument("--epochs", type=int, default=60)
+    parser.add_argument("--batch", type=int, default=256)
+    parser.add_argument("--lr", type=float, default=2e-3)
+    parser.add_argument("--patience", type=int, default=8)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--threads", type=int, default=0)
+    parser.add_argument("--max_acc_loss", type=float, default=0.01)
+    main(parser.parse_args())
@@ -0,0 +1,195 @@
+"""
+Architecture / hyperparameter sweep for the landmark classifier
+---------------------------------------------------------------
+Trains candidate models in parallel CPU worker processes and records, for
+each one, test accuracy, parameter count and measured single-sample
+latency (a direct model call, as the live loops make it). Then prints the
+Pareto front of accuracy vs latency and the fastest model that meets
+--min_acc.
+
+Usage (from Sign2Voice/ root):
+
+    python -m models.landmark_sweep \
+        --train data/landmarks_train.npz \
+        --workers 4 --epochs 15 --min_acc 0.985
+
+Saves:
+    metrics/sweep_results.json    (every trial + the Pareto front)
+"""
+
+import argparse, json, os, time
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+
+# name → (builder, kwargs). Builders are looked up inside the worker so
+# only picklable names cross the process boundary.
+CANDIDATES = {
+    "cnn_64_128_d256":   ("cnn", dict(conv=(64, 128), dense=256)),   # current model
+    "cnn_32_64_d128":    ("cnn", dict(conv=(32, 64), dense=128)),
+    "cnn_16_32_d64":     ("cnn", dict(conv=(16, 32), dense=64)),
+    "cnn_16_d64":        ("cnn", dict(conv=(16,), dense=64)),
+    "sepconv_32_64_d64": ("depthwise", dict(conv=(32, 64), dense=64)),
+    "sepconv_16_32_d32": ("depthwise", dict(conv=(16, 32), dense=32)),
+    "mlp_256_128":       ("mlp", dict(hidden=(256, 128))),
+    "mlp_128_64":        ("mlp", dict(hidden=(128, 64))),
+    "mlp_64":            ("mlp", dict(hidden=(64,))),
+    "mlp_32":            ("mlp", dict(hidden=(32,))),
+}
+
+
+def build_candidate(kind, num_classes, **kw):
+    from tensorflow.keras import layers, models
+    from models.landmark_cnn import build_model
+
+    if kind == "cnn":
+        return build_model(num_classes, **kw)
+
+    if kind == "depthwise":
+        stack = [layers.Reshape((21, 3), input_shape=(63,))]
+        for f in kw["conv"]:
+            stack.append(layers.SeparableConv1D(f, 3, activation="relu"))
+        stack += [layers.GlobalAveragePooling1D(),
+                  layers.Dense(kw["dense"], activation="relu"),
+                  layers.Dropout(kw.get("dropout", 0.2))]
+    elif kind == "mlp":
+        stack = [layers.InputLayer(input_shape=(63,))]
+        for units in kw["hidden"]:
+            stack += [layers.Dense(units, activation="relu"),
+                      layers.Dropout(kw.get("dropout", 0.2))]
+    else:
+        raise ValueError(f"Unknown candidate kind {kind!r}")
+
+    model = models.Sequential(stack + [layers.Dense(num_classes, activation="softmax", dtype="float32")])
+    model.compile(optimizer="adam",
+                  loss="sparse_categorical_crossentropy",
+                  metrics=["accuracy"])
+    return model
+
+
+def measure_latency(model, sample, repeat=300, warmup=20):
+    """Median and p95 wall time (µs) of one single-sample forward pass."""
+    import numpy as np
+    x = sample[None, :]
+    for _ in range(warmup):
+        model(x, training=False)
+    times = np.empty(repeat)
+    for i in range(repeat):
+        t0 = time.perf_counter()
+        model(x, training=False).numpy()
+        times[i] = (time.perf_counter() - t0) * 1e6
+    return float(np.median(times)), float(np.percentile(times, 95))
+
+
+def run_trial(name, train_path, epochs, batch, seed, threads, patience):
+    """Runs in a worker process: train, evaluate and time one candidate."""
+    from models.landmark_cnn import configure_runtime, make_dataset, prepare_splits
+    import tensorflow as tf
+
+    configure_runtime(seed, threads)
+    X_fit, X_val, X_test, y_fit, y_val, y_test, classes = prepare_splits(
+        train_path, seed, verbose=False)
+
+    kind, kw = CANDIDATES[name]
+    model = build_candidate(kind, len(classes), **kw)
+
+    t0 = time.perf_counter()
+    history = model.fit(
+        make_dataset(X_fit, y_fit, batch, shuffle=True, seed=seed, threads=threads),
+        validation_data=make_dataset(X_val, y_val, batch, threads=threads),
+        epochs=epochs,
+        callbacks=[tf.keras.callbacks.EarlyStopping(
+            monitor="val_loss", patience=patience, restore_best_weights=True)],
+        verbose=0,
+    )
+    train_s = time.perf_counter() - t0
+
+    _, test_acc = model.evaluate(make_dataset(X_test, y_test, 1024), verbose=0)
+    p50_us, p95_us = measure_latency(model, X_test[0])
+    return {
+        "name": name,
+        "kind": kind,
+        "config": {k: list(v) if isinstance(v, tuple) else v for k, v in kw.items()},
+        "test_acc": float(test_acc),
+        "params": int(model.count_params()),
+        "latency_p50_us": p50_us,
+        "latency_p95_us": p95_us,
+        "epochs_run": len(history.history["loss"]),
+        "train_s": train_s,
+    }
+
+
+def pareto_front(results):
+    """Trials not dominated on (higher accuracy, lower latency), fastest first."""
+    front = []
+    for r in results:
+        dominated = any(
+            o["test_acc"] >= r["test_acc"] and o["latency_p50_us"] <= r["latency_p50_us"]
+            and (o["test_acc"] > r["test_acc"] or o["latency_p50_us"] < r["latency_p50_us"])
+            for o in results)
+        if not dominated:
+            front.append(r)
+    return sorted(front, key=lambda r: r["latency_p50_us"])
+
+
+def main(args):
+    names = args.candidates or list(CANDIDATES)
+    unknown = set(names) - set(CANDIDATES)
+    if unknown:
+        raise SystemExit(f"Unknown candidates: {sorted(unknown)}")
+
+    # Split the cores between workers so trials don't fight over threads
+    threads = args.threads or max(1, (os.cpu_count() or 1) // args.workers)
+    print(f"🔬 {len(names)} candidates | {args.workers} workers × {threads} threads")
+
+    results = []
+    ctx = mp.get_context("spawn")   # fresh TF runtime per worker
+    with ProcessPoolExecutor(max_workers=args.workers, mp_context=ctx) as pool:
+        futures = {pool.submit(run_trial, n, args.train, args.epochs, args.batch,
+                               args.seed, threads, args.patience): n for n in names}
+        for fut in as_completed(futures):
+            try:
+                r = fut.result()
+            except Exception as e:
+                print(f"❌ {futures[fut]} failed: {e}")
+                continue
+            results.append(r)
+            print(f"  ✓ {r['name']:<20} acc={r['test_acc']:.4f} params={r['params']:>8,} "
+                  f"latency={r['latency_p50_us']:.0f}µs")
+
+    front = pareto_front(results)
+    print("\n🏁 Pareto front (fastest first):")
+    for r in front:
+        print(f"  {r['name']:<20} acc={r['test_acc']:.4f} latency={r['latency_p50_us']:.0f}µs "
+              f"params={r['params']:,}")
+
+    eligible = [r for r in front if r["test_acc"] >= args.min_acc]
+    pick = eligible[0] if eligible else None
+    if pick:
+        print(f"\n✅ Fastest model with acc ≥ {args.min_acc}: {pick['name']}")
+    else:
+        print(f"\n⚠️ No candidate reached acc ≥ {args.min_acc}")
+
+    os.makedirs("metrics", exist_ok=True)
+    with open(args.out, "w") as f:
+        json.dump({"min_acc": args.min_acc, "pick": pick and pick["name"],
+                   "pareto_front": [r["name"] for r in front],
+                   "trials": sorted(results, key=lambda r: r["latency_p50_us"])}, f, indent=4)
+    print(f"💾 Saved {args.out}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--train", required=True, help="Path to .npz landmark file")
+    parser.add_argument("--candidates", nargs="+", help=f"Subset of: {', '.join(CANDIDATES)}")
+    parser.add_argument("--workers", type=int, default=max(1, (os.cpu_count() or 2) // 2))
+    parser.add_argument("--threads", type=int, default=0,
+                        help="TF threads per worker (0 = cores / workers)")
+    parser.add_argument("--epochs", type=int, default=15)
+    parser.add_argument("--batch", type=int, default=128)
+    parser.add_argument("--patience", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--min_acc", type=float, default=0.985,
+                        help="Accuracy bar for picking the fastest model")
+    parser.add_argument("--out", default="metrics/sweep_results.json")
+    main(parser.parse_args())
@@ -0,0 +1,162 @@
+"""
+Temporal model for dynamic signs (J, Z, …) over landmark sequences
+------------------------------------------------------------------
+A small causal TCN: Dense-ReLU per frame, then Conv1D layers with kernel
+size k and dilations 1, 2, 4, … (padding="causal"), read out at the last
+time step. The receptive field 1 + (k - 1) * sum(dilations) equals the
+window length, so app.temporal.TemporalClassifier can run it one frame at
+a time with ring buffers instead of recomputing the window.
+
+Usage (from Sign2Voice/ root, after utils/extract_sequences.py):
+
+    python -m models.temporal_model --train data/sequences.npz --epochs 40
+
+Windows are split by source clip (video_id) so overlapping windows of one
+clip never land on both sides of the split.
+
+Saves:
+    models/temporal_model.h5
+    models/temporal_model.npz                      (NumPy weights + class list)
+    metrics/temporal_classification_report.json
+    metrics/temporal_benchmark.json                (accuracy + per-frame streaming cost)
+"""
+
+import argparse, json, os, time
+import numpy as np
+import tensorflow as tf
+from tensorflow.keras import layers, models
+
+from app.temporal import NUM_FEATURES, TemporalClassifier
+from models.evaluate import classification_report_dict, confusion
+from models.landmark_cnn import configure_runtime
+
+
+def receptive_field(kernel, dilations):
+    return 1 + (kernel - 1) * sum(dilations)
+
+
+def build_model(num_classes, window, width=48, kernel=3, dilations=(1, 2, 4, 8), dropout=0.1):
+    inputs = layers.Input(shape=(window, NUM_FEATURES))
+    h = layers.Dense(width, activation="relu", name="frame_dense")(inputs)
+    for i, d in enumerate(dilations):
+        h = layers.Conv1D(width, kernel, dilation_rate=d, padding="causal",
+                          activation="relu", name=f"tcn_{i}")(h)
+        h = layers.Dropout(dropout)(h)
+    h = layers.Lambda(lambda t: t[:, -1], name="last_step")(h)
+    outputs = layers.Dense(num_classes, activation="softmax", name="head")(h)
+    model = models.Model(inputs, outputs)
+    model.compile(optimizer="adam", loss="sparse_categorical_crossentropy", metrics=["accuracy"])
+    return model
+
+
+def export_numpy(model, classes, dilations, path):
+    """Weights in the layout app.temporal.TemporalClassifier reads."""
+    W_in, b_in = model.get_layer("frame_dense").get_weights()
+    W_out, b_out = model.get_layer("head").get_weights()
+    arrays = {"classes": np.array(classes), "dilations": np.array(dilations, np.int32),
+              "W_in": W_in, "b_in": b_in, "W_out": W_out, "b_out": b_out}
+    for i in range(len(dilations)):
+        K, c = model.get_layer(f"tcn_{i}").get_weights()        # K: (k, in, out)
+        arrays[f"K{i}"], arrays[f"c{i}"] = K, c
+    np.savez(path, **{k: v.astype(np.float32) if v.dtype.kind == "f" else v
+                      for k, v in arrays.items()})
+
+
+def split_by_video(video_id, y, test_size, seed):
+    """Hold out whole clips, picked per class so every class appears in both splits."""
+    rng = np.random.default_rng(seed)
+    test_videos = []
+    for c in np.unique(y):
+        vids = np.unique(video_id[y == c])
+        n = max(1, int(round(len(vids) * test_size))) if len(vids) > 1 else 0
+        test_videos.extend(rng.choice(vids, size=n, replace=False))
+    test = np.isin(video_id, test_videos)
+    return np.flatnonzero(~test), np.flatnonzero(test)
+
+
+def streaming_cost_us(clf, window, repeat=2000):
+    """µs per frame of TemporalClassifier.step on a random landmark stream."""
+    stream = np.random.default_rng(0).random((window + repeat, 63), dtype=np.float32)
+    for lm in stream[:window]:
+        clf.step(lm)
+    times = np.empty(repeat)
+    for i, lm in enumerate(stream[window:]):
+        t0 = time.perf_counter()
+        clf.step(lm)
+        times[i] = (time.perf_counter() - t0) * 1e6
+    return float(np.median(times)), float(np.percentile(times, 95))
+
+
+def main(args):
+    configure_runtime(args.seed, args.threads)
+    os.makedirs("models", exist_ok=True)
+    os.makedirs("metrics", exist_ok=True)
+
+    data = np.load(args.train, allow_pickle=False)
+    X, y, classes, video_id = data["X"], data["y"], [str(c) for c in data["classes"]], data["video_id"]
+    window = receptive_field(args.kernel, args.dilations)
+    if X.shape[1] != window:
+        raise SystemExit(f"Windows are {X.shape[1]} frames but kernel {args.kernel} / dilations "
+                         f"{args.dilations} need {window}; re-extract with --window {window}")
+
+    train_idx, test_idx = split_by_video(video_id, y, 0.2, args.seed)
+    fit_idx, val_idx = split_by_video(video_id[train_idx], y[train_idx], 0.1, args.seed + 1)
+    fit_idx, val_idx = train_idx[fit_idx], train_idx[val_idx]
+    print(f"✅ {len(classes)} classes | {len(np.unique(video_id))} clips | window {window}")
+    print(f"📦 Train: {len(fit_idx)} | Val: {len(val_idx)} | Test: {len(test_idx)} windows")
+
+    model = build_model(len(classes), window, args.width, args.kernel, tuple(args.dilations),
+                        args.dropout)
+    model.fit(
+        X[fit_idx], y[fit_idx], validation_data=(X[val_idx], y[val_idx]),
+        epochs=args.epochs, batch_size=args.batch, shuffle=True, verbose=2,
+        callbacks=[tf.keras.callbacks.EarlyStopping(
+            monitor="val_loss", patience=args.patience, restore_best_weights=True)],
+    )
+    model.save("models/temporal_model.h5")
+    export_numpy(model, classes, args.dilations, args.out)
+    print(f"💾 Saved models/temporal_model.h5 and {args.out}")
+
+    # Score the exported NumPy weights, as the live loop would run them
+    clf = TemporalClassifier(args.out)
+    probs = clf.predict_window(X[test_idx])
+    keras_probs = model.predict(X[test_idx], batch_size=1024, verbose=0)
+    y_pred = probs.argmax(axis=1)
+    cm = confusion(y[test_idx], y_pred, len(classes))
+    report_dict = classification_report_dict(cm, classes)
+    with open("metrics/temporal_classification_report.json", "w") as f:
+        json.dump(report_dict, f, indent=4)
+
+    p50, p95 = streaming_cost_us(clf, window)
+    bench = {
+        "accuracy": report_dict["accuracy"],
+        "numpy_vs_keras_max_abs_diff": float(np.abs(probs - keras_probs).max()),
+        "window": window,
+        "params": int(model.count_params()),
+        "step_latency_p50_us": p50,
+        "step_latency_p95_us": p95,
+        "config": {"width": args.width, "kernel": args.kernel, "dilations": args.dilations},
+    }
+    with open("metrics/temporal_benchmark.json", "w") as f:
+        json.dump(bench, f, indent=4)
+
+    print(f"\n🎯 Test accuracy (held-out clips): {bench['accuracy']:.4f}")
+    print(f"⚡ Streaming step {p50:.1f} µs/frame p50, {p95:.1f} µs p95")
+    if bench["numpy_vs_keras_max_abs_diff"] > 1e-4:
+        print("⚠️ NumPy export disagrees with Keras - check the layer layout")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--train", required=True, help="Path to .npz from utils.extract_sequences")
+    parser.add_argument("--out", default="models/temporal_model.npz")
+    parser.add_argument("--width", type=int, default=48)
+    parser.add_argument("--kernel", type=int, default=3)
+    parser.add_argument("--dilations", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--dropout", type=float, default=0.1)
+    parser.add_argument("--epochs", type=int, default=40)
+    parser.add_argument("--batch", type=int, default=128)
+    parser.add_argument("--patience", type=int, default=6)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--threads", type=int, default=0)
+    main(parser.parse_args())
@@ -12,10 +12,9 @@ Example run:
 import os
 import cv2
 import numpy as np
-import mediapipe as mp
 from tqdm import tqdm
 
-mp_hands = mp.solutions.hands
+from app.camera import HandDetector
 
 
 def extract_landmarks_from_image(image, hands_detector):
@@ -26,20 +25,19 @@ def extract_landmarks_from_image(image, hands_detector):
     # OPTIONAL: uncomment if mirroring helps detection
     # image = cv2.flip(image, 1)
 
-    img_rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-    results = hands_detector.process(img_rgb)
-    if not results.multi_hand_landmarks:
+    _, found = hands_detector.detect_hands(image, draw=False)
+    if not len(found):
         return None
 
-    hand = results.multi_hand_landmarks[0]
-    return [c for lm in hand.landmark for c in (lm.x, lm.y, lm.z)]  # 63 values
+    return found.vectors()[0].copy()  # 63 values; copy out of the reused buffer
 
 
 def process_dataset(dataset_path: str, output_path: str):
-    hands = mp_hands.Hands(
+    hands = HandDetector(
         static_image_mode=False,          # run detector on each image
-        max_num_hands=1,
-        min_detection_confidence=0.20,    # more lenient than default 0.5
+        max_hands=1,
+        detection_confidence=0.20,        # more lenient than default 0.5
+        tracking_confidence=0.5,
     )
 
     classes = sorted(
@@ -0,0 +1,114 @@
+# utils/extract_sequences.py
+"""
+Extracts per-frame MediaPipe-Hand landmarks from sign videos and cuts them
+into fixed-length windows for the temporal model (models/temporal_model.py).
+
+Expected layout: one folder per sign, any number of clips in each
+    videos/J/clip_001.mp4, videos/Z/…, videos/A/…
+
+Frames where the hand was lost are held from the last detection
+(app.temporal.forward_fill, as TemporalClassifier.step does live); windows
+with more than --max_missing of them are dropped. Saved .npz:
+
+    X         (N, window, 66) float32 - app.temporal.frame_features
+    y         (N,) int32
+    classes   sign names
+    video_id  (N,) int32 - source clip, so train / test can be split by clip
+
+Example run:
+    python -m utils.extract_sequences --videos data/raw/sign_videos \
+        --output data/sequences.npz --window 31 --stride 4
+"""
+
+import os
+import argparse
+import cv2
+import numpy as np
+from tqdm import tqdm
+
+from app.camera import HandDetector
+from app.temporal import NUM_FEATURES, forward_fill, frame_features
+
+VIDEO_EXTS = (".mp4", ".avi", ".mov", ".mkv", ".webm")
+
+
+def video_landmarks(path, hands_detector):
+    """(T, 63) landmarks of the first hand in every frame and a (T,) found mask."""
+    cap = cv2.VideoCapture(path)
+    vectors, present = [], []
+    while True:
+        ok, frame = cap.read()
+        if not ok:
+            break
+        _, found = hands_detector.detect_hands(frame, draw=False)
+        if len(found):
+            vectors.append(found.vectors()[0].copy())
+            present.append(True)
+        else:
+            vectors.append(np.zeros(63, np.float32))
+            present.append(False)
+    cap.release()
+    return np.array(vectors, np.float32).reshape(-1, 63), np.array(present, bool)
+
+
+def cut_windows(features, present, window, stride, max_missing):
+    """Every window of `window` frames at `stride`, skipping those with too many lost frames."""
+    out = []
+    for start in range(0, len(features) - window + 1, stride):
+        if (~present[start:start + window]).mean() <= max_missing:
+            out.append(features[start:start + window])
+    return out
+
+
+def process_videos(videos_path, output_path, window=31, stride=4, max_missing=0.3):
+    hands = HandDetector(
+        static_image_mode=False,          # video: let MediaPipe track between frames
+        max_hands=1,
+        detection_confidence=0.3,
+        tracking_confidence=0.5,
+    )
+    classes = sorted(
+        d for d in os.listdir(videos_path)
+        if os.path.isdir(os.path.join(videos_path, d))
+    )
+    print(f"Classes ({len(classes)}): {classes}")
+
+    X, y, video_id = [], [], []
+    n_videos = 0
+    for label, class_name in enumerate(classes):
+        class_dir = os.path.join(videos_path, class_name)
+        clips = sorted(f for f in os.listdir(class_dir) if f.lower().endswith(VIDEO_EXTS))
+        print(f"\n▶ {class_name}: {len(clips)} clips")
+        kept_here = 0
+        for clip in tqdm(clips, mininterval=0.1, leave=False):
+            landmarks, present = video_landmarks(os.path.join(class_dir, clip), hands)
+            if not present.any():
+                continue
+            features = frame_features(forward_fill(landmarks, present))
+            windows = cut_windows(features, present, window, stride, max_missing)
+            X.extend(windows)
+            y.extend([label] * len(windows))
+            video_id.extend([n_videos] * len(windows))
+            kept_here += len(windows)
+            n_videos += 1
+        print(f"   ✓ {kept_here} windows")
+
+    X = np.array(X, dtype=np.float32).reshape(-1, window, NUM_FEATURES)
+    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+    np.savez_compressed(output_path, X=X, y=np.array(y, np.int32), classes=classes,
+                        video_id=np.array(video_id, np.int32))
+    print(f"\nSaved {len(X)} windows from {n_videos} clips → {output_path}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Sign-video landmark window extractor")
+    parser.add_argument("--videos", required=True, help="Folder of per-sign video folders")
+    parser.add_argument("--output", default="data/sequences.npz")
+    parser.add_argument("--window", type=int, default=31,
+                        help="Frames per window; must equal the model's receptive field")
+    parser.add_argument("--stride", type=int, default=4)
+    parser.add_argument("--max_missing", type=float, default=0.3,
+                        help="Drop windows where more than this share of frames lost the hand")
+    args = parser.parse_args()
+
+    process_videos(args.videos, args.output, args.window, args.stride, args.max_missing)
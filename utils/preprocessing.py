@@ -11,13 +11,127 @@ Example:
         test_size=0.2,
         limit_per_class=1000
     )
+
+With `cache_dir`, every image is decoded and resized once (in a process
+pool) into a uint8 store under <cache_dir>/<dataset>_<W>x<H>/:
+
+    images.npy     (N, H, W, 3) uint8, opened memory-mapped
+    labels.npy     (N,) int32
+    valid.npy      (N,) bool - False for unreadable files
+    manifest.json  img_size, label_map and (path, size, mtime) of every source
+
+The store is rebuilt automatically when any source file is added, removed
+or modified. Build it ahead of time with:
+
+    python -m utils.preprocessing --dataset data/raw/asl_alphabet_train --img_size 64
 """
 
 import os
+import json
+import hashlib
+import argparse
+from concurrent.futures import ProcessPoolExecutor
 import cv2
 import numpy as np
 from sklearn.model_selection import train_test_split
 
+IMAGE_EXTS = (".jpg", ".jpeg", ".png")
+
+
+def list_dataset(dataset_path: str):
+    """Sorted class folders and [(relative path, size, mtime_ns, label)] of every image."""
+    labels = sorted(
+        d for d in os.listdir(dataset_path)
+        if os.path.isdir(os.path.join(dataset_path, d))
+    )
+    files = []
+    for idx, label in enumerate(labels):
+        with os.scandir(os.path.join(dataset_path, label)) as it:
+            entries = sorted((e for e in it if e.name.lower().endswith(IMAGE_EXTS)),
+                             key=lambda e: e.name)
+            for e in entries:
+                st = e.stat()
+                files.append((f"{label}/{e.name}", st.st_size, st.st_mtime_ns, idx))
+    return labels, files
+
+
+def _fingerprint(img_size, files):
+    h = hashlib.sha1(repr(tuple(img_size)).encode())
+    for rel, size, mtime, _ in files:
+        h.update(f"{rel}\0{size}\0{mtime}\n".encode())
+    return h.hexdigest()
+
+
+def _resize_chunk(dataset_path, store_path, img_size, start, rel_paths):
+    """Worker: decode + resize rel_paths into rows start.. of the store; returns ok flags."""
+    images = np.load(store_path, mmap_mode="r+")
+    ok = []
+    for i, rel in enumerate(rel_paths):
+        img = cv2.imread(os.path.join(dataset_path, rel))
+        if img is None:
+            ok.append(False)
+            continue
+        images[start + i] = cv2.resize(img, img_size)
+        ok.append(True)
+    images.flush()
+    return start, ok
+
+
+def build_cache(dataset_path: str, img_size=(64, 64), cache_dir="data/cache",
+                workers: int = 0, chunk: int = 512, verbose: bool = True):
+    """
+    Open (building or rebuilding if stale) the resized uint8 store for dataset_path.
+
+    Returns:
+        images (memmap), labels, valid, label_map
+    """
+    img_size = tuple(int(v) for v in img_size)
+    name = os.path.basename(os.path.normpath(dataset_path))
+    store = os.path.join(cache_dir, f"{name}_{img_size[0]}x{img_size[1]}")
+    paths = {k: os.path.join(store, f"{k}.npy") for k in ("images", "labels", "valid")}
+    manifest_path = os.path.join(store, "manifest.json")
+
+    labels, files = list_dataset(dataset_path)
+    fingerprint = _fingerprint(img_size, files)
+    label_map = {label: idx for idx, label in enumerate(labels)}
+
+    manifest = None
+    if os.path.exists(manifest_path):
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+    if not (manifest and manifest.get("fingerprint") == fingerprint
+            and all(os.path.exists(p) for p in paths.values())):
+        if verbose:
+            reason = "sources changed" if manifest else "no cache yet"
+            print(f"🗜️ Building {store} ({len(files)} images, {reason}) …")
+        os.makedirs(store, exist_ok=True)
+        if os.path.exists(manifest_path):
+            os.remove(manifest_path)            # a half-built store is never trusted
+
+        w, h = img_size
+        # only creates the full-size .npy; the workers open it themselves
+        np.lib.format.open_memmap(paths["images"], mode="w+", dtype=np.uint8,
+                                  shape=(len(files), h, w, 3))
+        valid = np.zeros(len(files), dtype=bool)
+        rel_paths = [f[0] for f in files]
+        with ProcessPoolExecutor(max_workers=workers or None) as pool:
+            futures = [pool.submit(_resize_chunk, dataset_path, paths["images"], img_size,
+                                   s, rel_paths[s:s + chunk])
+                       for s in range(0, len(files), chunk)]
+            for fut in futures:
+                start, ok = fut.result()
+                valid[start:start + len(ok)] = ok
+        np.save(paths["labels"], np.array([f[3] for f in files], dtype=np.int32))
+        np.save(paths["valid"], valid)
+        with open(manifest_path, "w") as f:
+            json.dump({"img_size": img_size, "label_map": label_map, "fingerprint": fingerprint,
+                       "files": [f[:3] for f in files]}, f)
+        if verbose:
+            print(f"✅ Cached {int(valid.sum())} images ({int((~valid).sum())} unreadable)")
+
+    return (np.load(paths["images"], mmap_mode="r"), np.load(paths["labels"]),
+            np.load(paths["valid"]), label_map)
+
 
 def load_asl_dataset(
     dataset_path: str,
@@ -26,6 +140,9 @@ def load_asl_dataset(
     limit_per_class: int = 0,
     shuffle: bool = True,
     seed: int = 42,
+    cache_dir: str = None,
+    normalize: bool = True,
+    workers: int = 0,
 ):
     """
     Load images from the ASL Alphabet directory structure.
@@ -38,10 +155,18 @@ def load_asl_dataset(
                                (0 = load everything).
         shuffle (bool): Whether to shuffle after loading.
         seed (int): RNG seed for reproducibility.
+        cache_dir (str): Use / build the resized uint8 store here (None = no cache).
+        normalize (bool): float32 in [0, 1] if True, else the raw uint8 pixels.
+        workers (int): Processes for building the cache (0 = all cores).
 
     Returns:
         X_train, X_test, y_train, y_test, label_map
     """
+    if cache_dir:
+        images, labels, valid, label_map = build_cache(dataset_path, img_size, cache_dir, workers)
+        return _split_cached(images, labels, valid, label_map, test_size,
+                             limit_per_class, shuffle, seed, normalize)
+
     X, y = [], []
 
     # Sorted so label indices are stable
@@ -62,7 +187,7 @@ def load_asl_dataset(
         images = [
             f
             for f in os.listdir(class_dir)
-            if f.lower().endswith((".jpg", ".jpeg", ".png"))
+            if f.lower().endswith(IMAGE_EXTS)
         ]
 
         # Sub-sample to speed up training if requested
@@ -82,7 +207,9 @@ def load_asl_dataset(
             y.append(label_map[label])
 
     # Convert to NumPy and scale to 0-1
-    X = np.array(X, dtype=np.float32) / 255.0
+    X = np.array(X, dtype=np.uint8)
+    if normalize:
+        X = X.astype(np.float32) / 255.0
     y = np.array(y, dtype=np.int32)
 
     if shuffle:
@@ -95,3 +222,45 @@ def load_asl_dataset(
     )
 
     return X_train, X_test, y_train, y_test, label_map
+
+
+def _split_cached(images, labels, valid, label_map, test_size, limit_per_class,
+                  shuffle, seed, normalize):
+    """Sub-sample, split and gather rows of the cached store (only the chosen rows are read)."""
+    rng = np.random.default_rng(seed)
+    idx = np.flatnonzero(valid)
+    if limit_per_class > 0:
+        keep = []
+        for c in np.unique(labels[idx]):
+            rows = idx[labels[idx] == c]
+            if len(rows) > limit_per_class:
+                rows = rng.choice(rows, size=limit_per_class, replace=False)
+            keep.append(rows)
+        idx = np.concatenate(keep)
+    if shuffle:
+        idx = rng.permutation(idx)
+
+    idx_train, idx_test = train_test_split(
+        idx, test_size=test_size, random_state=seed, stratify=labels[idx]
+    )
+
+    def gather(rows):
+        X = images[np.sort(rows)]               # sorted rows read the memmap sequentially
+        order = np.argsort(np.argsort(rows))
+        X = X[order]
+        return X.astype(np.float32) / 255.0 if normalize else X
+
+    return (gather(idx_train), gather(idx_test),
+            labels[idx_train], labels[idx_test], label_map)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build the resized image cache")
+    parser.add_argument("--dataset", required=True)
+    parser.add_argument("--img_size", type=int, default=64)
+    parser.add_argument("--cache_dir", default="data/cache")
+    parser.add_argument("--workers", type=int, default=0, help="0 = all cores")
+    args = parser.parse_args()
+    images, labels, valid, label_map = build_cache(
+        args.dataset, (args.img_size, args.img_size), args.cache_dir, args.workers)
+    print(f"📦 {images.shape} uint8 store, {len(label_map)} classes, {int(valid.sum())} usable")